@@ -0,0 +1,420 @@
+from collections import namedtuple
+from dataclasses import dataclass, replace
+
+import numpy as np
+import pandas as pd
+
+from diagnostics import timed
+from processing import EXPECTED_EVALUATIONS, EXPORT_SCORE_DECIMALS
+from scoring import SCORING_SCHEMA
+
+NO_COMMENT = '코멘트 없음'
+# 점수 분포 히스토그램의 구간 수
+HISTOGRAM_BINS = 10
+
+# 점수 컬럼 하나에서 후보자의 위치
+# - rank: 순위 (1부터, 같은 점수는 같은 순위), cohort_size: 전체 후보자 수
+# - percentile: 백분위 (점수가 더 낮은 후보자 비율 + 같은 점수 후보자 비율의 절반, 0~100)
+# - bin: 히스토그램에서 후보자가 속한 구간 번호 (0부터)
+Standing = namedtuple('Standing', ['rank', 'cohort_size', 'percentile', 'bin'])
+
+
+@dataclass(frozen=True)
+class CohortStats:
+    """
+    점수 컬럼별 후보자 평균 점수의 정렬 배열과 분포 히스토그램입니다. 데이터셋당 한 번 만듭니다.
+    후보자 한 명의 순위, 백분위, 히스토그램 구간은 정렬 배열과 구간 경계에서 이진 탐색(O(log n))으로 찾습니다.
+    """
+    sorted_scores: dict       # 점수 컬럼 -> 오름차순 정렬된 후보자 평균 점수 배열
+    bin_edges: dict           # 점수 컬럼 -> 히스토그램 구간 경계 배열 (구간 수 + 1)
+    bin_counts: dict          # 점수 컬럼 -> 구간별 후보자 수 배열
+
+    def standing(self, col, score):
+        values = self.sorted_scores[col]
+        below = int(np.searchsorted(values, score, side='left'))
+        at_or_below = int(np.searchsorted(values, score, side='right'))
+        n = len(values)
+        percentile = (below + (at_or_below - below) / 2) / n * 100 if n else 0.0
+        edges = self.bin_edges[col]
+        # 마지막 구간은 오른쪽 경계를 포함합니다.
+        bin_idx = min(max(int(np.searchsorted(edges, score, side='right')) - 1, 0), len(edges) - 2)
+        return Standing(n - at_or_below + 1, n, percentile, bin_idx)
+
+    def histogram(self, col):
+        """구간 라벨(index)별 후보자 수 Series"""
+        edges = self.bin_edges[col]
+        labels = [f"{low:.1f} ~ {high:.1f}" for low, high in zip(edges[:-1], edges[1:])]
+        return pd.Series(self.bin_counts[col], index=pd.Index(labels, name='구간'), name='후보자 수')
+
+
+def build_cohort_stats(scores: pd.DataFrame, bins=HISTOGRAM_BINS) -> CohortStats:
+    """후보자별 평균 점수표(index: 후보자)에서 점수 컬럼별 정렬 배열과 히스토그램을 만듭니다."""
+    sorted_scores, bin_edges, bin_counts = {}, {}, {}
+    for col in scores.columns:
+        values = np.sort(scores[col].to_numpy(dtype=np.float64))
+        edges = np.histogram_bin_edges(values, bins=bins)
+        sorted_scores[col] = values
+        bin_edges[col] = edges
+        bin_counts[col] = np.histogram(values, bins=edges)[0]
+    return CohortStats(sorted_scores, bin_edges, bin_counts)
+
+
+@dataclass(frozen=True)
+class CandidateIndex:
+    """
+    데이터셋당 한 번 groupby로 계산하는 후보자별 집계 구조입니다.
+    모든 리포트와 화면은 후보자마다 데이터프레임을 다시 필터링하지 않고 이 구조를 읽습니다.
+    """
+    score_cols: list          # 평균을 계산한 점수 컬럼 (카테고리 + 판정 점수 컬럼)
+    names: list               # 정렬된 후보자 이름
+    positions: dict           # 후보자 이름 -> 원본 데이터프레임의 행 위치(iloc) 배열
+    scores: pd.DataFrame      # 후보자별 평균 점수 (index: 후보자 이름)
+    final_results: pd.Series  # 후보자별 최종 결과 (채점 기준의 최종 판정 규칙)
+    evaluation_counts: pd.Series  # 후보자별 평가 횟수
+    reviewer_results: dict    # 후보자 이름 -> 심사위원별 'Reviewer_Result' 목록
+    comments: dict            # 후보자 이름 -> 심사위원별 '총평' 목록
+    overall_avg: pd.Series    # 전체 평균
+    passer_avg: pd.Series     # 합격자(Reviewer_Result == 'Pass' 행) 평균
+    cohort: CohortStats       # 점수 컬럼별 전체 후보자 분포 (순위, 백분위, 히스토그램)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.positions
+
+    def candidate_rows(self, all_df, name):
+        """원본 데이터프레임에서 후보자의 행만 위치 기반으로 꺼냅니다."""
+        return all_df.iloc[self.positions[name]]
+
+    def final_result(self, name):
+        return self.final_results[name]
+
+    def standings(self, name):
+        """점수 컬럼 순서대로 후보자의 Standing 목록을 반환합니다."""
+        scores = self.scores.loc[name]
+        return [self.cohort.standing(col, scores[col]) for col in self.score_cols]
+
+    def comparison(self, name):
+        """후보자 점수, 전체 평균, 합격자 평균, 전체 후보자 중 순위와 백분위 비교표를 반환합니다."""
+        standings = self.standings(name)
+        comparison_df = pd.concat([
+            self.scores.loc[name].rename("후보자 점수"),
+            self.overall_avg.rename("전체 평균"),
+            self.passer_avg.rename("합격자 평균"),
+        ], axis=1)
+        comparison_df["순위"] = [standing.rank for standing in standings]
+        comparison_df["백분위"] = [standing.percentile for standing in standings]
+        comparison_df.index.name = "Category"
+        return comparison_df
+
+    def subset(self, names):
+        """
+        주어진 후보자만 담은 집계 구조를 반환합니다. 전체/합격자 평균과 전체 후보자 분포는 그대로 유지합니다.
+        병렬 작업 프로세스에 필요한 후보자 데이터만 전달할 때 사용합니다.
+        """
+        names = list(names)
+        return replace(
+            self,
+            names=names,
+            positions={name: self.positions[name] for name in names},
+            scores=self.scores.loc[names],
+            final_results=self.final_results.loc[names],
+            evaluation_counts=self.evaluation_counts.loc[names],
+            reviewer_results={name: self.reviewer_results[name] for name in names},
+            comments={name: self.comments[name] for name in names},
+        )
+
+    def summary_frame(self):
+        """후보자별 최종 결과와 평균 점수 요약표를 반환합니다."""
+        summary_df = self.scores.reset_index(names='성명')
+        summary_df.insert(1, '최종 결과', self.final_results.to_numpy())
+        return summary_df
+
+
+@dataclass(frozen=True)
+class FileContribution:
+    """
+    파일 하나(전처리된 데이터프레임)가 후보자별 집계에 더하는 값입니다. 만든 뒤에는 바꾸지 않습니다.
+    후보자별 배열의 행은 names 순서이며, 점수 배열의 열은 만들 때 주어진 점수 컬럼 순서입니다. (파일에 없는 컬럼은 0)
+    """
+    n_rows: int
+    columns: frozenset        # 파일에 있는 컬럼
+    names: list               # 파일에 나오는 후보자 이름 (정렬 순서)
+    slots: dict               # 후보자 이름 -> 후보자별 배열의 행 번호
+    local_positions: dict     # 후보자 이름 -> 파일 안 행 위치(iloc) 배열
+    sums: np.ndarray          # 후보자별 점수 합계 (후보자 x 점수 컬럼)
+    counts: np.ndarray        # 후보자별 평가 횟수
+    pass_counts: np.ndarray   # 후보자별 Pass 심사위원 수
+    decision_sums: np.ndarray  # 후보자별 판정 점수 합계 (최종 판정 규칙 '평균'용)
+    total_sums: np.ndarray    # 점수 컬럼별 전체 행 합계
+    passer_sums: np.ndarray   # 점수 컬럼별 Pass 행 합계
+    passer_count: int
+    results: np.ndarray       # 행별 'Reviewer_Result'
+    comments: np.ndarray      # 행별 '총평' ('총평' 컬럼이 없으면 None)
+
+
+def file_contribution(df: pd.DataFrame, score_cols) -> FileContribution:
+    """전처리된 데이터프레임 하나에서 후보자별 점수 합계, 평가 횟수, 행 위치를 배열 연산으로 계산합니다."""
+    codes, uniques = pd.factorize(df['성명'], sort=True)
+    names = [str(name) for name in uniques]
+    n_names = len(names)
+    counts = np.bincount(codes, minlength=n_names)
+    order = np.argsort(codes, kind='stable')
+    local_positions = dict(zip(names, np.split(order, np.cumsum(counts)[:-1])))
+
+    # 점수는 float32로 저장되어 있으므로 합계는 float64로 계산합니다.
+    values = df.reindex(columns=score_cols, fill_value=0).to_numpy(dtype=np.float64)
+    sums = np.zeros((n_names, len(score_cols)))
+    for j in range(len(score_cols)):
+        sums[:, j] = np.bincount(codes, weights=values[:, j], minlength=n_names)
+
+    is_pass = (df['Reviewer_Result'] == 'Pass').to_numpy(dtype=bool)
+    # 판정 점수는 float32로 저장되어 있으므로 float64로 바꿀 때 반올림하여 표현 오차를 없앤 뒤 합산합니다.
+    decision_scores = SCORING_SCHEMA.decision_scores(df, decimals=EXPORT_SCORE_DECIMALS)
+    return FileContribution(
+        n_rows=len(df),
+        columns=frozenset(df.columns),
+        names=names,
+        slots={name: i for i, name in enumerate(names)},
+        local_positions=local_positions,
+        sums=sums,
+        counts=counts,
+        pass_counts=np.bincount(codes, weights=is_pass, minlength=n_names).astype(np.int64),
+        decision_sums=np.bincount(codes, weights=decision_scores, minlength=n_names),
+        total_sums=values.sum(axis=0),
+        passer_sums=values[is_pass].sum(axis=0),
+        passer_count=int(is_pass.sum()),
+        results=df['Reviewer_Result'].to_numpy(),
+        comments=df['총평'].fillna(NO_COMMENT).to_numpy() if '총평' in df.columns else None,
+    )
+
+
+# 후보자 한 명의 집계 상태 (후보자가 나오는 모든 파일의 기여분을 파일 순서대로 더한 값)
+_CandidateState = namedtuple(
+    '_CandidateState', ['sums', 'count', 'pass_count', 'decision_sum', 'positions', 'results', 'comments']
+)
+
+
+class CandidateAggregator:
+    """
+    파일별 기여분(FileContribution)을 더하고 빼면서 후보자별 집계 상태를 유지합니다.
+    build_candidate_index와 데이터셋(dataset.EvaluationDataset, dataset.build_snapshot)이 함께 쓰는 집계 경로입니다.
+    - 파일을 추가/교체/삭제하면 그 파일에 나오는 후보자의 상태만 다시 계산합니다.
+      (파일의 행 수가 바뀌어 뒤쪽 파일의 시작 행이 밀리면 그 파일 후보자의 행 위치도 다시 계산)
+    - 후보자의 합계는 후보자가 나오는 파일의 기여분을 파일 순서대로 다시 더하므로, 파일을 더하고 뺀 순서와 관계없이 같습니다.
+    - index()는 후보자별 상태를 모아 CandidateIndex를 만들고, 다음 변경 전까지 재사용합니다.
+    """
+
+    def __init__(self, score_cols, expected_evaluations=EXPECTED_EVALUATIONS):
+        self.score_cols = list(score_cols)
+        self.expected_evaluations = expected_evaluations
+        self._parts = {}              # 파일 키 -> FileContribution (파일 순서)
+        self._offsets = {}            # 파일 키 -> 통합 데이터프레임에서의 시작 행 위치
+        self._candidate_files = {}    # 후보자 이름 -> 후보자가 나오는 파일 키 목록 (파일 순서)
+        self._candidates = {}         # 후보자 이름 -> _CandidateState
+        self._invalid_counts = {}     # 평가 횟수가 expected_evaluations가 아닌 후보자 -> 평가 횟수
+        self._index = None
+
+    def __len__(self):
+        return len(self._candidates)
+
+    def part(self, key) -> FileContribution:
+        return self._parts[key]
+
+    def candidate_files(self, name):
+        """후보자가 나오는 파일 키 목록 (파일 순서)"""
+        return list(self._candidate_files.get(name, ()))
+
+    def update(self, put=(), remove=()):
+        """
+        파일 기여분을 삭제(remove: 파일 키 목록)하고 추가/교체(put: (파일 키, FileContribution) 목록)합니다.
+        새 파일은 맨 뒤에 추가하고, 같은 키의 파일은 제자리에서 교체합니다. 기여분이 바뀐 후보자 이름 집합을 반환합니다.
+        """
+        changed = set()
+        for key in remove:
+            contribution = self._parts.pop(key)
+            changed.update(contribution.names)
+            for name in contribution.names:
+                self._candidate_files[name].remove(key)
+
+        put = list(put)
+        file_order = None
+        for key, contribution in put:
+            previous = self._parts.get(key)
+            self._parts[key] = contribution
+            changed.update(contribution.names)
+            if previous is not None:
+                changed.update(previous.names)
+                for name in set(previous.names).difference(contribution.slots):
+                    self._candidate_files[name].remove(key)
+            if file_order is None or key not in file_order:
+                file_order = {file_key: i for i, file_key in enumerate(self._parts)}
+            for name in contribution.names:
+                files = self._candidate_files.setdefault(name, [])
+                if key in files:
+                    continue
+                files.append(key)
+                if len(files) > 1 and file_order[files[-2]] > file_order[key]:
+                    files.sort(key=file_order.get)
+
+        self._refresh(changed)
+        return changed
+
+    def _refresh(self, changed):
+        """파일별 시작 행을 다시 계산하고, 기여분이 바뀌었거나 시작 행이 밀린 파일에 나오는 후보자의 상태를 다시 만듭니다."""
+        affected = set(changed)
+        offsets = {}
+        offset = 0
+        for key, part in self._parts.items():
+            offsets[key] = offset
+            if self._offsets.get(key, offset) != offset:
+                affected.update(part.names)
+            offset += part.n_rows
+        self._offsets = offsets
+
+        for name in affected:
+            self._refresh_candidate(name)
+        self._index = None
+
+    def _refresh_candidate(self, name):
+        keys = self._candidate_files.get(name)
+        if not keys:
+            for state in (self._candidate_files, self._candidates, self._invalid_counts):
+                state.pop(name, None)
+            return
+
+        sums, count, pass_count, decision_sum = 0, 0, 0, 0.0
+        positions, results, comments = [], [], []
+        for key in keys:
+            part = self._parts[key]
+            slot = part.slots[name]
+            rows = part.local_positions[name]
+            sums = sums + part.sums[slot]
+            count += int(part.counts[slot])
+            pass_count += int(part.pass_counts[slot])
+            decision_sum += part.decision_sums[slot]
+            positions.append(rows + self._offsets[key])
+            results.extend(part.results[rows].tolist())
+            comments.extend(part.comments[rows].tolist() if part.comments is not None else [NO_COMMENT] * len(rows))
+        self._candidates[name] = _CandidateState(
+            sums, count, pass_count, decision_sum,
+            positions[0] if len(positions) == 1 else np.concatenate(positions), results, comments
+        )
+        if count != self.expected_evaluations:
+            self._invalid_counts[name] = count
+        else:
+            self._invalid_counts.pop(name, None)
+
+    def invalid_counts(self) -> pd.Series:
+        """평가 횟수가 expected_evaluations회가 아닌 후보자의 평가 횟수 (index: 후보자 이름, 정렬 순서)"""
+        names = sorted(self._invalid_counts)
+        return pd.Series(
+            [self._invalid_counts[name] for name in names], index=pd.Index(names, name='성명'), dtype=np.int64
+        )
+
+    def index(self) -> CandidateIndex:
+        if self._index is None:
+            self._index = self._build_index()
+        return self._index
+
+    def _build_index(self):
+        columns = set().union(*(part.columns for part in self._parts.values()))
+        col_mask = np.array([col in columns for col in self.score_cols], dtype=bool)
+        score_cols = [col for col, present in zip(self.score_cols, col_mask) if present]
+
+        names = sorted(self._candidates)
+        states = [self._candidates[name] for name in names]
+        name_index = pd.Index(names, name='성명')
+        counts = np.fromiter((state.count for state in states), dtype=np.int64, count=len(names))
+        sums = np.array([state.sums for state in states]).reshape(len(names), len(self.score_cols))
+        scores = pd.DataFrame(sums[:, col_mask] / counts[:, None], index=name_index, columns=score_cols)
+
+        # 최종 판정은 후보자별 Pass 심사위원 수와 판정 점수 합계로 채점 기준의 규칙(모두/과반수/평균)을 적용합니다.
+        pass_counts = np.fromiter((state.pass_count for state in states), dtype=np.int64, count=len(names))
+        decision_sums = np.fromiter((state.decision_sum for state in states), dtype=np.float64, count=len(names))
+        passed = SCORING_SCHEMA.final_decision(pass_counts, counts, decision_sums)
+        final_results = pd.Series(np.where(passed, 'Pass', 'Fail'), index=name_index, name='Reviewer_Result')
+
+        parts = list(self._parts.values())
+        total_count = sum(part.n_rows for part in parts)
+        passer_count = sum(part.passer_count for part in parts)
+        if total_count:
+            total_sums = np.sum([part.total_sums for part in parts], axis=0)
+            overall_avg = pd.Series(total_sums[col_mask] / total_count, index=score_cols)
+        else:
+            overall_avg = pd.Series(np.nan, index=score_cols)
+        if passer_count:
+            passer_sums = np.sum([part.passer_sums for part in parts], axis=0)
+            passer_avg = pd.Series(passer_sums[col_mask] / passer_count, index=score_cols)
+        else:
+            passer_avg = pd.Series(0, index=score_cols)
+
+        return CandidateIndex(
+            score_cols=score_cols,
+            names=names,
+            positions={name: state.positions for name, state in zip(names, states)},
+            scores=scores,
+            final_results=final_results,
+            evaluation_counts=pd.Series(counts, index=name_index),
+            reviewer_results={name: state.results for name, state in zip(names, states)},
+            comments={name: state.comments for name, state in zip(names, states)},
+            overall_avg=overall_avg,
+            passer_avg=passer_avg,
+            cohort=build_cohort_stats(scores),
+        )
+
+
+@timed('summary.index')
+def build_candidate_index(all_df: pd.DataFrame, score_cols) -> CandidateIndex:
+    """처리된 데이터프레임 하나를 파일 하나의 기여분으로 보고 후보자별 집계 구조를 만듭니다. (CandidateAggregator와 같은 경로)"""
+    aggregator = CandidateAggregator(score_cols)
+    aggregator.update(put=[(None, file_contribution(all_df, score_cols))])
+    return aggregator.index()
+
+
+@dataclass(frozen=True)
+class RowFilterIndex:
+    """
+    통합 결과 화면의 필터 조건별 행 위치(iloc) 인덱스입니다.
+    데이터셋당 한 번 만들고, 필터를 바꿀 때는 데이터프레임을 다시 훑지 않고 정렬된 위치 배열만 합치거나 교차합니다.
+    """
+    n_rows: int
+    candidates: dict          # 후보자 이름 -> 행 위치 배열 (CandidateIndex.positions와 공유)
+    reviewers: dict           # 심사위원 이름 -> 행 위치 배열
+    results: dict             # 'Reviewer_Result' 값 -> 행 위치 배열
+
+    def select(self, candidates=(), reviewers=(), results=()):
+        """
+        조건에 맞는 행 위치를 오름차순 배열로 반환합니다.
+        같은 조건 안의 값은 합집합, 조건끼리는 교집합이며, 비어 있는 조건은 적용하지 않습니다.
+        """
+        selected = None
+        for positions, keys in ((self.candidates, candidates), (self.reviewers, reviewers), (self.results, results)):
+            if not keys:
+                continue
+            parts = [positions[key] for key in keys if key in positions]
+            if len(parts) == 1:
+                rows = parts[0]
+            else:
+                rows = np.unique(np.concatenate(parts)) if parts else np.empty(0, dtype=np.intp)
+            selected = rows if selected is None else np.intersect1d(selected, rows, assume_unique=True)
+        return np.arange(self.n_rows) if selected is None else selected
+
+
+def _positions_by(all_df, col):
+    if col not in all_df.columns:
+        return {}
+    values = all_df[col]
+    return values.groupby(values, sort=True, observed=True).indices
+
+
+@timed('summary.filters')
+def build_row_filter_index(all_df: pd.DataFrame, index: CandidateIndex) -> RowFilterIndex:
+    """통합 데이터프레임과 후보자 집계 구조에서 필터 인덱스를 만듭니다. 후보자별 행 위치는 집계 구조의 것을 그대로 씁니다."""
+    return RowFilterIndex(
+        n_rows=len(all_df),
+        candidates=index.positions,
+        reviewers=_positions_by(all_df, '심사위원 성명'),
+        results=_positions_by(all_df, 'Reviewer_Result'),
+    )
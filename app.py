@@ -1,342 +1,190 @@
+import uuid
+
+import numpy as np
 import streamlit as st
 import pandas as pd
-import io
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
+
+from dataset import EvaluationDataset
+from diagnostics import Recorder, activate, configure_json_logging, env_enabled, stage
+from exports import DATA_EXPORT_FORMATS, available_export_formats, data_export_content, export_file_name
+from ingest import file_digest
+from payloads import PAYLOAD_CACHE, BackgroundBuild
+from processing import FILE_ERROR_HINT, REQUIRED_COLS, EvaluationFileError, evaluation_fingerprint, export_frame
+from scoring import SCORING_SCHEMA
+from validation import RULE_LABELS, VALIDATION_RULES, VIOLATION_COLUMN_LABELS, count_violations
 
 # --- Configuration ---
 st.set_page_config(layout="wide", page_title="면접 심사 결과 리포트")
 
 # --- Constants ---
-# 점수 계산을 위한 카테고리별 컬럼 정의 (파일 양식에 맞게 수정)
-# 이 컬럼들은 점수 계산 및 리포트 생성에 사용됩니다.
-CATEGORY_COLS = {
-    'Project': ['요구사항 관리', '사용방법론,도구', '목표달성/ 사업적 효과성'],
-    'SW Architect': ['Architecting Process (접근방법 및 절차)', 'Architecture Design (표현 및 구조화)', 'Architecture 검증 (프로토타입 및 평가)'],
-    'Communication': ['커뮤니케이션 (문서화/리더십)']
+# 이 인원 이상이면 전체 리포트를 스트리밍(write_only) 방식으로 생성하는 것을 기본값으로 합니다.
+STREAMING_ENGINE_MIN_CANDIDATES = 200
+# 진단 패널에 표시하는 최근 실행 수
+DIAGNOSTICS_PANEL_RUNS = 3
+DIAGNOSTICS_COLUMNS = {
+    'run': '실행', 'stage': '단계', 'parent': '상위 단계', 'duration_ms': '시간(ms)',
+    'peak_rss_mb': '최대 RSS(MB)', 'peak_delta_mb': '메모리 증가(MB)', 'status': '상태',
 }
+# 백그라운드 리포트 생성 진행률을 다시 읽는 간격 (초)
+REPORT_JOB_POLL_SECONDS = 0.5
+# 통합 결과 표의 페이지당 행 수 선택지
+RESULT_PAGE_SIZES = [50, 100, 500, 1000]
+DEFAULT_RESULT_PAGE_SIZE = 100
+# 통합 결과 다운로드 형식 (엑셀 + 데이터 파일 형식)
+COMBINED_EXPORT_FORMATS = ['xlsx'] + available_export_formats()
+# 세션 간에 공유하는 데이터셋 조회 결과 수 (같은 파일 조합을 올린 세션은 같은 결과를 함께 사용)
+SHARED_DATASET_MAX_ENTRIES = 8
+
+# 서버 전체 JSON 로그가 켜져 있으면 모든 세션의 단계별 측정값을 표준 오류로 출력합니다.
+if env_enabled():
+    configure_json_logging()
+
+def get_session_dataset(reader='pandas', usecols=None):
+    """세션의 평가 데이터셋을 반환합니다. 읽기 옵션이 바뀌면 새로 만듭니다."""
+    dataset = st.session_state.get('evaluation_dataset')
+    if dataset is None or dataset.options != (reader, usecols):
+        dataset = EvaluationDataset(reader=reader, usecols=usecols)
+        st.session_state.evaluation_dataset = dataset
+    return dataset
+
+@st.cache_resource(max_entries=SHARED_DATASET_MAX_ENTRIES, show_spinner=False)
+def get_shared_snapshot(fingerprint, _dataset, _files, _digests):
+    """
+    데이터셋 지문(파일명, 파일 내용, 읽기 옵션)별로 통합 데이터프레임, 집계 구조, 검증 결과를 한 벌만 만들어 모든 세션이 복사 없이 공유합니다.
+    - 같은 지문의 조회 결과가 이미 있으면 세션 데이터셋을 갱신하지 않고(파일을 읽지 않고) 바로 반환합니다.
+    - 없으면 세션 데이터셋을 업로드 목록에 맞춰 갱신한 뒤 조회 결과를 만듭니다. (파일별 전처리 결과도 세션 간 공유)
+    반환된 데이터프레임은 수정하지 말아야 합니다. (필터링은 새 데이터프레임을 만들므로 안전함)
+    """
+    _dataset.sync(_files, _digests)
+    return _dataset.snapshot()
 
-PASS_SCORE_THRESHOLD = 70
-# 리포트 양식에서 '제출용 양식' 삭제
-REPORT_FORMATS = ['상세 리포트', '요약 리포트']
-
-# --- Excel Styling ---
-TITLE_FONT = Font(bold=True, size=14)
-HEADER_FONT = Font(bold=True, size=12)
-PASS_FONT = Font(color="0000FF", bold=True)
-PASS_FILL = PatternFill(start_color="DDEEFF", end_color="DDEEFF", fill_type="solid")
-FAIL_FONT = Font(color="FF0000", bold=True)
-FAIL_FILL = PatternFill(start_color="FFDDDD", end_color="FFDDDD", fill_type="solid")
-TABLE_HEADER_FONT = Font(bold=True)
-TABLE_HEADER_FILL = PatternFill(start_color="EAEAEA", end_color="EAEAEA", fill_type="solid")
-CENTER_ALIGN = Alignment(horizontal='center', vertical='center')
-LEFT_ALIGN = Alignment(horizontal='left', vertical='center')
-WRAP_LEFT_ALIGN = Alignment(horizontal='left', vertical='top', wrap_text=True)
-THIN_BORDER = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
-BOX_BORDER = Border(left=Side(style='medium'), right=Side(style='medium'), top=Side(style='medium'), bottom=Side(style='medium'))
-
-
-# --- Helper Functions ---
-
-def to_excel(df: pd.DataFrame) -> bytes:
-    """데이터프레임을 엑셀 파일(bytes)로 변환합니다."""
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, index=False, sheet_name='통합결과')
-    processed_data = output.getvalue()
-    return processed_data
-
-def apply_styles_to_range(ws, cell_range, font=None, fill=None, alignment=None, border=None):
-    """주어진 범위의 셀에 스타일을 적용합니다. 단일 셀과 범위를 모두 처리합니다."""
-    # 단일 셀 케이스를 명시적으로 처리
-    if ':' not in cell_range:
-        cell = ws[cell_range]
-        if font: cell.font = font
-        if fill: cell.fill = fill
-        if alignment: cell.alignment = alignment
-        if border: cell.border = border
-        return
-
-    # 범위 케이스 처리
-    rows = ws[cell_range]
-    # openpyxl이 단일 행 범위를 셀의 튜플로 반환하는 경우를 처리
-    if rows and isinstance(rows[0], tuple):
-        for row in rows:
-            for cell in row:
-                if font: cell.font = font
-                if fill: cell.fill = fill
-                if alignment: cell.alignment = alignment
-                if border: cell.border = border
-    # 단일 행 범위 처리
-    else:
-        for cell in rows:
-            if font: cell.font = font
-            if fill: cell.fill = fill
-            if alignment: cell.alignment = alignment
-            if border: cell.border = border
-
-def write_individual_report_sheet(writer, candidate_name, all_df, report_format):
-    """주어진 ExcelWriter 객체에 선택된 양식으로 개별 후보자의 리포트 시트를 작성하고 서식을 적용합니다."""
-    sheet_name = f'{candidate_name} 리포트'
-    
-    # 데이터 준비
-    candidate_df = all_df[all_df['성명'] == candidate_name].copy()
-    is_final_pass = all(candidate_df['Reviewer_Result'] == 'Pass')
-    final_result = "Pass" if is_final_pass else "Fail"
-    
-    # --- 상세/요약 리포트 로직 ---
-    comments_data = []
-    candidate_df = candidate_df.reset_index(drop=True)
-    for i, row in candidate_df.iterrows():
-        reviewer_label = f"Reviewer {i+1}"
-        result_label = f"(Pass)" if row['Reviewer_Result'] == 'Pass' else f"(Fail)"
-        comment = row.get('총평', '코멘트 없음')
-        comments_data.append({'심사위원': f"{reviewer_label} {result_label}", '코멘트': comment})
-    
-    header_df = pd.DataFrame([{'항목': '후보자 리포트', ' ': candidate_name}, {'항목': '최종 결과', ' ': final_result}])
-    header_df.to_excel(writer, sheet_name=sheet_name, index=False, header=False, startrow=0)
-    worksheet = writer.sheets[sheet_name]
-
-    if report_format == '상세 리포트':
-        candidate_scores = candidate_df[list(CATEGORY_COLS.keys()) + ['총점']].mean().rename("후보자 점수")
-        overall_avg = all_df[list(CATEGORY_COLS.keys()) + ['총점']].mean().rename("전체 평균")
-        passer_df = all_df[all_df['Reviewer_Result'] == 'Pass']
-        passer_avg = passer_df[list(CATEGORY_COLS.keys()) + ['총점']].mean().rename("합격자 평균") if not passer_df.empty else pd.Series(0, index=candidate_scores.index, name="합격자 평균")
-        comparison_df = pd.concat([candidate_scores, overall_avg, passer_avg], axis=1)
-        comparison_df.index.name = "Category"
-        
-        worksheet['A4'] = '📊 심사 점수 분석'
-        comparison_df.to_excel(writer, sheet_name=sheet_name, startrow=4)
-        comments_start_row = 4 + len(comparison_df) + 3
-    else: # 요약 리포트
-        comments_start_row = 3
-
-    worksheet[f'A{comments_start_row}'] = '📝 심사위원 코멘트'
-    
-    # 코멘트 헤더 수동 작성 및 병합
-    header_row = comments_start_row + 1
-    worksheet[f'A{header_row}'] = '심사위원'
-    worksheet[f'B{header_row}'] = '코멘트'
-    worksheet.merge_cells(f'B{header_row}:D{header_row}')
-
-    # 코멘트 데이터 수동 작성 및 병합
-    for i, comment_item in enumerate(comments_data):
-        current_row = header_row + 1 + i
-        worksheet[f'A{current_row}'] = comment_item['심사위원']
-        worksheet[f'B{current_row}'] = comment_item['코멘트']
-        worksheet.merge_cells(f'B{current_row}:D{current_row}')
-
-    # 컬럼 너비 조정
-    worksheet.column_dimensions['A'].width = 25
-    worksheet.column_dimensions['B'].width = 27
-    worksheet.column_dimensions['C'].width = 27
-    worksheet.column_dimensions['D'].width = 26
-    if report_format == '상세 리포트':
-        pass # 상세 리포트의 점수 테이블은 A-D 컬럼을 사용하므로 너비가 적절함
-
-    # 공통 서식 적용
-    worksheet['A1'].font = TITLE_FONT
-    worksheet['B1'].font = TITLE_FONT
-    result_cell = worksheet['B2']
-    if final_result == "Pass":
-        result_cell.font = PASS_FONT
-        result_cell.fill = PASS_FILL
-    else:
-        result_cell.font = FAIL_FONT
-        result_cell.fill = FAIL_FILL
-    result_cell.border = THIN_BORDER
-
-    # 상세 리포트 점수 테이블 서식
-    if report_format == '상세 리포트':
-        worksheet['A4'].font = HEADER_FONT
-        score_table_range = f'A5:D{5 + len(comparison_df)}'
-        apply_styles_to_range(worksheet, score_table_range, border=THIN_BORDER)
-        apply_styles_to_range(worksheet, f'A5:D5', font=TABLE_HEADER_FONT, fill=TABLE_HEADER_FILL, alignment=CENTER_ALIGN)
-
-    # 코멘트 테이블 서식
-    worksheet[f'A{comments_start_row}'].font = HEADER_FONT
-    apply_styles_to_range(worksheet, f'A{header_row}:D{header_row}', font=TABLE_HEADER_FONT, fill=TABLE_HEADER_FILL, border=THIN_BORDER)
-    worksheet[f'A{header_row}'].alignment = CENTER_ALIGN
-    worksheet[f'B{header_row}'].alignment = CENTER_ALIGN
-    
-    for i in range(len(comments_data)):
-        current_row = header_row + 1 + i
-        apply_styles_to_range(worksheet, f'A{current_row}:D{current_row}', border=THIN_BORDER)
-        worksheet[f'A{current_row}'].alignment = CENTER_ALIGN
-        worksheet[f'B{current_row}'].alignment = WRAP_LEFT_ALIGN
-
-
-def generate_report_file_content(candidate_name, all_df, report_format):
-    """선택된 후보자의 상세 리포트 내용을 Excel 파일(bytes)로 생성합니다."""
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        write_individual_report_sheet(writer, candidate_name, all_df, report_format)
-    return output.getvalue()
-
-def generate_overall_report_file_content(all_df, report_format):
-    """전체 후보자에 대한 요약 및 개별 리포트를 포함하는 Excel 파일을 생성합니다."""
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        # 1. 전체 및 합격자 평균 미리 계산
-        score_cols = list(CATEGORY_COLS.keys()) + ['총점']
-        overall_avg = all_df[score_cols].mean()
-        passer_df_all = all_df[all_df['Reviewer_Result'] == 'Pass']
-        passer_avg = passer_df_all[score_cols].mean() if not passer_df_all.empty else pd.Series(0, index=score_cols)
-
-        # 2. 후보자별 요약 데이터 생성
-        summary_data = []
-        candidate_names = sorted(all_df['성명'].unique())
-        for name in candidate_names:
-            candidate_df = all_df[all_df['성명'] == name].reset_index(drop=True)
-            is_final_pass = all(candidate_df['Reviewer_Result'] == 'Pass')
-            final_result = "Pass" if is_final_pass else "Fail"
-            
-            # 후보자 개인 평균 점수
-            candidate_avg_scores = candidate_df[score_cols].mean()
-            
-            summary_row = {'성명': name, '최종 결과': final_result}
-            
-            # 후보자 점수, 전체 평균, 합격자 평균을 컬럼으로 추가
-            for col in score_cols:
-                summary_row[f'{col}_후보자'] = candidate_avg_scores[col]
-                summary_row[f'{col}_전체평균'] = overall_avg[col]
-                summary_row[f'{col}_합격자평균'] = passer_avg[col]
-
-            # 심사위원별 코멘트 추가
-            comments = candidate_df['총평'].fillna('코멘트 없음').tolist()
-            for i in range(3):
-                summary_row[f'심사위원{i+1} 코멘트'] = comments[i] if i < len(comments) else 'N/A'
-            
-            summary_data.append(summary_row)
-        
-        summary_df = pd.DataFrame(summary_data)
-        
-        # 3. '전체 요약' 시트에 데이터 쓰기
-        summary_df.to_excel(writer, sheet_name='전체 요약', index=False)
-        worksheet = writer.sheets['전체 요약']
-
-        # 4. 서식 적용
-        # 컬럼 너비 조정
-        for col_idx, col_name in enumerate(summary_df.columns, 1):
-            col_letter = get_column_letter(col_idx)
-            if '코멘트' in col_name:
-                worksheet.column_dimensions[col_letter].width = 40
-            elif '성명' in col_name:
-                 worksheet.column_dimensions[col_letter].width = 15
-            else:
-                 worksheet.column_dimensions[col_letter].width = 18
-
-        # 테이블 전체 서식
-        summary_range = f'A1:{get_column_letter(len(summary_df.columns))}{len(summary_df) + 1}'
-        apply_styles_to_range(worksheet, summary_range, border=THIN_BORDER)
-        apply_styles_to_range(worksheet, f'A1:{get_column_letter(len(summary_df.columns))}1', font=TABLE_HEADER_FONT, fill=TABLE_HEADER_FILL, alignment=CENTER_ALIGN)
-        
-        # 최종 결과 Pass/Fail 서식
-        for row_idx, row in enumerate(summary_df.itertuples(), 2):
-            result_cell = worksheet[f'B{row_idx}']
-            if row._2 == "Pass": # _2 corresponds to the second column '최종 결과'
-                result_cell.font = PASS_FONT
-                result_cell.fill = PASS_FILL
-            else:
-                result_cell.font = FAIL_FONT
-                result_cell.fill = FAIL_FILL
-
-        # 5. 후보자별 개별 리포트 시트 생성
-        for name in candidate_names:
-            write_individual_report_sheet(writer, name, all_df, report_format)
-            
-    return output.getvalue()
-
-
-@st.cache_data
-def load_and_process_data(uploaded_files):
+def load_and_process_data(uploaded_files, reader='pandas', usecols=None):
     """
-    업로드된 엑셀 파일들을 읽고 하나의 데이터프레임으로 통합 및 전처리합니다.
-    - 입력 파일의 모든 컬럼을 유지합니다.
-    - 각 파일의 '평가표' 시트를 읽습니다.
-    - 5번째 행을 헤더로 사용하고, 데이터는 6번째 행부터 시작합니다.
-    - 컬럼명의 개행 문자를 공백으로 변환합니다.
-    - 누락된 '성명' 데이터를 제거합니다.
-    - 카테고리별 점수와 Pass/Fail 여부를 계산하고, 원본 데이터와 비교 검증합니다.
+    업로드된 파일 목록의 데이터셋 지문으로 공유 조회 결과(DatasetSnapshot)를 찾고, 없을 때만 세션 데이터셋을 갱신하여 만듭니다.
+    - 새로 올라온 파일과 내용이 바뀐 파일만 파싱하고, 그 파일에 나오는 후보자의 집계와 검증만 다시 합니다. (dataset.EvaluationDataset 참고)
+    - 파일 처리 중 오류가 발생하면 오류 메시지를 표시하고 None을 반환합니다.
     """
-    if not uploaded_files:
-        return pd.DataFrame()
-
-    all_data = []
-    for file in uploaded_files:
-        try:
-            # 첫 행을 1로 볼 때 5번째 행이 제목이므로, header 인덱스는 4가 됩니다.
-            df = pd.read_excel(file, sheet_name='평가표', header=4)
-            
-            # 컬럼명에서 개행문자를 공백으로 변경하고 양쪽 공백을 제거합니다.
-            df.columns = df.columns.str.replace('\n', ' ', regex=False).str.strip()
-            
-            # 모든 컬럼을 유지하므로, 별도의 컬럼 필터링을 하지 않습니다.
-            all_data.append(df)
-        except Exception as e:
-            st.error(f"'{file.name}' 파일 처리 중 오류가 발생했습니다: {e}")
-            st.info("엑셀 파일의 5번째 행에 컬럼명이 있고, '평가표' 시트가 존재하는지 확인해주세요.")
-            return pd.DataFrame()
-
-    if not all_data:
-        return pd.DataFrame()
-
-    # 모든 데이터프레임을 하나로 합칩니다.
-    combined_df = pd.concat(all_data, ignore_index=True)
-    
-    # '성명'이 비어있는 행은 제거합니다.
-    combined_df.dropna(subset=['성명'], inplace=True)
-    
-    # --- 데이터 타입 변환 ---
-    # 점수 계산에 필요한 컬럼들만 숫자 타입으로 변환합니다.
-    score_cols = [col for sublist in CATEGORY_COLS.values() for col in sublist] + ['총점']
-    
-    for col in score_cols:
-        # 파일에 해당 점수 컬럼이 있는 경우에만 변환 수행
-        if col in combined_df.columns:
-            combined_df[col] = pd.to_numeric(combined_df[col], errors='coerce').fillna(0)
-
-    # --- 카테고리별 점수 및 Pass/Fail 계산 ---
-    for category, cols in CATEGORY_COLS.items():
-        # 파일에 존재하는 점수 컬럼만 합산
-        score_cols_in_df = [c for c in cols if c in combined_df.columns]
-        combined_df[category] = combined_df[score_cols_in_df].sum(axis=1)
-    
-    # '총점' 컬럼이 있는 경우에만 Pass/Fail 계산
-    if '총점' in combined_df.columns:
-        combined_df['Reviewer_Result'] = combined_df['총점'].apply(
-            lambda x: 'Pass' if x >= PASS_SCORE_THRESHOLD else 'Fail'
+    files = [(file.name, file.getvalue()) for file in uploaded_files]
+    digests = [file_digest(data) for _, data in files]
+    fingerprint = evaluation_fingerprint([name for name, _ in files], digests, reader, usecols)
+    try:
+        return get_shared_snapshot(fingerprint, get_session_dataset(reader, usecols), files, digests)
+    except EvaluationFileError as e:
+        st.error(str(e))
+        st.info(FILE_ERROR_HINT)
+        return None
+
+def session_recorder(show_panel):
+    """
+    진단 패널을 켰거나 서버 전체 JSON 로그가 켜져 있으면 세션의 Recorder를 이번 실행에 연결하여 반환합니다.
+    둘 다 꺼져 있으면 측정을 끄고 None을 반환합니다. (stage()가 아무 일도 하지 않음)
+    """
+    # 탭 프래그먼트만 다시 실행될 때 같은 Recorder를 다시 연결할 수 있도록 실행 번호와 함께 세션에 남깁니다.
+    st.session_state.app_run_serial = st.session_state.get('app_run_serial', 0) + 1
+    log_json = env_enabled()
+    if not (show_panel or log_json):
+        st.session_state.active_diagnostics_recorder = None
+        activate(None)
+        return None
+    if 'diagnostics_recorder' not in st.session_state:
+        st.session_state.diagnostics_recorder = Recorder(session=uuid.uuid4().hex[:8], log_json=log_json)
+    recorder = st.session_state.diagnostics_recorder
+    st.session_state.active_diagnostics_recorder = recorder
+    recorder.begin_run()
+    activate(recorder)
+    return recorder
+
+def render_diagnostics_panel(recorder):
+    """사이드바에 최근 실행의 단계별 실행 시간과 메모리 사용량을 표시합니다."""
+    with st.sidebar.expander("🩺 진단", expanded=True):
+        spans = [span for run in recorder.runs()[:DIAGNOSTICS_PANEL_RUNS] for span in recorder.spans_for_run(run)]
+        if not spans:
+            st.caption("기록된 단계가 없습니다. 캐시된 결과를 사용한 단계는 측정되지 않습니다.")
+            return
+        diagnostics_df = pd.DataFrame(spans).reindex(columns=list(DIAGNOSTICS_COLUMNS)).rename(columns=DIAGNOSTICS_COLUMNS)
+        st.dataframe(diagnostics_df.iloc[::-1], use_container_width=True, hide_index=True)
+        st.caption("캐시된 결과를 사용한 단계는 측정되지 않습니다. 다운로드 파일 생성 기록은 다음 실행에 표시됩니다.")
+        if st.button("기록 지우기", key="clear_diagnostics"):
+            recorder.clear()
+            st.rerun()
+
+def export_format_label(export_format):
+    return "Excel" if export_format == 'xlsx' else DATA_EXPORT_FORMATS[export_format][0]
+
+def export_mime(export_format):
+    return "application/vnd.ms-excel" if export_format == 'xlsx' else DATA_EXPORT_FORMATS[export_format][2]
+
+def combined_export_file_name(export_format):
+    return "interview_results_combined.xlsx" if export_format == 'xlsx' else export_file_name("interview_results_combined", export_format)
+
+def combined_export_content(filtered_df, export_format):
+    """통합 결과를 엑셀 또는 데이터 파일(CSV/Parquet/JSON Lines)로 만듭니다."""
+    if export_format == 'xlsx':
+        from reports import to_excel
+        return to_excel(export_frame(filtered_df))
+    return data_export_content(export_frame(filtered_df), export_format)
+
+def background_download(slot, key, label, file_name, mime, build, *args):
+    """
+    파일을 백그라운드 작업(BackgroundBuild)으로 만들고, 진행률을 표시하다가 완료되면 다운로드 버튼을 보여줍니다.
+    - slot별로 세션당 작업 하나를 유지하며, key(데이터셋 지문, 양식 등)가 바뀌면 진행 중인 이전 작업을 취소합니다.
+    - 이미 만들어진 파일이 공유 캐시에 있으면 바로 다운로드 버튼을 표시합니다.
+    """
+    jobs = st.session_state.setdefault('report_jobs', {})
+    job = jobs.get(slot)
+    if job is not None and job.key != key:
+        job.cancel()
+        del jobs[slot]
+        job = None
+
+    payload = PAYLOAD_CACHE.get(key)
+    if payload is None and job is not None and job.status == 'done':
+        payload = job.payload
+    if payload is not None:
+        st.download_button(
+            label=f"{label} 다운로드", data=lambda: payload, file_name=file_name, mime=mime,
+            on_click="ignore", key=f"download_{slot}"
         )
-    else:
-        # 총점 컬럼이 없으면 결과를 'N/A'로 처리
-        combined_df['Reviewer_Result'] = 'N/A'
-    
-    # --- 합격여부 값 비교 검증 ---
-    if '합격여부(Pass/Fail)' in combined_df.columns:
-        # 비교를 위해 양쪽 값 정규화 (소문자, 공백 제거)
-        original_result = combined_df['합격여부(Pass/Fail)'].astype(str).str.strip().str.lower()
-        calculated_result = combined_df['Reviewer_Result'].str.strip().str.lower()
-        
-        # 원본 결과가 비어있지 않은 경우에만 비교하여 불일치 여부 플래그
-        combined_df['Result_Mismatch'] = (original_result != calculated_result) & (original_result.notna()) & (original_result != '') & (original_result != 'nan')
-    else:
-        # 비교할 컬럼이 없으면 불일치 없음으로 처리
-        combined_df['Result_Mismatch'] = False
-
-    return combined_df
+        return
 
-def generate_candidate_report(candidate_name, all_df):
+    if job is not None and job.running:
+        report_job_progress(slot, label)
+        return
+    if job is not None and job.status == 'error':
+        st.error(f"{label} 생성 중 오류가 발생했습니다: {job.error}")
+    elif job is not None and job.status == 'cancelled':
+        st.caption(f"{label} 생성을 취소했습니다.")
+    st.button(f"{label} 만들기", key=f"start_{slot}", on_click=start_background_build, args=(slot, key, build, *args))
+
+def start_background_build(slot, key, build, *args):
+    """버튼 콜백. 다음 실행에서 진행률이 바로 표시되도록 스크립트 실행 전에 작업을 시작합니다."""
+    st.session_state.report_jobs[slot] = BackgroundBuild(key, build, *args).start()
+
+@st.fragment(run_every=REPORT_JOB_POLL_SECONDS)
+def report_job_progress(slot, label):
+    """백그라운드 작업의 진행률과 취소 버튼을 표시합니다. 이 부분만 주기적으로 다시 실행하며, 작업이 끝나면 전체를 다시 실행합니다."""
+    job = st.session_state.get('report_jobs', {}).get(slot)
+    if job is None:
+        return
+    if not job.running:
+        st.rerun()
+    progress_text = f"{label} 생성 중... ({job.done}/{job.total})" if job.total else f"{label} 생성 준비 중..."
+    st.progress(job.fraction, text=progress_text)
+    if st.button("취소", key=f"cancel_{slot}"):
+        job.cancel()
+
+def generate_candidate_report(candidate_name, index, fingerprint):
     """선택된 후보자의 상세 리포트를 생성하고 다운로드 버튼을 제공합니다."""
-    
-    # 1. 후보자 데이터 추출
-    candidate_df = all_df[all_df['성명'] == candidate_name].copy()
-    if len(candidate_df) == 0:
+    # reports(openpyxl)는 불러오는 데 시간이 걸리므로 앱 시작 시가 아니라 리포트 화면을 처음 그릴 때 가져옵니다.
+    from reports import REPORT_FORMATS, generate_report_file_content, report_file_name
+
+    # 1. 후보자 데이터 확인
+    if candidate_name not in index:
         st.warning("해당 후보자의 데이터를 찾을 수 없습니다.")
         return
 
-    # 2. 최종 합격 결과 계산
-    is_final_pass = all(candidate_df['Reviewer_Result'] == 'Pass')
-    final_result = "Pass" if is_final_pass else "Fail"
+    # 2. 최종 합격 결과 (집계 구조에 미리 계산되어 있음)
+    final_result = index.final_result(candidate_name)
     
     st.header(f"👤 후보자 리포트: {candidate_name}")
     
@@ -349,12 +197,16 @@ def generate_candidate_report(candidate_name, all_df):
         selected_format = st.radio("리포트 양식 선택", REPORT_FORMATS, horizontal=True, key=f"individual_report_format_{candidate_name}")
     with col3:
         st.write("") # 세로 정렬을 위한 빈 공간
-        report_bytes = generate_report_file_content(candidate_name, all_df, selected_format)
+        # 리포트 파일은 다운로드 버튼을 누를 때만 생성하고, 공유 캐시에 보관합니다.
         st.download_button(
             label="📥 리포트 다운로드",
-            data=report_bytes,
-            file_name=f"{candidate_name}_면접결과_{selected_format}.xlsx",
-            mime="application/vnd.ms-excel"
+            data=PAYLOAD_CACHE.lazy(
+                (fingerprint, 'candidate', selected_format, candidate_name, None),
+                generate_report_file_content, candidate_name, index, selected_format
+            ),
+            file_name=report_file_name(candidate_name, selected_format),
+            mime="application/vnd.ms-excel",
+            on_click="ignore"
         )
 
     st.markdown("---")
@@ -362,33 +214,272 @@ def generate_candidate_report(candidate_name, all_df):
     # 3. 심사 점수 분석
     st.subheader("📊 심사 점수 분석")
 
-    candidate_scores = candidate_df[list(CATEGORY_COLS.keys()) + ['총점']].mean().rename("후보자 점수")
-    overall_avg = all_df[list(CATEGORY_COLS.keys()) + ['총점']].mean().rename("전체 평균")
-    passer_df = all_df[all_df['Reviewer_Result'] == 'Pass']
-    if not passer_df.empty:
-        passer_avg = passer_df[list(CATEGORY_COLS.keys()) + ['총점']].mean().rename("합격자 평균")
-    else:
-        passer_avg = pd.Series(0, index=candidate_scores.index, name="합격자 평균")
-    
-    comparison_df = pd.concat([candidate_scores, overall_avg, passer_avg], axis=1)
-    comparison_df.index.name = "Category"
-    st.dataframe(comparison_df.style.format("{:.2f}"), use_container_width=True)
-    
+    comparison_df = index.comparison(candidate_name)
+    st.dataframe(
+        comparison_df.style.format("{:.2f}").format("{:d}", subset=["순위"]).format("{:.1f}", subset=["백분위"]),
+        use_container_width=True
+    )
+    st.caption(f"순위와 백분위는 전체 후보자 {len(index)}명의 평균 점수 기준입니다. (백분위가 높을수록 상위)")
+
+    # 전체 후보자 점수 분포 (후보자가 속한 구간을 다른 색으로 표시)
+    st.subheader("📈 전체 후보자 점수 분포")
+    chart_cols = st.columns(len(index.score_cols))
+    for chart_col, score_col, standing in zip(chart_cols, index.score_cols, index.standings(candidate_name)):
+        histogram = index.cohort.histogram(score_col).reset_index()
+        histogram['위치'] = np.where(histogram.index == standing.bin, candidate_name, '다른 후보자')
+        with chart_col:
+            st.markdown(f"**{score_col}** · {standing.rank}위 / {standing.cohort_size}명")
+            st.bar_chart(histogram, x='구간', y='후보자 수', color='위치', height=220)
+
     st.markdown("---")
 
     # 4. 심사 리뷰 의견 (총평 사용)
     st.subheader("📝 심사위원 코멘트")
-    candidate_df = candidate_df.reset_index(drop=True)
-    for i, row in candidate_df.iterrows():
+    reviews = zip(index.reviewer_results[candidate_name], index.comments[candidate_name])
+    for i, (reviewer_result, comment) in enumerate(reviews):
         reviewer_label = f"Reviewer {i+1}"
-        result_label = f"({row['Reviewer_Result']})"
+        result_label = f"({reviewer_result})"
         
         with st.container(border=True):
             st.markdown(f"**{reviewer_label}** {result_label}")
-            comment = row.get('총평', '코멘트 없음')
             st.info(f"{comment}")
 
 
+# --- Tabs ---
+# 각 탭은 프래그먼트로 실행되어, 탭 안의 위젯을 조작하면 해당 탭만 다시 실행됩니다.
+# 탭의 입력은 공유 조회 결과(DatasetSnapshot)뿐이며, 탭마다 필요한 표는 데이터셋 지문별로 한 번만 만듭니다.
+
+def fragment_stage(name):
+    """
+    탭 프래그먼트 본문을 진단 단계('tab.{name}')로 측정합니다.
+    전체 실행 없이 프래그먼트만 다시 실행된 경우에는 세션 Recorder에 새 실행으로 기록합니다.
+    """
+    recorder = st.session_state.get('active_diagnostics_recorder')
+    app_run = st.session_state.get('app_run_serial')
+    fragment_runs = st.session_state.setdefault('fragment_run_serials', {})
+    if recorder is not None and fragment_runs.get(name) == app_run:
+        recorder.begin_run()
+    fragment_runs[name] = app_run
+    activate(recorder)
+    return stage(f'tab.{name}')
+
+@st.cache_resource(max_entries=SHARED_DATASET_MAX_ENTRIES, show_spinner=False)
+def get_validation_tables(fingerprint, _snapshot):
+    """검증 규칙별 위반 건수 표와 위반 항목 표시용 표 (데이터셋 지문별로 한 번 만들어 세션 간 공유)"""
+    rule_counts = count_violations(_snapshot.violations)
+    rule_table = pd.DataFrame({
+        "검증 규칙": [rule.label for rule in VALIDATION_RULES],
+        "구분": ["오류" if rule.severity == 'error' else "경고" for rule in VALIDATION_RULES],
+        "위반 건수": rule_counts.to_numpy(),
+    })
+    violations = _snapshot.violations
+    violations_display = violations.assign(
+        성명=_snapshot.frame.loc[violations.index, '성명'].to_numpy(),
+        rule=violations['rule'].cat.rename_categories(RULE_LABELS),
+    )[['file', 'row', '성명', 'column', 'rule']].rename(columns=VIOLATION_COLUMN_LABELS)
+    return rule_table, violations_display
+
+@st.cache_resource(max_entries=SHARED_DATASET_MAX_ENTRIES, show_spinner=False)
+def get_summary_table(fingerprint, _index):
+    """'전체 후보자 리포트' 탭의 후보자별 요약표 (데이터셋 지문별로 한 번 만들어 세션 간 공유)"""
+    with stage('summary.frame'):
+        return _index.summary_frame()
+
+def score_column_config(score_cols):
+    """점수 컬럼을 소수 둘째 자리까지 표시하는 column_config (Styler와 달리 셀 문자열을 서버에서 만들지 않음)"""
+    return {col: st.column_config.NumberColumn(format="%.2f") for col in score_cols}
+
+@st.fragment
+def results_tab(snapshot):
+    """통합 결과 확인 탭: 데이터 검증 결과와 필터/페이지 단위 조회, 통합 결과 다운로드"""
+    with fragment_stage('results'):
+        processed_df = snapshot.frame
+        candidate_index = snapshot.index
+        fingerprint = snapshot.fingerprint
+        st.header("통합 심사 결과")
+
+        # --- 데이터 검증 ---
+        st.subheader("데이터 검증")
+        # 평가 횟수와 결과 불일치는 파일이 바뀔 때 해당 후보자/파일만 다시 검증되어 있습니다.
+        invalid_candidates = snapshot.invalid_counts
+        mismatch_df = snapshot.mismatches
+
+        if not invalid_candidates.empty:
+            st.error("⚠️ **평가 횟수 오류**: 아래 후보자들은 3회의 평가를 받지 않았습니다.")
+            st.dataframe(invalid_candidates.rename("평가 횟수"), use_container_width=True)
+        else:
+            st.success("✅ 모든 후보자가 3회의 평가를 받았습니다.")
+
+        st.markdown("---")
+
+        # --- 합격여부 결과 검증 ---
+        st.subheader("합격/불합격 결과 검증")
+        if 'Result_Mismatch' in processed_df.columns:
+            if not mismatch_df.empty:
+                st.error("⚠️ **결과 불일치 오류**: 원본 파일의 합격 여부와 계산된 결과가 다릅니다.")
+                st.dataframe(mismatch_df, use_container_width=True)
+            else:
+                st.success("✅ 모든 데이터의 합격 여부가 계산 결과와 일치합니다.")
+
+        st.markdown("---")
+
+        # --- 검증 규칙 전체 결과 ---
+        st.subheader("검증 규칙별 결과")
+        rule_table, violations_display = get_validation_tables(fingerprint, snapshot)
+        st.dataframe(rule_table, use_container_width=True, hide_index=True)
+        if not violations_display.empty:
+            with st.expander(f"위반 항목 {len(violations_display)}건 보기"):
+                st.dataframe(violations_display, use_container_width=True, hide_index=True)
+
+        st.markdown("---")
+
+        # --- 데이터 필터링 ---
+        st.subheader("데이터 필터링 및 조회")
+
+        # 필터링 UI (선택지는 데이터셋당 한 번 만든 필터 인덱스에서 가져옵니다.)
+        row_filters = snapshot.filters
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            selected_candidates = st.multiselect("후보자 선택", options=candidate_index.names, placeholder="모든 후보자 보기")
+        with col2:
+            selected_reviewers = st.multiselect("심사위원 선택", options=list(row_filters.reviewers), placeholder="모든 심사위원 보기")
+        with col3:
+            # Reviewer_Result 컬럼이 존재하는 경우에만 필터 표시
+            if row_filters.results:
+                result_options = ['전체'] + list(row_filters.results)
+                selected_result = st.selectbox("심사위원 평가 결과 선택", options=result_options, index=0)
+            else:
+                selected_result = '전체'
+
+        # 필터링 로직 (조건별 행 위치를 교차하여 선택된 행 위치만 구합니다.)
+        selected_rows = row_filters.select(
+            candidates=selected_candidates,
+            reviewers=selected_reviewers,
+            results=() if selected_result == '전체' else (selected_result,),
+        )
+
+        # 페이지 단위 표시 (현재 페이지의 행과 선택한 컬럼만 브라우저로 보냅니다.)
+        display_columns = [col for col in processed_df.columns if col != 'Result_Mismatch']
+        col1, col2, col3 = st.columns([4, 1, 1])
+        with col1:
+            selected_columns = st.multiselect("표시할 컬럼", options=display_columns, default=display_columns)
+        with col2:
+            page_size = st.selectbox("페이지당 행 수", options=RESULT_PAGE_SIZES, index=RESULT_PAGE_SIZES.index(DEFAULT_RESULT_PAGE_SIZE))
+        n_pages = max(1, -(-len(selected_rows) // page_size))
+        # 필터를 바꿔 페이지 수가 줄면 첫 페이지로 돌아갑니다.
+        if st.session_state.get('result_page', 1) > n_pages:
+            st.session_state.result_page = 1
+        with col3:
+            page = st.number_input("페이지", min_value=1, max_value=n_pages, step=1, key='result_page')
+
+        start = (page - 1) * page_size
+        page_rows = selected_rows[start:start + page_size]
+        st.dataframe(processed_df.iloc[page_rows][selected_columns], use_container_width=True, hide_index=True)
+        st.caption(f"전체 {len(selected_rows):,}건 중 {start + 1 if len(page_rows) else 0:,}–{start + len(page_rows):,}건 ({page}/{n_pages} 페이지)")
+
+        # --- 다운로드 버튼 ---
+        # 필터 조건에 맞는 전체 행(모든 컬럼)을 다운로드 버튼을 누를 때만 만들고, 데이터셋 지문과 필터 조건, 형식별로 캐시합니다.
+        # CSV/Parquet/JSON Lines는 openpyxl을 거치지 않고 구간 단위로 기록합니다.
+        filter_key = (tuple(sorted(selected_candidates)), tuple(sorted(selected_reviewers)), selected_result)
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            combined_format = st.selectbox(
+                "파일 형식", COMBINED_EXPORT_FORMATS, format_func=export_format_label, key="combined_export_format"
+            )
+        with col2:
+            st.write("")  # 세로 정렬을 위한 빈 공간
+            st.download_button(
+                label="📥 통합 결과 다운로드",
+                data=PAYLOAD_CACHE.lazy(
+                    (fingerprint, 'combined', combined_format, None, filter_key),
+                    lambda: combined_export_content(processed_df.iloc[selected_rows], combined_format)
+                ),
+                file_name=combined_export_file_name(combined_format),
+                mime=export_mime(combined_format),
+                on_click="ignore"
+            )
+
+@st.fragment
+def candidate_tab(snapshot):
+    """후보자 리포트 탭: 선택한 후보자의 리포트 화면과 다운로드"""
+    with fragment_stage('candidate'):
+        st.header("후보자별 상세 리포트")
+
+        selected_candidate = st.selectbox(
+            "리포트를 확인할 후보자를 선택하세요.",
+            options=snapshot.index.names,
+            index=None,
+            placeholder="후보자를 선택하세요"
+        )
+
+        if selected_candidate:
+            generate_candidate_report(selected_candidate, snapshot.index, snapshot.fingerprint)
+
+@st.fragment
+def summary_tab(snapshot):
+    """전체 후보자 리포트 탭: 후보자별 요약표와 요약 데이터, 전체 리포트, 개별 리포트 ZIP 다운로드"""
+    # reports(openpyxl)는 이 탭을 처음 그릴 때 가져옵니다.
+    from reports import (
+        REPORT_ENGINES, REPORT_FORMATS, build_overall_summary_frame, export_individual_reports_zip,
+        generate_overall_report_file_content
+    )
+
+    with fragment_stage('summary'):
+        candidate_index = snapshot.index
+        fingerprint = snapshot.fingerprint
+        st.header("전체 후보자 리포트 요약")
+
+        summary_df = get_summary_table(fingerprint, candidate_index)
+        st.dataframe(
+            summary_df, column_config=score_column_config(candidate_index.score_cols),
+            use_container_width=True, hide_index=True
+        )
+
+        # '전체 요약' 시트와 같은 내용을 분석용 데이터 파일로 내려받습니다.
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            summary_format = st.selectbox(
+                "요약 데이터 형식", available_export_formats(), format_func=export_format_label, key="summary_export_format"
+            )
+        with col2:
+            st.write("")  # 세로 정렬을 위한 빈 공간
+            st.download_button(
+                label="📥 전체 요약 데이터 다운로드",
+                data=PAYLOAD_CACHE.lazy(
+                    (fingerprint, 'summary_data', summary_format, None, None),
+                    lambda: data_export_content(build_overall_summary_frame(candidate_index), summary_format)
+                ),
+                file_name=export_file_name("interview_overall_summary", summary_format),
+                mime=export_mime(summary_format),
+                on_click="ignore"
+            )
+
+        col1, col2, col3 = st.columns([1, 1, 2])
+        with col1:
+            overall_report_format = st.radio("리포트 양식 선택", REPORT_FORMATS, horizontal=True, key="overall_report_format")
+        with col2:
+            # 후보자가 많으면 메모리에 전체 워크북을 만들지 않는 스트리밍 방식을 기본으로 선택합니다.
+            engines = list(REPORT_ENGINES)
+            default_engine = 'streaming' if len(candidate_index) >= STREAMING_ENGINE_MIN_CANDIDATES else 'openpyxl'
+            overall_report_engine = st.radio(
+                "리포트 생성 방식", engines, index=engines.index(default_engine), format_func=REPORT_ENGINES.get,
+                horizontal=True, key="overall_report_engine"
+            )
+        with col3:
+            # 후보자가 많으면 생성에 시간이 걸리므로 백그라운드에서 만들고, 완료되면 다운로드 버튼을 표시합니다.
+            background_download(
+                'overall', (fingerprint, 'overall', (overall_report_format, overall_report_engine), None, None),
+                "📥 전체 리포트", f"interview_overall_{overall_report_format}.xlsx", "application/vnd.ms-excel",
+                generate_overall_report_file_content, candidate_index, overall_report_format, overall_report_engine
+            )
+            # 후보자별 리포트 파일을 프로세스 풀에서 병렬로 만들어 ZIP 하나로 내려받습니다.
+            background_download(
+                'individual_zip', (fingerprint, 'individual_zip', overall_report_format, None, None),
+                "📦 개별 리포트 일괄 (ZIP)", f"interview_individual_{overall_report_format}.zip", "application/zip",
+                export_individual_reports_zip, candidate_index, overall_report_format
+            )
+
+
 # --- Streamlit App Main UI ---
 
 st.title("📑 면접 심사 결과 리포트 생성기")
@@ -400,6 +491,25 @@ st.markdown("""
 4.  **전체 리포트**: '전체 후보자 리포트' 탭에서 모든 후보자의 결과를 요약하고 전체 리포트를 다운로드하세요.
 """)
 
+with st.sidebar:
+    st.header("⚙️ 설정")
+    fast_reader = st.toggle(
+        "빠른 읽기 모드",
+        help="'평가표' 시트의 값만 읽기 전용으로 읽습니다. 서식이 많은 대용량 파일의 읽기 시간과 메모리를 줄입니다."
+    )
+    project_columns = st.toggle(
+        "필요한 컬럼만 읽기",
+        disabled=not fast_reader,
+        help="점수 항목, 총점, 성명, 심사위원 성명, 합격여부, 총평 컬럼만 읽습니다. 통합 결과에 다른 컬럼은 표시되지 않습니다."
+    )
+    show_diagnostics = st.toggle(
+        "진단 패널",
+        help="파일 읽기, 전처리, 검증, 요약, 리포트 생성 단계별 실행 시간과 최대 메모리 사용량을 표시합니다."
+    )
+    st.caption(f"채점 기준: {SCORING_SCHEMA.describe()}")
+
+diagnostics_recorder = session_recorder(show_diagnostics)
+
 uploaded_files = st.file_uploader(
     "면접 심사표 엑셀 파일을 업로드하세요.",
     type=['xlsx', 'xls'],
@@ -408,121 +518,24 @@ uploaded_files = st.file_uploader(
 
 if uploaded_files:
     # 데이터 로드 및 처리
-    processed_df = load_and_process_data(uploaded_files)
-
-    if not processed_df.empty:
-        # 탭 생성
+    snapshot = load_and_process_data(
+        uploaded_files,
+        reader='fast' if fast_reader else 'pandas',
+        usecols=tuple(REQUIRED_COLS) if fast_reader and project_columns else None
+    )
+
+    if snapshot is not None and not snapshot.frame.empty:
+        # 탭 생성 (탭마다 독립적으로 다시 실행되는 프래그먼트)
         tab1, tab2, tab3 = st.tabs(["📊 통합 결과 확인", "📄 후보자 리포트", "🗂️ 전체 후보자 리포트"])
-
         with tab1:
-            st.header("통합 심사 결과")
-
-            # --- 데이터 검증 ---
-            st.subheader("데이터 검증")
-            evaluation_counts = processed_df.groupby('성명')['성명'].count()
-            invalid_candidates = evaluation_counts[evaluation_counts != 3]
-
-            if not invalid_candidates.empty:
-                st.error("⚠️ **평가 횟수 오류**: 아래 후보자들은 3회의 평가를 받지 않았습니다.")
-                st.dataframe(invalid_candidates.rename("평가 횟수"), use_container_width=True)
-            else:
-                st.success("✅ 모든 후보자가 3회의 평가를 받았습니다.")
-            
-            st.markdown("---")
-            
-            # --- 합격여부 결과 검증 ---
-            st.subheader("합격/불합격 결과 검증")
-            if 'Result_Mismatch' in processed_df.columns:
-                mismatch_df = processed_df[processed_df['Result_Mismatch'] == True]
-                
-                if not mismatch_df.empty:
-                    st.error("⚠️ **결과 불일치 오류**: 원본 파일의 합격 여부와 계산된 결과가 다릅니다.")
-                    display_cols = ['성명', '심사위원 성명', '총점', '합격여부(Pass/Fail)', 'Reviewer_Result']
-                    # 표시할 컬럼이 데이터프레임에 있는지 확인
-                    display_cols = [col for col in display_cols if col in mismatch_df.columns]
-                    st.dataframe(mismatch_df[display_cols], use_container_width=True)
-                else:
-                    st.success("✅ 모든 데이터의 합격 여부가 계산 결과와 일치합니다.")
-            
-            st.markdown("---")
-
-
-            # --- 데이터 필터링 ---
-            st.subheader("데이터 필터링 및 조회")
-            
-            # 필터링 UI
-            col1, col2 = st.columns(2)
-            with col1:
-                candidate_names = sorted(processed_df['성명'].unique())
-                selected_candidates = st.multiselect("후보자 선택", options=candidate_names, placeholder="모든 후보자 보기")
-            with col2:
-                # Reviewer_Result 컬럼이 존재하는 경우에만 필터 표시
-                if 'Reviewer_Result' in processed_df.columns:
-                    result_options = ['전체'] + processed_df['Reviewer_Result'].unique().tolist()
-                    selected_result = st.selectbox("심사위원 평가 결과 선택", options=result_options, index=0)
-                else:
-                    selected_result = '전체'
-
-
-            # 필터링 로직
-            filtered_df = processed_df.copy()
-            if selected_candidates:
-                filtered_df = filtered_df[filtered_df['성명'].isin(selected_candidates)]
-            if selected_result != '전체' and 'Reviewer_Result' in filtered_df.columns:
-                filtered_df = filtered_df[filtered_df['Reviewer_Result'] == selected_result]
-
-            st.dataframe(filtered_df.drop(columns=['Result_Mismatch'], errors='ignore'), use_container_width=True, hide_index=True)
-
-            # --- 다운로드 버튼 ---
-            st.download_button(
-                label="📥 엑셀 파일로 다운로드",
-                data=to_excel(filtered_df.drop(columns=['Result_Mismatch'], errors='ignore')),
-                file_name="interview_results_combined.xlsx",
-                mime="application/vnd.ms-excel"
-            )
-
+            results_tab(snapshot)
         with tab2:
-            st.header("후보자별 상세 리포트")
-            
-            candidate_list = sorted(processed_df['성명'].unique())
-            selected_candidate = st.selectbox(
-                "리포트를 확인할 후보자를 선택하세요.",
-                options=candidate_list,
-                index=None,
-                placeholder="후보자를 선택하세요"
-            )
-
-            if selected_candidate:
-                generate_candidate_report(selected_candidate, processed_df)
-        
+            candidate_tab(snapshot)
         with tab3:
-            st.header("전체 후보자 리포트 요약")
-
-            summary_data = []
-            candidate_names = sorted(processed_df['성명'].unique())
-            for name in candidate_names:
-                candidate_df = processed_df[processed_df['성명'] == name]
-                is_final_pass = all(candidate_df['Reviewer_Result'] == 'Pass')
-                final_result = "Pass" if is_final_pass else "Fail"
-                avg_scores = candidate_df[list(CATEGORY_COLS.keys()) + ['총점']].mean()
-                summary_row = {'성명': name, '최종 결과': final_result}
-                summary_row.update(avg_scores)
-                summary_data.append(summary_row)
-            
-            summary_df = pd.DataFrame(summary_data)
-            st.dataframe(summary_df.style.format("{:.2f}", subset=list(CATEGORY_COLS.keys()) + ['총점']), use_container_width=True, hide_index=True)
-            
-            col1, col2 = st.columns([1, 3])
-            with col1:
-                overall_report_format = st.radio("리포트 양식 선택", REPORT_FORMATS, horizontal=True, key="overall_report_format")
-            with col2:
-                st.download_button(
-                    label="📥 전체 리포트 다운로드",
-                    data=generate_overall_report_file_content(processed_df, overall_report_format),
-                    file_name=f"interview_overall_{overall_report_format}.xlsx",
-                    mime="application/vnd.ms-excel"
-                )
-
+            summary_tab(snapshot)
 
 else:
     st.info("심사 결과 분석을 시작하려면 엑셀 파일을 업로드해주세요.")
+
+if show_diagnostics:
+    render_diagnostics_panel(diagnostics_recorder)
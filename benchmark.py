@@ -0,0 +1,266 @@
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import openpyxl
+import pandas as pd
+
+from aggregates import build_candidate_index
+from dataset import EvaluationDataset, build_snapshot
+from frame_cache import DiskFrameCache
+from ingest import PARSED_FILE_CACHE
+from processing import PROCESSED_FILE_CACHE, REPORT_SCORE_COLS, load_evaluation_files, load_processed_files
+from reports import (
+    REPORT_ENGINES, REPORT_FORMATS, build_overall_summary_frame, generate_overall_report_file_content,
+    generate_report_file_content
+)
+from synthetic_workbooks import generate_evaluation_files
+from validation import validate_evaluations
+
+# --- Constants ---
+DEFAULT_SIZES = [10, 1000, 10000]
+DEFAULT_BASELINE = Path('benchmark_baseline.json')
+# 기준 대비 이 비율 이상 느려지거나 메모리를 더 쓰면 회귀로 판단합니다.
+DEFAULT_TOLERANCE = 0.25
+# 이보다 작은 차이는 측정 오차로 보고 무시합니다.
+MIN_SECONDS_DELTA = 0.02
+MIN_PEAK_MB_DELTA = 1.0
+# 개별 리포트는 후보자 몇 명만 골라 한 건당 평균 시간을 잽니다.
+INDIVIDUAL_REPORT_SAMPLES = 5
+# 표준(openpyxl) 엔진의 전체 리포트는 전체 워크북을 메모리에 유지하므로 이 이하에서만 측정합니다.
+STANDARD_OVERALL_MAX_CANDIDATES = 500
+
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+
+def measure(func, repeat, track_memory, setup=None):
+    """
+    func()를 repeat번 실행하여 가장 빠른 시간(초)을 잽니다.
+    track_memory이면 tracemalloc을 켠 상태로 한 번 더 실행하여 최대 메모리 사용량(MB)을 잽니다.
+    setup이 주어지면 매 실행 전에 (측정 없이) 호출하고, 그 결과를 func에 인자로 전달합니다.
+    """
+    def prepare():
+        return (setup(),) if setup is not None else ()
+
+    timings = []
+    for _ in range(repeat):
+        args = prepare()
+        gc.collect()
+        started = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - started)
+    result = {'seconds': min(timings), 'median_seconds': statistics.median(timings)}
+
+    if track_memory:
+        args = prepare()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result['peak_mb'] = peak / (1024 * 1024)
+    return result
+
+
+def sample_candidates(names, n_samples=INDIVIDUAL_REPORT_SAMPLES):
+    """처음, 중간, 마지막이 고르게 섞이도록 후보자를 고릅니다."""
+    if len(names) <= n_samples:
+        return list(names)
+    step = (len(names) - 1) / (n_samples - 1)
+    return [names[round(i * step)] for i in range(n_samples)]
+
+
+def benchmark_size(n_candidates, report_format, engines, repeat, track_memory, max_workers=None, seed=0):
+    """후보자 n_candidates명 데이터셋에서 단계별 시간과 메모리를 측정합니다. {단계 이름: 측정값}을 반환합니다."""
+    log(f"[{n_candidates}명] 가상 평가표 생성 중...")
+    files = generate_evaluation_files(n_candidates, seed=seed)
+    results = {}
+
+    def run(stage, func, setup=None):
+        log(f"[{n_candidates}명] {stage}")
+        results[stage] = measure(func, repeat, track_memory, setup)
+
+    def clear_memory_caches():
+        PARSED_FILE_CACHE.clear()
+        PROCESSED_FILE_CACHE.clear()
+
+    def load():
+        # 매번 파싱부터 측정하도록 파싱/전처리 결과 캐시를 비우고 디스크 캐시도 사용하지 않습니다.
+        clear_memory_caches()
+        return load_evaluation_files(files, max_workers=max_workers, disk_cache=None)
+
+    # 전체 파일을 한 번에 읽는 경우 (CLI와 같은 경로)
+    run('load_and_process_data', load)
+    all_df = load()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        disk_cache = DiskFrameCache(cache_dir)
+        clear_memory_caches()
+        load_evaluation_files(files, max_workers=max_workers, disk_cache=disk_cache)
+
+        def load_from_disk_cache():
+            # 서버 재시작 후처럼 메모리 캐시는 비어 있고 디스크 캐시만 채워진 경우
+            clear_memory_caches()
+            return load_evaluation_files(files, max_workers=max_workers, disk_cache=disk_cache)
+
+        run('load_from_disk_cache', load_from_disk_cache)
+
+    def reload_cached():
+        # 파싱 캐시가 채워진 상태에서 전체 파일을 다시 전처리, 통합하고 집계/검증하는 경우 (dataset_late_file의 비교 기준)
+        PROCESSED_FILE_CACHE.clear()
+        build_snapshot(load_processed_files(files, max_workers=max_workers, disk_cache=None))
+
+    run('reload_cached', reload_cached)
+
+    def dataset_without_last_file():
+        # 늦게 올라온 파일은 파싱 캐시에만 있고 전처리 결과 캐시에는 없는 상태로 측정합니다.
+        PROCESSED_FILE_CACHE.clear()
+        dataset = EvaluationDataset(max_workers=max_workers, disk_cache=None)
+        dataset.sync(files[:-1])
+        dataset.snapshot()
+        return dataset
+
+    def add_late_file(dataset):
+        # 앱의 세션 데이터셋에 마지막 심사위원 파일이 늦게 올라온 경우 (파싱 캐시는 이미 채워진 상태)
+        dataset.sync(files)
+        dataset.snapshot()
+
+    run('dataset_late_file', add_late_file, setup=dataset_without_last_file)
+
+    def build_summary():
+        index = build_candidate_index(all_df, REPORT_SCORE_COLS)
+        build_overall_summary_frame(index)
+
+    run('build_summary', build_summary)
+    run('validate_evaluations', lambda: validate_evaluations(all_df))
+    index = build_candidate_index(all_df, REPORT_SCORE_COLS)
+
+    samples = sample_candidates(index.names)
+    for engine in engines:
+        def individual_reports():
+            for name in samples:
+                generate_report_file_content(name, index, report_format, engine)
+
+        run(f'generate_report_file_content[{engine}]', individual_reports)
+        # 한 건당 시간으로 환산합니다.
+        for key in ('seconds', 'median_seconds'):
+            results[f'generate_report_file_content[{engine}]'][key] /= len(samples)
+
+        if engine == 'openpyxl' and n_candidates > STANDARD_OVERALL_MAX_CANDIDATES:
+            log(f"[{n_candidates}명] generate_overall_report_file_content[{engine}] 건너뜀 (후보자 {STANDARD_OVERALL_MAX_CANDIDATES}명 초과)")
+            continue
+        run(f'generate_overall_report_file_content[{engine}]',
+            lambda: generate_overall_report_file_content(index, report_format, engine))
+
+    return results
+
+
+def environment_info():
+    return {
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'pandas': pd.__version__,
+        'openpyxl': openpyxl.__version__,
+    }
+
+
+def compare_with_baseline(current, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    현재 결과를 기준 결과와 비교하여 (비교표 행 목록, 회귀 목록)을 반환합니다.
+    시간('seconds')과 최대 메모리('peak_mb')가 tolerance 비율과 최소 차이를 모두 넘으면 회귀로 봅니다.
+    """
+    rows = []
+    regressions = []
+    for size, stages in current['results'].items():
+        base_stages = baseline.get('results', {}).get(size, {})
+        for stage, values in stages.items():
+            base_values = base_stages.get(stage)
+            if base_values is None:
+                continue
+            for metric, min_delta in (('seconds', MIN_SECONDS_DELTA), ('peak_mb', MIN_PEAK_MB_DELTA)):
+                if metric not in values or metric not in base_values:
+                    continue
+                value, base_value = values[metric], base_values[metric]
+                ratio = value / base_value if base_value else float('inf')
+                regressed = ratio > 1 + tolerance and value - base_value > min_delta
+                rows.append((size, stage, metric, base_value, value, ratio, regressed))
+                if regressed:
+                    regressions.append(f"{size}명 {stage} {metric}: {base_value:.3f} -> {value:.3f} ({ratio:.2f}배)")
+    return rows, regressions
+
+
+def format_results(results):
+    lines = [f"{'후보자':>7}  {'단계':<48} {'시간(s)':>10} {'최대 메모리(MB)':>16}"]
+    for size, stages in results.items():
+        for stage, values in stages.items():
+            peak = f"{values['peak_mb']:.1f}" if 'peak_mb' in values else '-'
+            lines.append(f"{size:>7}  {stage:<48} {values['seconds']:>10.4f} {peak:>16}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="가상 평가표로 파일 읽기, 요약 생성, 리포트 생성 단계의 시간과 메모리를 측정하고 기준 결과와 비교합니다."
+    )
+    parser.add_argument('-n', '--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="측정할 후보자 수 목록 (기본값: 10 1000 10000)")
+    parser.add_argument('-f', '--format', choices=REPORT_FORMATS, default=REPORT_FORMATS[0], help="리포트 양식")
+    parser.add_argument('-e', '--engines', choices=list(REPORT_ENGINES), nargs='+', default=list(REPORT_ENGINES), help="측정할 리포트 생성 방식")
+    parser.add_argument('-r', '--repeat', type=int, default=3, help="단계별 반복 횟수 (가장 빠른 시간을 기록, 기본값: 3)")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="파일 읽기 병렬 작업 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument('--no-memory', action='store_true', help="메모리 측정(tracemalloc 실행)을 생략합니다.")
+    parser.add_argument('-o', '--output', type=Path, help="측정 결과를 JSON으로 저장할 경로")
+    parser.add_argument('-b', '--baseline', type=Path, default=DEFAULT_BASELINE, help=f"비교할 기준 결과 JSON (기본값: {DEFAULT_BASELINE})")
+    parser.add_argument('--save-baseline', action='store_true', help="측정 결과를 기준 결과(--baseline 경로)로 저장합니다.")
+    parser.add_argument('-t', '--tolerance', type=float, default=DEFAULT_TOLERANCE, help=f"회귀로 판단하는 증가 비율 (기본값: {DEFAULT_TOLERANCE})")
+    args = parser.parse_args(argv)
+
+    current = {'environment': environment_info(), 'format': args.format, 'results': {}}
+    for size in args.sizes:
+        current['results'][str(size)] = benchmark_size(
+            size, args.format, args.engines, args.repeat, not args.no_memory, max_workers=args.workers
+        )
+    print(format_results(current['results']))
+
+    if args.output:
+        args.output.write_text(json.dumps(current, ensure_ascii=False, indent=2), encoding='utf-8')
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(current, ensure_ascii=False, indent=2), encoding='utf-8')
+        log(f"기준 결과를 저장했습니다: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        log(f"기준 결과 파일이 없어 비교를 생략합니다: {args.baseline} (--save-baseline으로 생성)")
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+    if baseline.get('format') != args.format:
+        log(f"기준 결과의 리포트 양식({baseline.get('format')})이 달라 비교를 생략합니다.")
+        return 0
+
+    rows, regressions = compare_with_baseline(current, baseline, args.tolerance)
+    print(f"\n기준 결과 비교 ({baseline['environment']['date']}, 허용 증가율 {args.tolerance:.0%})")
+    for size, stage, metric, base_value, value, ratio, regressed in rows:
+        mark = '  ⚠️ 회귀' if regressed else ''
+        print(f"{size:>7}  {stage:<48} {metric:<8} {base_value:>10.4f} -> {value:>10.4f} ({ratio:.2f}배){mark}")
+    if regressions:
+        log("성능 회귀가 감지되었습니다:")
+        for regression in regressions:
+            log(f"  - {regression}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,159 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from dataset import build_snapshot
+from diagnostics import Recorder, activate, configure_json_logging
+from exports import available_export_formats, export_file_name, write_data_export
+from ingest import READERS
+from processing import (
+    FILE_ERROR_HINT, REQUIRED_COLS, EvaluationFileError, export_frame, load_processed_files
+)
+from reports import (
+    REPORT_ENGINES, REPORT_FORMATS, build_overall_summary_frame, export_individual_reports_zip,
+    generate_overall_report_file_content, iter_individual_reports, to_excel
+)
+from scoring import SCORING_SCHEMA
+from validation import RULE_LABELS, count_violations, has_errors
+
+# 입력 디렉터리에서 읽는 파일 (웹 업로드와 같은 확장자)
+INPUT_PATTERNS = ('*.xlsx', '*.xls')
+COMBINED_FILE_NAME = 'interview_results_combined.xlsx'
+# --data-format으로 추가 저장하는 데이터 파일 이름 (확장자 제외)
+COMBINED_DATA_STEM = 'interview_results_combined'
+SUMMARY_DATA_STEM = 'interview_overall_summary'
+# 검증 규칙 위반 목록 (위반이 있을 때만 생성, 엑셀에서 바로 열리도록 UTF-8 BOM 포함)
+VIOLATIONS_FILE_NAME = 'validation_violations.csv'
+
+
+def log(message):
+    """진행 상황을 표준 오류로 출력합니다. (표준 출력은 결과 파일 경로 출력용)"""
+    print(message, file=sys.stderr, flush=True)
+
+
+def find_input_files(input_dir: Path):
+    """입력 디렉터리의 평가표 파일 목록을 이름순으로 반환합니다. (엑셀 임시 파일 '~$*'는 제외)"""
+    paths = {path for pattern in INPUT_PATTERNS for path in input_dir.glob(pattern)}
+    return sorted(path for path in paths if not path.name.startswith('~$'))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="면접 심사표(평가표) 엑셀 파일들을 취합하여 통합 결과, 전체 리포트, 후보자별 리포트를 생성합니다."
+    )
+    parser.add_argument('input_dir', type=Path, help="'평가표' 시트가 포함된 엑셀 파일들이 있는 디렉터리")
+    parser.add_argument('-o', '--output-dir', type=Path, default=Path('output'), help="결과 파일을 저장할 디렉터리 (기본값: output)")
+    parser.add_argument('-f', '--format', choices=REPORT_FORMATS, default=REPORT_FORMATS[0], help="리포트 양식")
+    parser.add_argument('-e', '--engine', choices=list(REPORT_ENGINES), default='streaming', help="리포트 생성 방식 (기본값: streaming)")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="병렬 작업 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument('--reader', choices=READERS, default='pandas', help="엑셀 읽기 방식 (fast: '평가표' 시트만 읽기 전용으로 스트리밍)")
+    parser.add_argument('--required-columns-only', action='store_true', help="fast 읽기 방식에서 점수 계산과 리포트에 필요한 컬럼만 읽습니다.")
+    parser.add_argument(
+        '-d', '--data-format', choices=available_export_formats(), nargs='+', default=[],
+        help="통합 결과와 '전체 요약'을 이 형식의 데이터 파일로도 저장합니다. (예: -d csv parquet)"
+    )
+    parser.add_argument('--zip', action='store_true', help="후보자별 리포트를 디렉터리 대신 ZIP 파일 하나로 저장합니다.")
+    parser.add_argument('--skip-individual', action='store_true', help="후보자별 리포트를 생성하지 않습니다.")
+    parser.add_argument('--strict', action='store_true', help="데이터 검증 오류가 있으면 종료 코드 2로 끝냅니다. (총평 누락은 경고로만 표시)")
+    parser.add_argument('--diagnostics', action='store_true', help="단계별 실행 시간과 메모리를 JSON 로그로 표준 오류에 출력합니다.")
+    parser.add_argument('-q', '--quiet', action='store_true', help="오류 외의 진행 상황을 출력하지 않습니다.")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.required_columns_only and args.reader != 'fast':
+        log("--required-columns-only 옵션은 --reader fast와 함께 사용해야 합니다.")
+        return 1
+
+    input_files = find_input_files(args.input_dir)
+    if not input_files:
+        log(f"'{args.input_dir}'에 엑셀 파일이 없습니다.")
+        return 1
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    status = (lambda message: None) if args.quiet else log
+    if args.diagnostics:
+        configure_json_logging()
+        activate(Recorder(session='cli', log_json=True))
+    started = time.perf_counter()
+
+    # 1. 파일 읽기 및 전처리
+    status(f"[1/4] 평가표 파일 {len(input_files)}개를 읽는 중... (채점 기준: {SCORING_SCHEMA.describe()})")
+    try:
+        reader, usecols = args.reader, REQUIRED_COLS if args.required_columns_only else None
+        processed_files = load_processed_files(
+            [(path.name, path.read_bytes()) for path in input_files],
+            reader=reader,
+            usecols=usecols,
+            max_workers=args.workers,
+        )
+    except EvaluationFileError as e:
+        log(str(e))
+        log(FILE_ERROR_HINT)
+        return 1
+    # 통합, 집계, 검증은 앱과 같은 경로(파일별 기여분을 더하는 build_snapshot)를 사용합니다.
+    snapshot = build_snapshot(processed_files, reader, usecols)
+    all_df = snapshot.frame
+    index = snapshot.index
+    status(f"      평가 {len(all_df)}건, 후보자 {len(index)}명")
+
+    # 2. 데이터 검증
+    status("[2/4] 데이터 검증 중...")
+    invalid_candidates = snapshot.invalid_counts
+    mismatch_df = snapshot.mismatches
+    for name, count in invalid_candidates.items():
+        log(f"      ⚠️ 평가 횟수 오류: {name} ({count}회)")
+    for row in mismatch_df.itertuples(index=False):
+        log(f"      ⚠️ 결과 불일치: {', '.join(str(value) for value in row)}")
+    violations = snapshot.violations
+    for rule_name, count in count_violations(violations).items():
+        if count:
+            log(f"      ⚠️ {RULE_LABELS[rule_name]}: {count}건")
+    has_validation_errors = has_errors(violations)
+
+    # 3. 통합 결과 및 전체 리포트
+    status("[3/4] 통합 결과와 전체 리포트를 생성하는 중...")
+    outputs = [args.output_dir / COMBINED_FILE_NAME, args.output_dir / f"interview_overall_{args.format}.xlsx"]
+    outputs[0].write_bytes(to_excel(export_frame(all_df)))
+    outputs[1].write_bytes(generate_overall_report_file_content(index, args.format, args.engine))
+    if args.data_format:
+        combined_df = export_frame(all_df)
+        summary_df = build_overall_summary_frame(index)
+        for data_format in args.data_format:
+            for stem, df in ((COMBINED_DATA_STEM, combined_df), (SUMMARY_DATA_STEM, summary_df)):
+                outputs.append(args.output_dir / export_file_name(stem, data_format))
+                write_data_export(df, data_format, outputs[-1])
+    if not violations.empty:
+        outputs.append(args.output_dir / VIOLATIONS_FILE_NAME)
+        write_data_export(violations, 'csv', outputs[-1])
+
+    # 4. 후보자별 리포트
+    if args.skip_individual:
+        status("[4/4] 후보자별 리포트 생성을 건너뜁니다.")
+    else:
+        status(f"[4/4] 후보자별 리포트 {len(index)}개를 생성하는 중...")
+
+        def progress(done, total):
+            status(f"      {done}/{total}")
+
+        if args.zip:
+            zip_path = args.output_dir / f"interview_individual_{args.format}.zip"
+            with open(zip_path, 'wb') as output:
+                export_individual_reports_zip(index, args.format, output, args.engine, args.workers, progress)
+            outputs.append(zip_path)
+        else:
+            individual_dir = args.output_dir / 'individual'
+            individual_dir.mkdir(exist_ok=True)
+            for file_name, content in iter_individual_reports(index, args.format, args.engine, args.workers, progress):
+                (individual_dir / file_name).write_bytes(content)
+            outputs.append(individual_dir)
+
+    for path in outputs:
+        print(path)
+    status(f"완료 ({time.perf_counter() - started:.1f}초)")
+    return 2 if args.strict and has_validation_errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,228 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from aggregates import CandidateAggregator, build_row_filter_index, file_contribution
+from diagnostics import stage
+from frame_cache import DISK_FRAME_CACHE
+from ingest import file_digest
+from processing import (
+    EXPECTED_EVALUATIONS, REPORT_SCORE_COLS, combine_processed_files, evaluation_fingerprint, find_result_mismatches,
+    load_processed_files, unique_file_names
+)
+from validation import VALIDATION_RULES, find_violations, violation_frame
+
+# 한 시점의 데이터셋 조회 결과. 모든 필드는 읽기 전용으로 공유됩니다.
+DatasetSnapshot = namedtuple(
+    'DatasetSnapshot', ['fingerprint', 'frame', 'index', 'filters', 'invalid_counts', 'mismatches', 'violations']
+)
+
+# 행 단위('row') 규칙은 파일별로, 후보자 단위('candidate') 규칙은 후보자별로 검사합니다.
+ROW_RULES = [rule for rule in VALIDATION_RULES if rule.scope == 'row']
+CANDIDATE_RULES = [rule for rule in VALIDATION_RULES if rule.scope == 'candidate']
+_RULE_CODES = {rule.name: code for code, rule in enumerate(VALIDATION_RULES)}
+_ROW_RULE_CODES = np.array([_RULE_CODES[rule.name] for rule in ROW_RULES], dtype=np.intp)
+_CANDIDATE_RULE_CODES = np.array([_RULE_CODES[rule.name] for rule in CANDIDATE_RULES], dtype=np.intp)
+
+# 파일 하나의 행 단위 위반 항목 (labels: 파일 안 index 값, columns: 컬럼 이름, rules: VALIDATION_RULES의 규칙 번호)
+_FileViolations = namedtuple('_FileViolations', ['labels', 'columns', 'rules'])
+# 후보자 단위 위반 항목 표의 컬럼 (file: 파일 키, label: 파일 안 index 값)
+_CANDIDATE_VIOLATION_COLUMNS = ['file', 'label', 'column', 'rule', '성명']
+
+
+def _empty_candidate_violations():
+    return pd.DataFrame({col: pd.Series(dtype=np.int64 if col in ('label', 'rule') else object)
+                         for col in _CANDIDATE_VIOLATION_COLUMNS})
+
+
+class EvaluationDataset:
+    """
+    심사위원 파일을 추가/교체/삭제하면서 집계와 검증 상태를 파일/후보자 단위로 갱신하는 데이터셋입니다.
+    - 파일마다 한 번만 전처리하고, 후보자별 집계는 파일별 기여분을 더하고 빼는 CandidateAggregator로 유지합니다.
+    - 결과 불일치와 행 단위 검증 규칙은 파일별로 보관하고, 후보자 단위 검증 규칙(평가 횟수, 중복 평가)과 평가 횟수 오류는
+      바뀐 파일에 나오는 후보자만 다시 검사합니다.
+    - 통합 데이터프레임은 보관하지 않고, snapshot()을 만들 때 파일별 전처리 결과를 이어 붙입니다.
+    - 파일은 처음 추가된 순서를 유지하며, 같은 키(파일명)의 파일은 제자리에서 교체합니다.
+    - CLI의 build_snapshot도 같은 방식으로 파일을 더하므로 앱과 CLI의 결과가 같습니다.
+    """
+
+    def __init__(self, reader='pandas', usecols=None, score_cols=REPORT_SCORE_COLS,
+                 expected_evaluations=EXPECTED_EVALUATIONS, max_workers=None, disk_cache=DISK_FRAME_CACHE):
+        self.reader = reader
+        self.usecols = tuple(usecols) if usecols is not None else None
+        self.score_cols = list(score_cols)
+        self.expected_evaluations = expected_evaluations
+        self.max_workers = max_workers
+        self.disk_cache = disk_cache
+        self._clear()
+
+    def _clear(self):
+        self._files = {}                 # 파일 키 -> ProcessedFile (파일 순서)
+        self._aggregator = CandidateAggregator(self.score_cols, self.expected_evaluations)
+        self._row_violations = {}        # 파일 키 -> _FileViolations
+        self._mismatch_labels = {}       # 파일 키 -> 결과 불일치 행의 파일 안 index 값 배열
+        self._candidate_violations = _empty_candidate_violations()
+
+    @property
+    def options(self):
+        return self.reader, self.usecols
+
+    @property
+    def file_names(self):
+        return list(self._files)
+
+    @property
+    def fingerprint(self):
+        """load_evaluation_files와 같은 방식의 데이터셋 지문 (파일명 + 파일 내용 해시 + 읽기 옵션)"""
+        return evaluation_fingerprint(
+            list(self._files), [processed.digest for processed in self._files.values()], self.reader, self.usecols
+        )
+
+    def __len__(self):
+        return sum(len(processed.df) for processed in self._files.values())
+
+    def sync(self, files, digests=None):
+        """
+        (파일명, bytes) 목록과 같아지도록 데이터셋을 갱신하고, 추가/변경/삭제된 파일 키 목록을 반환합니다.
+        - 새 파일과 내용이 바뀐 파일만 읽어 전처리하고, 그 파일에 나오는 후보자의 집계와 검증 상태만 다시 계산합니다.
+          (전처리 결과는 processing.PROCESSED_FILE_CACHE에서 다른 세션과 공유)
+        - 파일 목록이 그대로이면 아무것도 다시 계산하지 않습니다.
+        - digests에 파일 내용 해시 목록을 주면 해시를 다시 계산하지 않습니다.
+        - 읽지 못한 파일이 있으면 데이터셋을 바꾸지 않고 EvaluationFileError를 발생시킵니다.
+        """
+        files = list(files)
+        keys = unique_file_names([name for name, _ in files])
+        digests = list(digests) if digests is not None else [file_digest(data) for _, data in files]
+        if list(zip(keys, digests)) == [(key, processed.digest) for key, processed in self._files.items()]:
+            return []
+
+        changed = [
+            (key, data, digest) for key, digest, (_, data) in zip(keys, digests, files)
+            if key not in self._files or self._files[key].digest != digest
+        ]
+        with stage('dataset.sync', files=len(files), changed=len(changed)):
+            processed_files = load_processed_files(
+                [(key, data) for key, data, _ in changed], reader=self.reader, usecols=self.usecols,
+                max_workers=self.max_workers, disk_cache=self.disk_cache, digests=[digest for _, _, digest in changed]
+            )
+            removed = [key for key in self._files if key not in set(keys)]
+            self._update(processed_files, removed)
+            if list(self._files) != keys:
+                # 남아 있는 파일의 순서가 바뀐 경우에는 새 순서로 처음부터 다시 더합니다. (이미 전처리된 결과 사용)
+                ordered = [self._files[key] for key in keys]
+                self._clear()
+                self._update(ordered)
+        return [processed.name for processed in processed_files] + removed
+
+    def _update(self, put=(), remove=()):
+        """전처리된 파일을 추가/교체(put)하고 파일 키를 삭제(remove)한 뒤, 기여분이 바뀐 후보자만 다시 검증합니다."""
+        put = list(put)
+        for key in remove:
+            del self._files[key], self._row_violations[key], self._mismatch_labels[key]
+        for processed in put:
+            self._files[processed.name] = processed
+            self._row_violations[processed.name] = self._file_violations(processed.df)
+            self._mismatch_labels[processed.name] = processed.df.index.to_numpy(dtype=np.int64)[
+                processed.df['Result_Mismatch'].to_numpy(dtype=bool)
+            ]
+        changed = self._aggregator.update(
+            put=[(processed.name, file_contribution(processed.df, self.score_cols)) for processed in put],
+            remove=remove,
+        )
+        self._revalidate_candidates(changed)
+
+    def _file_violations(self, df):
+        positions, columns, rule_codes = find_violations(df, ROW_RULES, expected_evaluations=self.expected_evaluations)
+        return _FileViolations(df.index.to_numpy(dtype=np.int64)[positions], columns, _ROW_RULE_CODES[rule_codes])
+
+    def _revalidate_candidates(self, names):
+        """후보자 단위 규칙을 주어진 후보자의 모든 행(후보자가 나오는 모든 파일)에만 다시 적용합니다."""
+        if not names:
+            return
+        keep = ~self._candidate_violations['성명'].isin(names).to_numpy()
+        frames, file_keys, labels = [], [], []
+        for key in dict.fromkeys(key for name in names for key in self._aggregator.candidate_files(name)):
+            part = self._aggregator.part(key)
+            rows = np.concatenate([part.local_positions[name] for name in part.names if name in names])
+            df = self._files[key].df
+            frames.append(df.iloc[rows])
+            file_keys.append(np.full(len(rows), key, dtype=object))
+            labels.append(df.index.to_numpy(dtype=np.int64)[rows])
+
+        kept = self._candidate_violations[keep]
+        if not frames:
+            self._candidate_violations = kept.reset_index(drop=True)
+            return
+        batch = pd.concat(frames, ignore_index=True)
+        positions, columns, rule_codes = find_violations(
+            batch, CANDIDATE_RULES, expected_evaluations=self.expected_evaluations
+        )
+        found = pd.DataFrame({
+            'file': np.concatenate(file_keys)[positions],
+            'label': np.concatenate(labels)[positions],
+            'column': columns,
+            'rule': _CANDIDATE_RULE_CODES[rule_codes],
+            '성명': batch['성명'].to_numpy(dtype=object)[positions],
+        })
+        self._candidate_violations = pd.concat([kept, found], ignore_index=True) if len(kept) else found
+
+    def index(self):
+        return self._aggregator.index()
+
+    def snapshot(self) -> DatasetSnapshot:
+        """
+        현재 데이터셋의 통합 데이터프레임, 집계 구조, 필터 인덱스, 검증 결과를 반환합니다. (세션 간 공유용)
+        통합 데이터프레임은 파일별 전처리 결과를 이어 붙여 만들며, 데이터셋은 반환한 조회 결과를 보관하지 않습니다.
+        """
+        with stage('dataset.snapshot', files=len(self._files)):
+            processed_files = list(self._files.values())
+            frame = combine_processed_files(processed_files, self.reader, self.usecols)
+            starts = dict(zip(self._files, np.cumsum([0] + [processed.source_rows for processed in processed_files])))
+            index = self._aggregator.index()
+            return DatasetSnapshot(
+                self.fingerprint, frame, index, build_row_filter_index(frame, index),
+                self._aggregator.invalid_counts(), self._mismatches(frame, starts), self._violations(starts)
+            )
+
+    def _mismatches(self, frame, starts):
+        labels = [self._mismatch_labels[key] + starts[key] for key in self._files if len(self._mismatch_labels[key])]
+        if not labels:
+            return find_result_mismatches(frame.iloc[0:0])
+        return find_result_mismatches(frame.loc[np.concatenate(labels)])
+
+    def _violations(self, starts):
+        """파일별 행 단위 위반 항목과 후보자 단위 위반 항목을 합쳐 validate_evaluations와 같은 형식의 표를 만듭니다."""
+        files, local_labels, columns, rule_codes = [], [], [], []
+        for key, found in self._row_violations.items():
+            files.append(np.full(len(found.labels), key, dtype=object))
+            local_labels.append(found.labels)
+            columns.append(found.columns)
+            rule_codes.append(found.rules)
+        candidate_violations = self._candidate_violations
+        files.append(candidate_violations['file'].to_numpy(dtype=object))
+        local_labels.append(candidate_violations['label'].to_numpy(dtype=np.int64))
+        columns.append(candidate_violations['column'].to_numpy(dtype=object))
+        rule_codes.append(candidate_violations['rule'].to_numpy(dtype=np.intp))
+
+        files = np.concatenate(files)
+        local_labels = np.concatenate(local_labels)
+        labels = local_labels + np.array([starts[key] for key in files], dtype=np.int64)
+        rule_codes = np.concatenate(rule_codes)
+        order = np.lexsort((rule_codes, labels))
+        return violation_frame(
+            pd.Index(labels[order]), files[order], local_labels[order] + 1, np.concatenate(columns)[order],
+            rule_codes[order]
+        )
+
+
+def build_snapshot(processed_files, reader='pandas', usecols=None, score_cols=REPORT_SCORE_COLS,
+                   expected_evaluations=EXPECTED_EVALUATIONS) -> DatasetSnapshot:
+    """
+    load_processed_files의 파일별 전처리 결과로 통합 데이터프레임, 집계 구조, 필터 인덱스, 검증 결과를 한 번에 만듭니다.
+    앱의 EvaluationDataset과 같은 집계/검증 경로(파일별 기여분을 더함)를 사용하므로 두 경로의 결과가 같습니다.
+    """
+    dataset = EvaluationDataset(reader, usecols, score_cols, expected_evaluations)
+    with stage('dataset.build', files=len(processed_files)):
+        dataset._update(processed_files)
+    return dataset.snapshot()
@@ -0,0 +1,215 @@
+import functools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from contextvars import ContextVar
+
+# --- Constants ---
+# 이 환경 변수가 '1'이면 모든 세션의 단계별 측정값을 JSON 로그로 출력합니다. (지표 수집용)
+DIAGNOSTICS_ENV = 'INTERVIEW_REPORT_DIAGNOSTICS'
+LOGGER_NAME = 'interview_report.diagnostics'
+# 세션별로 보관하는 최근 측정 기록 수
+MAX_SPANS = 500
+# 단계 실행 중 메모리(RSS)를 읽는 간격 (초)
+MEMORY_SAMPLE_INTERVAL = 0.01
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+_MB = 1024 * 1024
+
+LOGGER = logging.getLogger(LOGGER_NAME)
+
+# 현재 실행(세션 스크립트, CLI 등)에 연결된 Recorder. None이면 측정하지 않습니다.
+_RECORDER = ContextVar('diagnostics_recorder', default=None)
+# 현재 열려 있는 상위 단계 이름 (중첩된 단계 표시용)
+_PARENT = ContextVar('diagnostics_parent', default=None)
+# 측정을 끈 상태에서 stage()가 반환하는 공용 컨텍스트 매니저
+_NULL_STAGE = nullcontext()
+
+
+def current_rss():
+    """현재 프로세스의 메모리 사용량(RSS, bytes)을 반환합니다. 읽을 수 없는 환경에서는 None을 반환합니다."""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class _MemorySampler:
+    """
+    열려 있는 단계가 있는 동안 백그라운드 스레드에서 RSS를 주기적으로 읽어 단계별 최대값을 갱신합니다.
+    - 프로세스 전체에 하나만 띄우며, 열린 단계가 없으면 대기합니다.
+    - RSS는 프로세스 단위이므로 동시에 실행 중인 다른 세션의 사용량도 포함됩니다.
+    """
+
+    def __init__(self, interval=MEMORY_SAMPLE_INTERVAL):
+        self.interval = interval
+        self._watched = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def watch(self, span):
+        with self._lock:
+            self._watched.add(span)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='diagnostics-memory-sampler', daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def unwatch(self, span):
+        with self._lock:
+            self._watched.discard(span)
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            rss = current_rss()
+            with self._lock:
+                if not self._watched:
+                    self._wake.clear()
+                    continue
+                for span in self._watched:
+                    span.sample(rss)
+            time.sleep(self.interval)
+
+
+_SAMPLER = _MemorySampler()
+
+
+class _Stage:
+    """stage()가 반환하는 측정 구간. 종료 시 Recorder에 기록을 남깁니다."""
+
+    def __init__(self, recorder, name, fields):
+        self.recorder = recorder
+        self.name = name
+        self.fields = fields
+        self.peak_rss = None
+
+    def sample(self, rss):
+        if rss is not None and (self.peak_rss is None or rss > self.peak_rss):
+            self.peak_rss = rss
+
+    def __enter__(self):
+        self.parent = _PARENT.get()
+        self._token = _PARENT.set(self.name)
+        self.started_at = time.time()
+        if self.recorder.track_memory:
+            self.rss_start = current_rss()
+            self.sample(self.rss_start)
+            _SAMPLER.watch(self)
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self._started
+        _PARENT.reset(self._token)
+        record = {
+            'event': 'stage',
+            'session': self.recorder.session,
+            'run': self.recorder.run_id,
+            'stage': self.name,
+            'parent': self.parent,
+            'started_at': round(self.started_at, 3),
+            'duration_ms': round(duration * 1000, 3),
+            'status': 'ok' if exc_type is None else 'error',
+        }
+        if self.recorder.track_memory:
+            _SAMPLER.unwatch(self)
+            self.sample(current_rss())
+            if self.rss_start is not None:
+                record['rss_start_mb'] = round(self.rss_start / _MB, 2)
+                record['peak_rss_mb'] = round(self.peak_rss / _MB, 2)
+                record['peak_delta_mb'] = round((self.peak_rss - self.rss_start) / _MB, 2)
+        record.update(self.fields)
+        self.recorder.record(record)
+        return False
+
+
+class Recorder:
+    """
+    단계별 실행 시간과 최대 메모리 사용량을 모으는 기록기입니다. (세션 또는 CLI 실행당 하나)
+    - activate(recorder)로 현재 실행에 연결하면 stage()가 측정을 시작합니다.
+    - log_json이면 단계가 끝날 때마다 JSON 한 줄을 LOGGER(INFO)로 출력합니다.
+    """
+
+    def __init__(self, session=None, track_memory=True, log_json=False, max_spans=MAX_SPANS):
+        self.session = session
+        self.track_memory = track_memory
+        self.log_json = log_json
+        self.run_id = 0
+        self.spans = deque(maxlen=max_spans)
+
+    def begin_run(self):
+        """새 실행(스크립트 재실행 등)을 시작합니다. 이후 기록은 새 실행 번호로 묶입니다."""
+        self.run_id += 1
+        return self.run_id
+
+    def record(self, record):
+        self.spans.append(record)
+        if self.log_json:
+            LOGGER.info(json.dumps(record, ensure_ascii=False, default=str))
+
+    def runs(self):
+        """기록이 있는 실행 번호 목록을 최신순으로 반환합니다."""
+        return sorted({span['run'] for span in list(self.spans)}, reverse=True)
+
+    def spans_for_run(self, run_id):
+        return [span for span in list(self.spans) if span['run'] == run_id]
+
+    def clear(self):
+        self.spans.clear()
+
+
+def activate(recorder):
+    """현재 실행 컨텍스트에 Recorder를 연결합니다. None을 주면 측정을 끕니다."""
+    _RECORDER.set(recorder)
+
+
+def active_recorder():
+    return _RECORDER.get()
+
+
+def stage(name, **fields):
+    """
+    with 문으로 감싼 구간의 실행 시간과 최대 메모리를 현재 Recorder에 기록합니다.
+    연결된 Recorder가 없으면 아무 일도 하지 않는 공용 컨텍스트 매니저를 반환합니다.
+    """
+    recorder = _RECORDER.get()
+    if recorder is None:
+        return _NULL_STAGE
+    return _Stage(recorder, name, fields)
+
+
+def timed(name):
+    """함수 전체를 stage(name)으로 감싸는 데코레이터입니다."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _RECORDER.get() is None:
+                return func(*args, **kwargs)
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def env_enabled():
+    """DIAGNOSTICS_ENV 환경 변수로 서버 전체의 JSON 로그 출력이 켜져 있는지 반환합니다."""
+    return os.environ.get(DIAGNOSTICS_ENV, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def configure_json_logging(stream=None):
+    """LOGGER가 JSON 한 줄만 그대로 출력하도록 핸들러를 설정합니다. (여러 번 호출해도 한 번만 설정)"""
+    if getattr(LOGGER, '_json_configured', False):
+        return
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    LOGGER.addHandler(handler)
+    LOGGER.setLevel(logging.INFO)
+    LOGGER.propagate = False
+    LOGGER._json_configured = True
@@ -0,0 +1,90 @@
+import io
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow가 없으면 Parquet 내보내기를 사용할 수 없습니다.
+    pa = pq = None
+
+from diagnostics import stage
+
+# --- Constants ---
+# 한 번에 변환하여 기록하는 행 수 (큰 데이터도 전체를 한 번에 문자열/테이블로 만들지 않음)
+EXPORT_CHUNK_ROWS = 5000
+# 데이터 내보내기 형식: 형식 -> (표시 이름, 확장자, MIME 형식)
+DATA_EXPORT_FORMATS = {
+    'csv': ('CSV', 'csv', 'text/csv'),
+    'parquet': ('Parquet', 'parquet', 'application/vnd.apache.parquet'),
+    'jsonl': ('JSON Lines', 'jsonl', 'application/jsonl'),
+}
+# CSV는 한글이 깨지지 않도록 엑셀이 인식하는 UTF-8 BOM을 붙여 저장합니다.
+CSV_ENCODING = 'utf-8-sig'
+
+
+def available_export_formats():
+    """현재 환경에서 사용할 수 있는 데이터 내보내기 형식 목록을 반환합니다. (Parquet은 pyarrow 필요)"""
+    return [fmt for fmt in DATA_EXPORT_FORMATS if fmt != 'parquet' or pq is not None]
+
+
+def export_file_name(stem, export_format):
+    return f"{stem}.{DATA_EXPORT_FORMATS[export_format][1]}"
+
+
+def _chunks(df, chunk_rows):
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def _write_csv(df, output, chunk_rows):
+    text = io.TextIOWrapper(output, encoding=CSV_ENCODING, newline='', write_through=True)
+    try:
+        # 빈 데이터프레임도 헤더 행은 기록합니다.
+        df.iloc[0:0].to_csv(text, index=False)
+        for chunk in _chunks(df, chunk_rows):
+            chunk.to_csv(text, header=False, index=False)
+    finally:
+        # output은 호출한 쪽에서 닫으므로 래퍼만 분리합니다.
+        text.detach()
+
+
+def _write_parquet(df, output, chunk_rows):
+    if pq is None:
+        raise ValueError("Parquet으로 내보내려면 pyarrow가 필요합니다.")
+    # 스키마는 전체 데이터로 한 번 정하여, 구간마다 타입이 달라지지 않게 합니다. (값이 모두 빈 구간 등)
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(output, schema) as writer:
+        for chunk in _chunks(df, chunk_rows):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def _write_jsonl(df, output, chunk_rows):
+    for chunk in _chunks(df, chunk_rows):
+        output.write(chunk.to_json(orient='records', lines=True, force_ascii=False).encode('utf-8'))
+
+
+_WRITERS = {'csv': _write_csv, 'parquet': _write_parquet, 'jsonl': _write_jsonl}
+
+
+def write_data_export(df, export_format, output, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    데이터프레임을 CSV, Parquet, JSON Lines 중 하나로 output(바이너리 파일 객체 또는 경로)에 기록합니다.
+    - EXPORT_CHUNK_ROWS행씩 나누어 변환하고 기록합니다. (openpyxl을 거치지 않음)
+    - index는 기록하지 않습니다.
+    """
+    if export_format not in _WRITERS:
+        raise ValueError(
+            f"지원하지 않는 내보내기 형식입니다: {export_format} (가능한 값: {', '.join(DATA_EXPORT_FORMATS)})"
+        )
+    with stage('export.write', format=export_format, rows=len(df)):
+        if isinstance(output, (str, bytes)) or hasattr(output, '__fspath__'):
+            with open(output, 'wb') as file:
+                _WRITERS[export_format](df, file, chunk_rows)
+        else:
+            _WRITERS[export_format](df, output, chunk_rows)
+
+
+def data_export_content(df, export_format, chunk_rows=EXPORT_CHUNK_ROWS) -> bytes:
+    """write_data_export 결과를 bytes로 반환합니다. (다운로드 버튼용)"""
+    output = io.BytesIO()
+    write_data_export(df, export_format, output, chunk_rows)
+    return output.getvalue()
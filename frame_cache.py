@@ -0,0 +1,124 @@
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow가 없으면 디스크 캐시를 사용하지 않습니다.
+    pa = None
+
+# --- Constants ---
+# 캐시 디렉터리 (빈 문자열이면 디스크 캐시를 끕니다)
+CACHE_DIR_ENV = 'INTERVIEW_REPORT_CACHE_DIR'
+CACHE_MAX_MB_ENV = 'INTERVIEW_REPORT_CACHE_MAX_MB'
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'interview_report' / 'parsed'
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+CACHE_FILE_SUFFIX = '.arrow'
+
+
+class DiskFrameCache:
+    """
+    파싱된 '평가표' 데이터프레임을 Arrow IPC 파일로 디스크에 보관하는 캐시입니다. (서버 재시작 후에도 유지)
+    - 키는 파일 내용 해시, 읽기 옵션, 파서 버전을 포함하며, 파일명은 키의 SHA-256 해시입니다.
+    - 압축하지 않고 저장하여 읽을 때 메모리 매핑으로 불러옵니다. 반환된 데이터프레임은 수정하지 말아야 합니다.
+    - 파일 크기 합계가 max_bytes를 넘으면 가장 오래 사용하지 않은(수정 시각 기준) 파일부터 삭제합니다.
+      max_bytes보다 큰 파일은 저장하지 않습니다.
+    - Arrow로 변환할 수 없는 데이터프레임(한 컬럼에 숫자와 문자가 섞인 경우 등)은 저장하지 않습니다.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        """환경 변수 설정으로 캐시를 만듭니다. pyarrow가 없거나 캐시 디렉터리를 빈 값으로 지정하면 None을 반환합니다."""
+        if pa is None:
+            return None
+        directory = os.environ.get(CACHE_DIR_ENV, str(DEFAULT_CACHE_DIR))
+        if not directory.strip():
+            return None
+        max_mb = os.environ.get(CACHE_MAX_MB_ENV)
+        max_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_CACHE_MAX_BYTES
+        return cls(directory, max_bytes)
+
+    def _path(self, key):
+        return self.directory / (hashlib.sha256(key.encode()).hexdigest() + CACHE_FILE_SUFFIX)
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+            # 수정 시각을 사용 시각으로 갱신합니다. (LRU 삭제 순서)
+            os.utime(path)
+        except (OSError, pa.ArrowException):
+            return None
+        return table.to_pandas()
+
+    def put(self, key, df):
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowException, TypeError, ValueError):
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # 다른 프로세스가 쓰는 중인 파일을 읽지 않도록 임시 파일에 쓴 뒤 이름을 바꿉니다.
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+                if os.path.getsize(tmp_path) > self.max_bytes:
+                    # 캐시 전체보다 큰 파일은 다른 파일을 모두 밀어낸 뒤 스스로도 삭제되므로 저장하지 않습니다.
+                    os.unlink(tmp_path)
+                    return
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            return
+        self._evict()
+
+    def _entries(self):
+        entries = []
+        for path in self.directory.glob('*' + CACHE_FILE_SUFFIX):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self):
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+
+    def total_bytes(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def clear(self):
+        with self._lock:
+            for _, _, path in self._entries():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def __len__(self):
+        return len(self._entries())
+
+
+# 서버 프로세스(와 같은 디렉터리를 쓰는 다른 프로세스)가 공유하는 디스크 캐시. 사용할 수 없으면 None
+DISK_FRAME_CACHE = DiskFrameCache.from_env()
@@ -0,0 +1,227 @@
+import functools
+import hashlib
+import io
+import threading
+from collections import OrderedDict, namedtuple
+
+import pandas as pd
+
+from frame_cache import DISK_FRAME_CACHE
+from workers import default_workers, process_pool
+
+# --- Constants ---
+EVALUATION_SHEET = '평가표'
+# 첫 행을 1로 볼 때 5번째 행이 제목이므로, header 인덱스는 4가 됩니다.
+HEADER_ROW_INDEX = 4
+# 이 개수 미만의 파일은 프로세스 풀을 띄우는 비용이 더 크므로 현재 프로세스에서 처리합니다.
+PARALLEL_MIN_FILES = 4
+PARSED_CACHE_MAX_ENTRIES = 2048
+# 'pandas': pd.read_excel 전체 로드, 'fast': openpyxl 읽기 전용 모드로 '평가표' 시트만 스트리밍
+READERS = ('pandas', 'fast')
+# 파싱 결과(컬럼 정리 방식 등)가 바뀌면 올려서 디스크 캐시의 이전 결과를 사용하지 않도록 합니다.
+PARSER_VERSION = 2
+
+
+# parse_evaluation_files의 결과 항목 (성공하면 df, 실패하면 error에 오류 메시지)
+ParsedFile = namedtuple('ParsedFile', ['name', 'digest', 'df', 'error'])
+
+
+class ParsedFileCache:
+    """파일 내용 해시를 키로 파싱된 데이터프레임을 보관하는 LRU 캐시입니다. (스레드 안전)"""
+
+    def __init__(self, max_entries=PARSED_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            df = self._entries.get(key)
+            if df is not None:
+                self._entries.move_to_end(key)
+            return df
+
+    def put(self, key, df):
+        with self._lock:
+            self._entries[key] = df
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# 서버 프로세스 전체(모든 세션)가 공유하는 파싱 결과 캐시
+PARSED_FILE_CACHE = ParsedFileCache()
+
+
+def file_digest(data: bytes) -> str:
+    """파일 내용의 SHA-256 해시를 반환합니다."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def dataset_fingerprint(names, digests, *options) -> str:
+    """
+    파일명과 파일 해시 목록(업로드 순서 포함), 읽기 옵션으로 데이터셋 지문을 만듭니다.
+    검증 결과와 파일 목록에 파일명이 표시되므로, 내용이 같아도 파일명이 다르면 다른 데이터셋입니다.
+    """
+    hasher = hashlib.sha256()
+    for name, digest in zip(names, digests):
+        hasher.update(name.encode())
+        hasher.update(b'\0')
+        hasher.update(digest.encode())
+    hasher.update(repr(options).encode())
+    return hasher.hexdigest()
+
+
+def _clean_column_name(name):
+    """컬럼명에서 개행문자를 공백으로 변경하고 양쪽 공백을 제거합니다."""
+    return str(name).replace('\n', ' ').strip()
+
+
+def _dedupe_column_names(names):
+    """pandas와 동일하게 중복 컬럼명 뒤에 '.1', '.2' ... 를 붙입니다."""
+    seen = {}
+    deduped = []
+    for name in names:
+        count = seen.get(name, 0)
+        deduped.append(name if count == 0 else f'{name}.{count}')
+        seen[name] = count + 1
+    return deduped
+
+
+def read_evaluation_sheet_fast(data: bytes, usecols=None) -> pd.DataFrame:
+    """
+    openpyxl 읽기 전용 모드로 '평가표' 시트의 5번째 행(헤더)부터 값만 스트리밍하여 읽습니다.
+    - 셀 서식과 다른 시트는 로드하지 않습니다.
+    - usecols가 주어지면 해당 컬럼만 유지합니다. (없는 컬럼은 무시)
+    - pd.read_excel과 마찬가지로 데이터 중간의 빈 행은 모든 값이 None인 행으로 유지하고, 마지막 데이터 행 뒤의 빈 행만 버립니다.
+      (검증 결과의 행 번호가 읽기 방식과 관계없이 같도록 함, 빈 행은 전처리에서 '성명'이 없는 행으로 제거됨)
+    """
+    # openpyxl은 불러오는 데 시간이 걸리므로 (앱 시작 시 불필요) 처음 읽을 때 가져옵니다.
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+    try:
+        if EVALUATION_SHEET not in workbook.sheetnames:
+            raise ValueError(f"Worksheet named '{EVALUATION_SHEET}' not found")
+        rows = workbook[EVALUATION_SHEET].iter_rows(min_row=HEADER_ROW_INDEX + 1, values_only=True)
+
+        header = list(next(rows, ()))
+        while header and header[-1] is None:
+            header.pop()
+        if not header:
+            raise ValueError(f"'{EVALUATION_SHEET}' 시트의 {HEADER_ROW_INDEX + 1}번째 행에 컬럼명이 없습니다.")
+        names = _dedupe_column_names([
+            _clean_column_name(name) if name is not None else f'Unnamed: {i}'
+            for i, name in enumerate(header)
+        ])
+
+        if usecols is not None:
+            wanted = set(usecols)
+            positions = [i for i, name in enumerate(names) if name in wanted]
+        else:
+            positions = range(len(names))
+        columns = [names[i] for i in positions]
+
+        records = []
+        blank_record = (None,) * len(columns)
+        # 빈 행은 뒤에 값이 있는 행이 나올 때만 추가합니다. (시트 끝의 서식만 있는 빈 행 제외)
+        pending_blank_rows = 0
+        for row in rows:
+            if all(value is None for value in row):
+                pending_blank_rows += 1
+                continue
+            records.extend([blank_record] * pending_blank_rows)
+            pending_blank_rows = 0
+            width = len(row)
+            records.append(tuple(row[i] if i < width else None for i in positions))
+    finally:
+        workbook.close()
+
+    return pd.DataFrame(records, columns=columns)
+
+
+def parse_evaluation_file(data: bytes, reader='pandas', usecols=None) -> pd.DataFrame:
+    """엑셀 파일 내용(bytes)에서 '평가표' 시트를 읽고 컬럼명을 정리합니다."""
+    if reader == 'fast':
+        return read_evaluation_sheet_fast(data, usecols=usecols)
+    if reader != 'pandas':
+        raise ValueError(f"지원하지 않는 읽기 방식입니다: {reader} (가능한 값: {', '.join(READERS)})")
+
+    df = pd.read_excel(io.BytesIO(data), sheet_name=EVALUATION_SHEET, header=HEADER_ROW_INDEX)
+
+    # 컬럼명에서 개행문자를 공백으로 변경하고 양쪽 공백을 제거합니다.
+    df.columns = df.columns.str.replace('\n', ' ', regex=False).str.strip()
+    if usecols is not None:
+        wanted = set(usecols)
+        df = df[[col for col in df.columns if col in wanted]]
+    return df
+
+
+def _parse_worker(data, reader='pandas', usecols=None):
+    """프로세스 풀 작업 함수. 예외는 메시지로 바꿔 반환합니다. (예외 객체는 pickle이 안 될 수 있음)"""
+    try:
+        return parse_evaluation_file(data, reader=reader, usecols=usecols), None
+    except Exception as e:
+        return None, str(e)
+
+
+def parse_evaluation_files(files, max_workers=None, cache=PARSED_FILE_CACHE, reader='pandas', usecols=None,
+                          disk_cache=DISK_FRAME_CACHE):
+    """
+    (파일명, bytes) 목록을 파싱하여 입력 순서대로 ParsedFile(파일명, 내용 해시, 데이터프레임, 오류 메시지) 목록을 반환합니다.
+    - 내용 해시가 캐시에 있는 파일은 다시 파싱하지 않습니다. (메모리 캐시 -> 디스크 캐시 순서로 확인)
+    - 새로 파싱할 파일이 충분히 많으면 프로세스 풀에서 병렬로 처리합니다.
+    - 실패한 파일은 데이터프레임 대신 오류 메시지를 담으며, 캐시에 저장하지 않습니다.
+    - reader, usecols는 parse_evaluation_file에 그대로 전달되며 캐시 키에도 포함됩니다. (디스크 캐시 키에는 파서 버전도 포함)
+    - 반환된 데이터프레임은 캐시와 공유되므로 수정하지 말아야 합니다.
+    """
+    if usecols is not None:
+        usecols = tuple(usecols)
+    options_key = f'{reader}:{usecols!r}'
+    digests = [file_digest(data) for _, data in files]
+    cache_keys = [f'{digest}:{options_key}' for digest in digests]
+    parse = functools.partial(_parse_worker, reader=reader, usecols=usecols)
+
+    results = {}
+    pending = {}
+    for key, (_, data) in zip(cache_keys, files):
+        if key in results or key in pending:
+            continue
+        cached = cache.get(key) if cache is not None else None
+        if cached is None and disk_cache is not None:
+            cached = disk_cache.get(f'{key}:{PARSER_VERSION}')
+            if cached is not None and cache is not None:
+                cache.put(key, cached)
+        if cached is not None:
+            results[key] = (cached, None)
+        else:
+            pending[key] = data
+
+    if pending:
+        workers = min(max_workers or default_workers(), len(pending))
+        if workers <= 1 or len(pending) < PARALLEL_MIN_FILES:
+            parsed = map(parse, pending.values())
+        else:
+            chunksize = max(1, len(pending) // (workers * 4))
+            with process_pool(workers) as executor:
+                parsed = list(executor.map(parse, pending.values(), chunksize=chunksize))
+        for key, (df, error) in zip(pending, parsed):
+            results[key] = (df, error)
+            if error is not None:
+                continue
+            if cache is not None:
+                cache.put(key, df)
+            if disk_cache is not None:
+                disk_cache.put(f'{key}:{PARSER_VERSION}', df)
+
+    return [
+        ParsedFile(name, digest, *results[key])
+        for digest, key, (name, _) in zip(digests, cache_keys, files)
+    ]
@@ -0,0 +1,134 @@
+import contextvars
+import threading
+from collections import OrderedDict
+
+# 모든 세션이 공유하는 다운로드 파일 캐시의 최대 크기 (bytes)
+PAYLOAD_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+class PayloadCache:
+    """
+    다운로드 파일(bytes)을 키별로 보관하는 크기 제한 LRU 캐시입니다. (스레드 안전)
+    - 키는 (데이터셋 지문, 리포트 종류, 양식, 후보자, 필터) 형태의 튜플을 사용합니다.
+    - 보관 중인 bytes 합계가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    - max_bytes보다 큰 파일은 캐시하지 않고 그대로 반환합니다.
+    """
+
+    def __init__(self, max_bytes=PAYLOAD_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+            return payload
+
+    def put(self, key, payload):
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= len(previous)
+            self._entries[key] = payload
+            self.total_bytes += len(payload)
+            while self.total_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.total_bytes -= len(evicted)
+
+    def get_or_build(self, key, build, *args, **kwargs):
+        """캐시에 있으면 그대로, 없으면 build(*args, **kwargs)로 만들어 저장한 뒤 반환합니다."""
+        payload = self.get(key)
+        if payload is None:
+            payload = build(*args, **kwargs)
+            self.put(key, payload)
+        return payload
+
+    def lazy(self, key, build, *args, **kwargs):
+        """
+        다운로드 버튼을 누를 때 호출되는 인자 없는 함수를 반환합니다. (st.download_button의 data 인자용)
+        버튼 클릭은 스크립트 실행 밖에서 처리되므로, 만들 때의 실행 컨텍스트(진단 기록기 등)를 복사해 두고 그 안에서 실행합니다.
+        """
+        context = contextvars.copy_context()
+        return lambda: context.copy().run(self.get_or_build, key, build, *args, **kwargs)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# 서버 프로세스 전체(모든 세션)가 공유하는 다운로드 파일 캐시
+PAYLOAD_CACHE = PayloadCache()
+
+
+class BuildCancelled(Exception):
+    """백그라운드 작업이 취소되었을 때 진행률 콜백에서 발생시켜 생성을 중단합니다."""
+
+
+class BackgroundBuild:
+    """
+    다운로드 파일을 백그라운드 스레드에서 만드는 작업입니다. 스크립트 실행을 막지 않고 진행률을 조회할 수 있습니다.
+    - build(*args, progress=콜백, **kwargs)를 호출하며, 콜백은 (완료 수, 전체 수)를 기록합니다.
+    - cancel()을 호출하면 다음 진행률 보고 시점에 BuildCancelled를 발생시켜 생성을 멈춥니다.
+    - 완료된 파일은 cache에 key로 저장하고 payload에도 보관합니다. (캐시보다 큰 파일도 내려받을 수 있도록)
+    - 시작한 실행 컨텍스트(진단 기록기 등)를 복사하여 그 안에서 실행합니다.
+    """
+
+    def __init__(self, key, build, *args, cache=PAYLOAD_CACHE, **kwargs):
+        self.key = key
+        self.cache = cache
+        self.status = 'running'      # 'running', 'done', 'cancelled', 'error'
+        self.done = 0
+        self.total = None
+        self.payload = None
+        self.error = None
+        self._cancel = threading.Event()
+        context = contextvars.copy_context()
+        self._thread = threading.Thread(
+            target=context.run, args=(self._run, build, args, kwargs), name='background-build', daemon=True
+        )
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _progress(self, done, total):
+        if self._cancel.is_set():
+            raise BuildCancelled()
+        self.done, self.total = done, total
+
+    def _run(self, build, args, kwargs):
+        try:
+            payload = build(*args, progress=self._progress, **kwargs)
+        except BuildCancelled:
+            self.status = 'cancelled'
+        except Exception as e:
+            self.error = str(e)
+            self.status = 'error'
+        else:
+            self.cache.put(self.key, payload)
+            self.payload = payload
+            self.status = 'done'
+
+    @property
+    def running(self):
+        return self.status == 'running'
+
+    @property
+    def fraction(self):
+        """진행률 (0~1). 전체 수를 아직 모르면 0입니다."""
+        return self.done / self.total if self.total else 0.0
+
+    def cancel(self):
+        self._cancel.set()
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
@@ -0,0 +1,282 @@
+from collections import Counter, namedtuple
+
+import numpy as np
+import pandas as pd
+
+from diagnostics import stage
+from frame_cache import DISK_FRAME_CACHE
+from ingest import ParsedFileCache, dataset_fingerprint, file_digest, parse_evaluation_files
+from scoring import SCORING_SCHEMA
+
+# --- Constants ---
+# 점수 계산을 위한 카테고리별 컬럼 정의 (채점 기준 파일 scoring_schema.json에서 읽음)
+# 이 컬럼들은 점수 계산 및 리포트 생성에 사용됩니다.
+CATEGORY_COLS = SCORING_SCHEMA.categories
+
+# 심사위원 판정 점수 컬럼 (채점 기준의 total_column, 없으면 항목 가중 합계로 판정하므로 빈 목록)
+TOTAL_COLS = [SCORING_SCHEMA.total_column] if SCORING_SCHEMA.total_column is not None else []
+
+# 리포트에서 후보자 평균, 전체 평균, 합격자 평균을 비교하는 점수 컬럼
+REPORT_SCORE_COLS = list(dict.fromkeys(list(CATEGORY_COLS.keys()) + TOTAL_COLS))
+
+PASS_SCORE_THRESHOLD = SCORING_SCHEMA.pass_threshold
+# 빠른 읽기 모드에서 '필요한 컬럼만 읽기'를 선택했을 때 유지하는 컬럼 (점수 계산, 검증, 리포트에 사용)
+REQUIRED_COLS = list(dict.fromkeys(SCORING_SCHEMA.input_cols + ['성명', '심사위원 성명', '합격여부(Pass/Fail)', '총평']))
+# 후보자별로 기대하는 평가(심사위원) 수
+EXPECTED_EVALUATIONS = 3
+# 결과 불일치 목록에 표시하는 컬럼
+MISMATCH_DISPLAY_COLS = ['성명', '심사위원 성명'] + TOTAL_COLS + ['합격여부(Pass/Fail)', 'Reviewer_Result']
+FILE_ERROR_HINT = "엑셀 파일의 5번째 행에 컬럼명이 있고, '평가표' 시트가 존재하는지 확인해주세요."
+
+# --- Compact dtypes ---
+# 숫자로 변환하는 점수 컬럼 (항목 점수 + 판정 점수 컬럼)
+ITEM_SCORE_COLS = list(SCORING_SCHEMA.input_cols)
+# 반복되는 이름은 category로 저장합니다. (카테고리는 정렬된 순서)
+CATEGORICAL_COLS = ['성명', '심사위원 성명']
+# 점수는 float32로 저장합니다. (정수와 0.5 단위 점수는 정확히 표현됨)
+# 심사위원 Pass/Fail 판정은 float32로 줄이기 전의 float64 점수로 합니다. (70.7점 기준에 70.7점이 불합격이 되지 않도록)
+SCORE_DTYPE = 'float32'
+RESULT_DTYPE = pd.CategoricalDtype(['Pass', 'Fail', 'N/A'])
+# 내보내기와 후보자 판정 점수 합계에서 float32 점수를 float64로 바꿀 때 반올림하는 소수 자릿수 (float32 표현 오차 제거)
+EXPORT_SCORE_DECIMALS = 4
+
+
+class SourceFiles(namedtuple('SourceFiles', ['names', 'row_counts'])):
+    """
+    통합 데이터프레임의 행이 어느 파일의 몇 번째 데이터 행인지 찾기 위한 파일 목록입니다. (attrs['source_files'])
+    - names, row_counts: 통합한 순서대로의 파일명과 파일별로 읽은 데이터 행 수
+    - 통합 데이터프레임의 index는 파일별 데이터 행을 순서대로 이어 붙인 위치입니다. ('성명'이 빈 행은 빠져 있음)
+    """
+    __slots__ = ()
+
+    def __deepcopy__(self, memo):
+        # pandas는 연산 결과에 attrs를 깊은 복사하므로, 바뀌지 않는 이 값은 복사하지 않고 공유합니다.
+        return self
+
+    def locate(self, labels):
+        """index 값 배열을 (파일명 배열, 파일 안 데이터 행 번호 배열)로 바꿉니다. 행 번호는 헤더 다음 행이 1입니다."""
+        labels = np.asarray(labels, dtype=np.int64)
+        ends = np.cumsum(self.row_counts, dtype=np.int64)
+        file_idx = np.searchsorted(ends, labels, side='right')
+        starts = ends - np.asarray(self.row_counts, dtype=np.int64)
+        return np.asarray(self.names, dtype=object)[file_idx], labels - starts[file_idx] + 1
+
+
+# 파일 하나의 전처리 결과
+# - name: 파일 키 (업로드한 파일명, 같은 이름이 여러 개이면 두 번째부터 '이름#2', '이름#3' ...)
+# - digest: 파일 내용 해시, df: 전처리된 데이터프레임 (수정 금지)
+# - source_rows: 파일에서 읽은 데이터 행 수 ('성명'이 빈 행 포함, 통합 데이터프레임의 index와 검증 결과의 행 번호 계산용)
+ProcessedFile = namedtuple('ProcessedFile', ['name', 'digest', 'df', 'source_rows'])
+# 서버 프로세스 전체(모든 세션)가 공유하는 파일별 전처리 결과 캐시 (키: 파일 내용 해시, 읽기 방식, 읽을 컬럼)
+PROCESSED_FILE_CACHE = ParsedFileCache()
+
+
+class EvaluationFileError(Exception):
+    """평가표 파일을 읽지 못했을 때 발생합니다."""
+
+    def __init__(self, file_name, message):
+        super().__init__(f"'{file_name}' 파일 처리 중 오류가 발생했습니다: {message}")
+        self.file_name = file_name
+        self.message = message
+
+
+def unique_file_names(names):
+    """파일명 목록을 파일 키 목록으로 바꿉니다. 같은 이름의 파일이 여러 개이면 두 번째부터 '이름#2', '이름#3' ... 으로 구분합니다."""
+    seen = Counter()
+    keys = []
+    for name in names:
+        seen[name] += 1
+        keys.append(name if seen[name] == 1 else f'{name}#{seen[name]}')
+    return keys
+
+
+def evaluation_fingerprint(names, digests, reader='pandas', usecols=None) -> str:
+    """업로드 순서의 파일명과 파일 내용 해시, 읽기 옵션으로 데이터셋 지문을 만듭니다. (파일을 읽기 전에 계산할 수 있음)"""
+    usecols = tuple(usecols) if usecols is not None else None
+    return dataset_fingerprint(unique_file_names(names), digests, reader, usecols)
+
+
+def load_processed_files(files, reader='pandas', usecols=None, max_workers=None, disk_cache=DISK_FRAME_CACHE,
+                         digests=None, cache=PROCESSED_FILE_CACHE) -> list:
+    """
+    (파일명, bytes) 목록을 읽고 파일마다 따로 전처리하여 업로드 순서대로 ProcessedFile 목록을 반환합니다.
+    - 각 파일의 '평가표' 시트를 읽습니다. (파일 내용 해시별 메모리/디스크 캐시, 프로세스 풀 병렬 파싱)
+    - reader='fast'이면 '평가표' 시트만 읽기 전용으로 스트리밍하며, usecols로 읽을 컬럼을 제한할 수 있습니다.
+    - 5번째 행을 헤더로 사용하고, 데이터는 6번째 행부터 시작합니다. 컬럼명의 개행 문자는 공백으로 변환합니다.
+    - 파일마다 따로 전처리하므로 파일의 결과는 함께 올린 다른 파일과 관계없습니다.
+      (판정 점수 컬럼이 없는 파일의 심사위원 결과는 항상 'N/A')
+    - 전처리 결과는 (내용 해시, 읽기 옵션)별로 cache에 보관하여 같은 파일을 올린 세션과 CLI 실행이 같은 데이터프레임을
+      복사 없이 함께 사용합니다. 반환된 데이터프레임은 수정하지 말아야 합니다.
+    - digests에 파일 내용 해시 목록을 주면 해시를 다시 계산하지 않습니다.
+    - 읽지 못한 파일이 있으면 첫 번째 파일에 대해 EvaluationFileError를 발생시킵니다.
+    """
+    files = list(files)
+    if not files:
+        return []
+    usecols = tuple(usecols) if usecols is not None else None
+    digests = list(digests) if digests is not None else [file_digest(data) for _, data in files]
+    keys = unique_file_names([name for name, _ in files])
+    cache_keys = [(digest, reader, usecols) for digest in digests]
+    cached = [cache.get(cache_key) if cache is not None else None for cache_key in cache_keys]
+    missing = [i for i, entry in enumerate(cached) if entry is None]
+
+    if missing:
+        # 파일별 파싱은 내용 해시로 캐시되며, 새로 추가/변경된 파일만 프로세스 풀에서 병렬로 파싱합니다.
+        with stage('parse', files=len(missing)):
+            parsed_files = parse_evaluation_files(
+                [files[i] for i in missing], max_workers=max_workers, reader=reader, usecols=usecols,
+                disk_cache=disk_cache
+            )
+        for parsed in parsed_files:
+            if parsed.error is not None:
+                raise EvaluationFileError(parsed.name, parsed.error)
+
+        with stage('process', files=len(parsed_files)):
+            for i, parsed in zip(missing, parsed_files):
+                # 파싱 캐시와 공유하는 원본 대신 복사본을 전처리합니다.
+                cached[i] = (process_evaluation_frame(parsed.df.copy()), len(parsed.df))
+                if cache is not None:
+                    cache.put(cache_keys[i], cached[i])
+
+    return [
+        ProcessedFile(key, digest, df, source_rows)
+        for key, digest, (df, source_rows) in zip(keys, digests, cached)
+    ]
+
+
+def combine_processed_files(processed_files, reader='pandas', usecols=None) -> pd.DataFrame:
+    """
+    파일별 전처리 결과를 업로드 순서대로 하나의 데이터프레임으로 합칩니다.
+    - 입력 파일의 모든 컬럼을 유지합니다. 일부 파일에만 있는 점수 컬럼은 0점으로 채웁니다.
+    - index는 파일별 데이터 행을 순서대로 이어 붙인 위치입니다. ('성명'이 빈 행은 빠져 있음)
+    - 데이터셋 지문을 attrs['fingerprint']에, 파일별 행 범위를 attrs['source_files']에 기록합니다.
+    """
+    if not processed_files:
+        return pd.DataFrame()
+
+    with stage('concat', files=len(processed_files)):
+        combined_df = pd.concat([processed.df for processed in processed_files], ignore_index=True)
+        starts = np.cumsum([0] + [processed.source_rows for processed in processed_files[:-1]])
+        combined_df.index = pd.Index(np.concatenate([
+            processed.df.index.to_numpy(dtype=np.int64) + start for processed, start in zip(processed_files, starts)
+        ]))
+        for col in ITEM_SCORE_COLS:
+            if col in combined_df.columns and combined_df[col].hasnans:
+                combined_df[col] = combined_df[col].fillna(0).astype(SCORE_DTYPE)
+        # 파일마다 카테고리가 달라 합치면서 category가 풀린 컬럼을 다시 category로 바꿉니다.
+        for col in CATEGORICAL_COLS:
+            if col in combined_df.columns and not isinstance(combined_df[col].dtype, pd.CategoricalDtype):
+                combined_df[col] = combined_df[col].astype('category')
+
+    names = [processed.name for processed in processed_files]
+    # 다운로드 파일 캐시 등에서 쓰는 데이터셋 지문 (파일명 + 파일 내용 해시 + 읽기 옵션)
+    combined_df.attrs['fingerprint'] = evaluation_fingerprint(
+        names, [processed.digest for processed in processed_files], reader, usecols
+    )
+    # 검증 결과에 파일명과 행 번호를 표시하기 위한 파일 목록
+    combined_df.attrs['source_files'] = SourceFiles(
+        tuple(names), tuple(processed.source_rows for processed in processed_files)
+    )
+    return combined_df
+
+
+def load_evaluation_files(files, reader='pandas', usecols=None, max_workers=None, disk_cache=DISK_FRAME_CACHE) -> pd.DataFrame:
+    """
+    (파일명, bytes) 목록을 읽어 파일마다 전처리한 뒤 하나의 데이터프레임으로 통합합니다.
+    (load_processed_files + combine_processed_files, 파일 읽기와 전처리 방식은 load_processed_files 참고)
+    """
+    files = list(files)
+    if not files:
+        return pd.DataFrame()
+    with stage('load', files=len(files), reader=reader):
+        processed_files = load_processed_files(
+            files, reader=reader, usecols=usecols, max_workers=max_workers, disk_cache=disk_cache
+        )
+        return combine_processed_files(processed_files, reader, usecols)
+
+
+def process_evaluation_frame(combined_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    통합된 평가표 데이터프레임을 전처리합니다. (주어진 데이터프레임을 직접 수정합니다.)
+    - 누락된 '성명' 데이터를 제거합니다.
+    - 카테고리별 점수와 Pass/Fail 여부를 계산하고, 원본 데이터와 비교 검증합니다.
+    """
+    with stage('coerce'):
+        # '성명'이 비어있는 행은 제거합니다.
+        combined_df.dropna(subset=['성명'], inplace=True)
+
+        # --- 데이터 타입 변환 ---
+        # 점수 계산에 필요한 컬럼들만 숫자(float64) 타입으로 변환합니다. (판정 후 float32로 줄임)
+        score_cols = [col for col in ITEM_SCORE_COLS if col in combined_df.columns]
+        for col in score_cols:
+            combined_df[col] = pd.to_numeric(combined_df[col], errors='coerce').fillna(0).astype('float64')
+
+        # 후보자/심사위원 이름은 category로 저장하여 메모리와 groupby 비용을 줄입니다.
+        for col in CATEGORICAL_COLS:
+            if col in combined_df.columns:
+                combined_df[col] = combined_df[col].astype('category')
+
+    with stage('score'):
+        # --- 카테고리별 점수 및 Pass/Fail 계산 ---
+        # 점수 블록과 채점 기준 가중치 행렬의 곱 한 번으로 모든 카테고리 점수와 판정 점수를 계산합니다.
+        # (파일에 없는 항목 컬럼은 0점으로 봄)
+        category_scores, _, passed = SCORING_SCHEMA.evaluate(combined_df)
+        for i, category in enumerate(CATEGORY_COLS):
+            combined_df[category] = category_scores[:, i].astype(SCORE_DTYPE)
+        # 판정이 끝났으므로 입력 점수를 float32로 줄여 저장합니다.
+        for col in score_cols:
+            combined_df[col] = combined_df[col].astype(SCORE_DTYPE)
+
+        # 판정 점수 컬럼(채점 기준의 total_column)이 있는 경우에만 Pass/Fail 계산
+        if passed is not None:
+            combined_df['Reviewer_Result'] = pd.Categorical.from_codes(
+                np.where(passed, 0, 1), dtype=RESULT_DTYPE
+            )
+        else:
+            # 판정 점수 컬럼이 없으면 결과를 'N/A'로 처리
+            combined_df['Reviewer_Result'] = pd.Series('N/A', index=combined_df.index, dtype=RESULT_DTYPE)
+
+    with stage('validate'):
+        # --- 합격여부 값 비교 검증 ---
+        if '합격여부(Pass/Fail)' in combined_df.columns:
+            # 비교를 위해 양쪽 값 정규화 (소문자, 공백 제거)
+            original_result = combined_df['합격여부(Pass/Fail)'].astype(str).str.strip().str.lower()
+            calculated_result = combined_df['Reviewer_Result'].astype(str).str.strip().str.lower()
+
+            # 원본 결과가 비어있지 않은 경우에만 비교하여 불일치 여부 플래그
+            combined_df['Result_Mismatch'] = (original_result != calculated_result) & (original_result.notna()) & (original_result != '') & (original_result != 'nan')
+        else:
+            # 비교할 컬럼이 없으면 불일치 없음으로 처리
+            combined_df['Result_Mismatch'] = False
+
+    return combined_df
+
+
+def export_frame(all_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    통합 결과를 파일로 내보낼 때 사용할 데이터프레임을 반환합니다.
+    - 내부 검증용 'Result_Mismatch' 컬럼을 제외합니다.
+    - float32 점수는 float64로 바꾸고 반올림하여, 7.3이 7.300000190734863으로 기록되지 않도록 합니다.
+    """
+    export_df = all_df.drop(columns=['Result_Mismatch'], errors='ignore')
+    score_cols = [col for col in export_df.columns if export_df[col].dtype == SCORE_DTYPE]
+    if score_cols:
+        export_df = export_df.astype({col: 'float64' for col in score_cols}).round({col: EXPORT_SCORE_DECIMALS for col in score_cols})
+    return export_df
+
+
+def find_invalid_evaluation_counts(index, expected=EXPECTED_EVALUATIONS) -> pd.Series:
+    """평가 횟수가 expected회가 아닌 후보자의 평가 횟수를 반환합니다."""
+    counts = index.evaluation_counts
+    return counts[counts != expected]
+
+
+def find_result_mismatches(all_df: pd.DataFrame) -> pd.DataFrame:
+    """원본 파일의 합격 여부와 계산된 결과가 다른 행을 표시용 컬럼만 골라 반환합니다."""
+    if 'Result_Mismatch' not in all_df.columns:
+        return all_df.iloc[0:0]
+    mismatch_df = all_df[all_df['Result_Mismatch'] == True]
+    # 표시할 컬럼이 데이터프레임에 있는지 확인
+    display_cols = [col for col in MISMATCH_DISPLAY_COLS if col in mismatch_df.columns]
+    return mismatch_df[display_cols]
+
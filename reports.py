@@ -0,0 +1,574 @@
+import io
+import zipfile
+from collections import namedtuple
+from copy import copy
+from dataclasses import dataclass
+from functools import lru_cache
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.utils import get_column_letter
+
+from aggregates import HISTOGRAM_BINS
+from diagnostics import stage, timed
+from workers import chunked, default_workers, process_pool
+
+# --- Constants ---
+# 리포트 양식에서 '제출용 양식' 삭제
+REPORT_FORMATS = ['상세 리포트', '요약 리포트']
+# 전체 리포트 생성 방식: 'openpyxl'은 메모리에 전체 워크북을 만들고,
+# 'streaming'은 openpyxl write_only 모드로 행과 서식을 바로 출력에 씁니다. (대규모 인원용)
+REPORT_ENGINES = {'openpyxl': '표준', 'streaming': '스트리밍 (대용량)'}
+# 이 인원 미만의 개별 리포트 일괄 생성은 프로세스 풀을 띄우지 않고 현재 프로세스에서 처리합니다.
+PARALLEL_MIN_CANDIDATES = 50
+
+# --- Excel Styling ---
+TITLE_FONT = Font(bold=True, size=14)
+HEADER_FONT = Font(bold=True, size=12)
+PASS_FONT = Font(color="0000FF", bold=True)
+PASS_FILL = PatternFill(start_color="DDEEFF", end_color="DDEEFF", fill_type="solid")
+FAIL_FONT = Font(color="FF0000", bold=True)
+FAIL_FILL = PatternFill(start_color="FFDDDD", end_color="FFDDDD", fill_type="solid")
+TABLE_HEADER_FONT = Font(bold=True)
+TABLE_HEADER_FILL = PatternFill(start_color="EAEAEA", end_color="EAEAEA", fill_type="solid")
+MARKER_FILL = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
+CENTER_ALIGN = Alignment(horizontal='center', vertical='center')
+LEFT_ALIGN = Alignment(horizontal='left', vertical='center')
+WRAP_LEFT_ALIGN = Alignment(horizontal='left', vertical='top', wrap_text=True)
+THIN_BORDER = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
+BOX_BORDER = Border(left=Side(style='medium'), right=Side(style='medium'), top=Side(style='medium'), bottom=Side(style='medium'))
+# 병합 셀 범위의 가운데/오른쪽 끝 셀 테두리 (스트리밍 방식에서 병합 범위 테두리를 직접 씀)
+MERGED_MIDDLE_BORDER = Border(top=Side(style='thin'), bottom=Side(style='thin'))
+MERGED_RIGHT_BORDER = Border(right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
+
+# 워크북마다 한 번 등록하는 이름 있는 스타일 (셀에는 이름으로 한 번에 적용)
+# 글꼴을 지정하지 않는 스타일은 워크북 기본 글꼴을 유지하도록 DEFAULT_FONT를 사용합니다.
+NAMED_STYLE_SPECS = {
+    'report_title': {'font': TITLE_FONT},
+    'section_header': {'font': HEADER_FONT},
+    'table_header': {'font': TABLE_HEADER_FONT, 'fill': TABLE_HEADER_FILL, 'alignment': CENTER_ALIGN, 'border': THIN_BORDER},
+    'bordered_cell': {'font': DEFAULT_FONT, 'border': THIN_BORDER},
+    'pass_result': {'font': PASS_FONT, 'fill': PASS_FILL, 'border': THIN_BORDER},
+    'fail_result': {'font': FAIL_FONT, 'fill': FAIL_FILL, 'border': THIN_BORDER},
+    'reviewer_label': {'font': DEFAULT_FONT, 'alignment': CENTER_ALIGN, 'border': THIN_BORDER},
+    'wrapped_comment': {'font': DEFAULT_FONT, 'alignment': WRAP_LEFT_ALIGN, 'border': THIN_BORDER},
+    'merged_middle': {'font': DEFAULT_FONT, 'border': MERGED_MIDDLE_BORDER},
+    'merged_right': {'font': DEFAULT_FONT, 'border': MERGED_RIGHT_BORDER},
+    'cohort_marker': {'font': TABLE_HEADER_FONT, 'fill': MARKER_FILL, 'border': THIN_BORDER},
+}
+
+
+# --- Helper Functions ---
+
+def to_excel(df: pd.DataFrame) -> bytes:
+    """데이터프레임을 엑셀 파일(bytes)로 변환합니다."""
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        df.to_excel(writer, index=False, sheet_name='통합결과')
+    processed_data = output.getvalue()
+    return processed_data
+
+def register_named_styles(workbook):
+    """워크북에 NAMED_STYLE_SPECS의 이름 있는 스타일을 등록합니다. (이미 등록된 스타일은 건너뜀)"""
+    registered = set(workbook.named_styles)
+    for name, spec in NAMED_STYLE_SPECS.items():
+        if name not in registered:
+            # NamedStyle은 등록된 워크북에 묶이므로 워크북마다 새로 만듭니다.
+            workbook.add_named_style(NamedStyle(name=name, **spec))
+
+def result_style_name(final_result):
+    """최종 결과(Pass/Fail)에 해당하는 이름 있는 스타일을 반환합니다."""
+    return 'pass_result' if final_result == "Pass" else 'fail_result'
+
+def style_block(ws, style_name, min_row, min_col, max_row=None, max_col=None):
+    """
+    (min_row, min_col)부터 (max_row, max_col)까지 직사각형 영역의 모든 셀에 등록된 이름 있는 스타일 하나를 적용합니다.
+    - 행/열 번호는 1부터 시작하며, max_row/max_col을 생략하면 한 행/한 열만 적용합니다.
+    - 셀마다 글꼴/채우기/정렬/테두리를 따로 지정하지 않으므로 스타일 중복 검사 비용이 들지 않습니다.
+    """
+    for row in ws.iter_rows(min_row=min_row, min_col=min_col, max_row=max_row or min_row, max_col=max_col or min_col):
+        for cell in row:
+            cell.style = style_name
+
+# --- Sheet Templates ---
+# 개별 리포트 시트의 컬럼 너비
+REPORT_SHEET_COLUMN_WIDTHS = {'A': 25, 'B': 27, 'C': 27, 'D': 26}
+# 상세 리포트 점수 비교표의 순위, 백분위 컬럼 너비
+STANDING_COLUMN_WIDTHS = {'E': 10, 'F': 10}
+# 상세 리포트 점수 비교표의 헤더 행
+COMPARISON_HEADER = ['Category', '후보자 점수', '전체 평균', '합격자 평균', '순위', '백분위']
+# 상세 리포트 점수 분포표의 헤더 행과 후보자가 속한 구간 표시
+DISTRIBUTION_HEADER = ['Category', '구간', '후보자 수', '후보자 위치']
+DISTRIBUTION_MARKER = '◀ 후보자'
+# 백분위를 기록할 때 반올림하는 소수 자릿수
+PERCENTILE_DECIMALS = 1
+# 병합 범위의 시작 셀을 제외한 셀의 스타일 (표준 방식에서는 병합된 셀에 값을 쓸 수 없으므로 건너뜀)
+MERGED_TAIL_STYLES = {'merged_middle', 'merged_right'}
+
+# 템플릿의 셀: column은 1부터 시작하는 열 번호, value/style은 고정 값 또는 Field
+TemplateCell = namedtuple('TemplateCell', ['column', 'value', 'style'])
+# 후보자마다 채우는 값의 자리: name은 값 이름, position은 목록 값(점수 컬럼 순서)의 위치
+Field = namedtuple('Field', ['name', 'position'], defaults=[None])
+
+
+@dataclass(frozen=True)
+class SheetTemplate:
+    """
+    리포트 양식 하나를 미리 계산한 개별 리포트 시트 배치입니다. (셀 위치, 고정 값, 병합 범위, 컬럼 너비, 스타일)
+    후보자마다 배치를 다시 계산하지 않고 Field 자리에 후보자 값만 채워 씁니다.
+    """
+    report_format: str
+    column_widths: dict
+    rows: tuple           # (행 번호, 셀 목록) 목록: 심사위원 코멘트 행 앞까지의 고정 배치
+    merges: tuple         # 고정 배치의 병합 범위
+    comment_row: int      # 첫 번째 심사위원 코멘트 행 번호 (심사위원 수만큼 아래로 반복)
+    comment_cells: tuple  # 심사위원 코멘트 한 행의 셀
+    comment_merge: str    # 코멘트 행마다 병합하는 열 범위 (예: 'B:D')
+
+
+@lru_cache(maxsize=None)
+def compile_sheet_template(report_format, score_cols, bins=HISTOGRAM_BINS):
+    """리포트 양식, 점수 컬럼(tuple), 분포 구간 수에 대한 시트 템플릿을 만듭니다. 같은 인자로는 한 번만 만듭니다."""
+    rows = [
+        (1, (TemplateCell(1, '후보자 리포트', 'report_title'), TemplateCell(2, Field('name'), 'report_title'))),
+        (2, (TemplateCell(1, '최종 결과', None), TemplateCell(2, Field('final_result'), Field('result_style')))),
+    ]
+    column_widths = dict(REPORT_SHEET_COLUMN_WIDTHS)
+    if report_format == '상세 리포트':
+        column_widths.update(STANDING_COLUMN_WIDTHS)
+        rows.append((4, (TemplateCell(1, '📊 심사 점수 분석', 'section_header'),)))
+        rows.append((5, tuple(TemplateCell(col, label, 'table_header') for col, label in enumerate(COMPARISON_HEADER, 1))))
+        for i, score_col in enumerate(score_cols):
+            rows.append((6 + i, (
+                TemplateCell(1, score_col, 'bordered_cell'),
+                TemplateCell(2, Field('score', i), 'bordered_cell'),
+                TemplateCell(3, Field('overall_avg', i), 'bordered_cell'),
+                TemplateCell(4, Field('passer_avg', i), 'bordered_cell'),
+                TemplateCell(5, Field('rank', i), 'bordered_cell'),
+                TemplateCell(6, Field('percentile', i), 'bordered_cell'),
+            )))
+
+        # 점수 컬럼별 전체 후보자 분포 (컬럼마다 bins개 행, 후보자가 속한 구간 표시)
+        distribution_row = 4 + len(score_cols) + 3
+        rows.append((distribution_row, (TemplateCell(1, '📈 전체 후보자 점수 분포', 'section_header'),)))
+        rows.append((distribution_row + 1, tuple(
+            TemplateCell(col, label, 'table_header') for col, label in enumerate(DISTRIBUTION_HEADER, 1)
+        )))
+        for i, score_col in enumerate(score_cols):
+            for b in range(bins):
+                position = i * bins + b
+                rows.append((distribution_row + 2 + position, (
+                    TemplateCell(1, score_col, 'bordered_cell'),
+                    TemplateCell(2, Field('bin_label', position), 'bordered_cell'),
+                    TemplateCell(3, Field('bin_count', position), 'bordered_cell'),
+                    TemplateCell(4, Field('marker', position), Field('marker_style', position)),
+                )))
+        comments_start_row = distribution_row + 1 + len(score_cols) * bins + 2
+    else: # 요약 리포트
+        comments_start_row = 3
+
+    header_row = comments_start_row + 1
+    rows.append((comments_start_row, (TemplateCell(1, '📝 심사위원 코멘트', 'section_header'),)))
+    rows.append((header_row, (
+        TemplateCell(1, '심사위원', 'table_header'),
+        TemplateCell(2, '코멘트', 'table_header'),
+        TemplateCell(3, None, 'merged_middle'),
+        TemplateCell(4, None, 'merged_right'),
+    )))
+    return SheetTemplate(
+        report_format=report_format,
+        column_widths=column_widths,
+        rows=tuple(rows),
+        merges=(f'B{header_row}:D{header_row}',),
+        comment_row=header_row + 1,
+        comment_cells=(
+            TemplateCell(1, Field('reviewer_label'), 'reviewer_label'),
+            TemplateCell(2, Field('comment'), 'wrapped_comment'),
+            TemplateCell(3, None, 'merged_middle'),
+            TemplateCell(4, None, 'merged_right'),
+        ),
+        comment_merge='B:D',
+    )
+
+
+def _resolve(item, values):
+    if isinstance(item, Field):
+        value = values[item.name]
+        return value if item.position is None else value[item.position]
+    return item
+
+
+def named_style_arrays(workbook):
+    """
+    이름 있는 스타일의 스타일 배열(openpyxl 내부 표현)을 스타일 이름별로 반환합니다. 찾을 수 없으면 None입니다.
+    - cell.style = 이름은 셀마다 워크북의 스타일 목록을 검색하므로, 셀이 많은 리포트 시트에는 미리 꺼낸 배열을 복사합니다.
+      (후보자 1,000명 시트 작성: 표준 2.6초 -> 공개 API 4.1초, 스트리밍 7.9초 -> 9.4초)
+    - 내부 속성(_named_styles, as_tuple)이 없는 openpyxl 버전에서는 None을 반환하고 공개 API로 지정합니다.
+    """
+    try:
+        named_styles = workbook._named_styles
+        return {name: named_styles[name].as_tuple() for name in NAMED_STYLE_SPECS}
+    except (AttributeError, KeyError, TypeError):
+        return None
+
+
+class SheetStamper:
+    """
+    컴파일된 시트 템플릿을 워크북과 집계 구조에 한 번 연결하여, 후보자마다 값만 채워 개별 리포트 시트를 씁니다.
+    - 표준 방식(일반 워크북)과 스트리밍 방식(write_only 워크북)에 같은 템플릿을 사용합니다.
+    - 이름 있는 스타일은 연결할 때 한 번 찾아 두고, 셀에는 찾아 둔 스타일을 그대로 복사합니다. (named_style_arrays 참고)
+    - 후보자 값은 집계 구조에서 바로 읽으며 중간 데이터프레임을 만들지 않습니다.
+    """
+
+    def __init__(self, workbook, index, report_format):
+        register_named_styles(workbook)
+        self.workbook = workbook
+        self.index = index
+        # 분포표의 구간 라벨과 후보자 수는 모든 후보자 시트에서 같습니다.
+        histograms = [index.cohort.histogram(col) for col in index.score_cols]
+        self.bins = len(histograms[0]) if histograms else HISTOGRAM_BINS
+        self.template = compile_sheet_template(report_format, tuple(index.score_cols), self.bins)
+        self.styles = named_style_arrays(workbook)
+        self.scores = index.scores.to_numpy()
+        self.overall_avg = index.overall_avg.tolist()
+        self.passer_avg = index.passer_avg.tolist()
+        self.bin_labels = [label for histogram in histograms for label in histogram.index]
+        self.bin_counts = [count for histogram in histograms for count in histogram.tolist()]
+
+    def values(self, candidate_name):
+        """템플릿의 Field 자리에 채울 후보자 값"""
+        final_result = self.index.final_result(candidate_name)
+        scores = self.scores[self.index.scores.index.get_loc(candidate_name)].tolist()
+        standings = [self.index.cohort.standing(col, score) for col, score in zip(self.index.score_cols, scores)]
+        markers = [None] * len(self.bin_labels)
+        marker_styles = ['bordered_cell'] * len(self.bin_labels)
+        for i, standing in enumerate(standings):
+            markers[i * self.bins + standing.bin] = DISTRIBUTION_MARKER
+            marker_styles[i * self.bins + standing.bin] = 'cohort_marker'
+        return {
+            'name': candidate_name,
+            'final_result': final_result,
+            'result_style': result_style_name(final_result),
+            'score': scores,
+            'overall_avg': self.overall_avg,
+            'passer_avg': self.passer_avg,
+            'rank': [standing.rank for standing in standings],
+            'percentile': [round(standing.percentile, PERCENTILE_DECIMALS) for standing in standings],
+            'bin_label': self.bin_labels,
+            'bin_count': self.bin_counts,
+            'marker': markers,
+            'marker_style': marker_styles,
+        }
+
+    def comment_values(self, candidate_name):
+        """심사위원 코멘트 행마다 채울 값"""
+        reviews = zip(self.index.reviewer_results[candidate_name], self.index.comments[candidate_name])
+        for i, (reviewer_result, comment) in enumerate(reviews):
+            result_label = "(Pass)" if reviewer_result == 'Pass' else "(Fail)"
+            yield {'reviewer_label': f"Reviewer {i+1} {result_label}", 'comment': comment}
+
+    def _apply_style(self, cell, style, values):
+        style_name = _resolve(style, values)
+        if not style_name:
+            return
+        if self.styles is None:
+            cell.style = style_name
+        else:
+            cell._style = copy(self.styles[style_name])
+
+    def _comment_merge(self, row):
+        first, last = self.template.comment_merge.split(':')
+        return f'{first}{row}:{last}{row}'
+
+    def write(self, candidate_name):
+        """표준 워크북에 후보자 시트를 추가합니다."""
+        template = self.template
+        worksheet = self.workbook.create_sheet(f'{candidate_name} 리포트')
+        for col_letter, width in template.column_widths.items():
+            worksheet.column_dimensions[col_letter].width = width
+
+        # 병합 범위의 나머지 셀은 병합할 때 만들어지므로, 시작 셀에만 값과 스타일을 씁니다.
+        values = self.values(candidate_name)
+        rows = [(row, cells, values) for row, cells in template.rows]
+        for merge in template.merges:
+            worksheet.merge_cells(merge)
+        for i, values in enumerate(self.comment_values(candidate_name)):
+            row = template.comment_row + i
+            worksheet.merge_cells(self._comment_merge(row))
+            rows.append((row, template.comment_cells, values))
+
+        for row, cells, values in rows:
+            for item in cells:
+                if item.style in MERGED_TAIL_STYLES:
+                    continue
+                cell = worksheet.cell(row=row, column=item.column, value=_resolve(item.value, values))
+                self._apply_style(cell, item.style, values)
+        return worksheet
+
+    def stream(self, candidate_name):
+        """write_only 워크북에 후보자 시트를 행 단위로 출력합니다."""
+        template = self.template
+        worksheet = self.workbook.create_sheet(f'{candidate_name} 리포트')
+        # write_only 모드에서는 컬럼 너비를 행을 쓰기 전에 지정해야 합니다.
+        for col_letter, width in template.column_widths.items():
+            worksheet.column_dimensions[col_letter].width = width
+
+        values = self.values(candidate_name)
+        last_row = 0
+        for row, cells in template.rows:
+            for _ in range(row - last_row - 1):
+                worksheet.append([])
+            worksheet.append(self._stream_cells(worksheet, cells, values))
+            last_row = row
+        for merge in template.merges:
+            worksheet.merged_cells.add(merge)
+        for i, comment in enumerate(self.comment_values(candidate_name)):
+            worksheet.append(self._stream_cells(worksheet, template.comment_cells, comment))
+            worksheet.merged_cells.add(self._comment_merge(template.comment_row + i))
+        return worksheet
+
+    def _stream_cells(self, worksheet, cells, values):
+        row = [None] * max(item.column for item in cells)
+        for item in cells:
+            cell = WriteOnlyCell(worksheet, value=_resolve(item.value, values))
+            self._apply_style(cell, item.style, values)
+            row[item.column - 1] = cell
+        return row
+
+
+def write_individual_report_sheet(workbook, candidate_name, index, report_format):
+    """표준 워크북에 선택된 양식으로 개별 후보자의 리포트 시트를 작성합니다. (여러 시트는 SheetStamper를 재사용)"""
+    return SheetStamper(workbook, index, report_format).write(candidate_name)
+
+
+def report_file_name(candidate_name, report_format):
+    """개별 후보자 리포트의 파일명을 반환합니다."""
+    return f"{candidate_name}_면접결과_{report_format}.xlsx"
+
+def generate_report_file_content(candidate_name, index, report_format, engine='openpyxl'):
+    """선택된 후보자의 상세 리포트 내용을 Excel 파일(bytes)로 생성합니다."""
+    output = io.BytesIO()
+    if engine == 'streaming':
+        workbook = Workbook(write_only=True)
+        with stage('report.build', report='candidate', engine=engine):
+            register_named_styles(workbook)
+            stream_individual_report_sheet(workbook, candidate_name, index, report_format)
+        with stage('report.serialize', report='candidate', engine=engine):
+            workbook.save(output)
+        return output.getvalue()
+    if engine != 'openpyxl':
+        raise ValueError(f"지원하지 않는 리포트 생성 방식입니다: {engine} (가능한 값: {', '.join(REPORT_ENGINES)})")
+
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    with stage('report.build', report='candidate', engine=engine):
+        write_individual_report_sheet(workbook, candidate_name, index, report_format)
+    with stage('report.serialize', report='candidate', engine=engine):
+        workbook.save(output)
+    return output.getvalue()
+
+@timed('report.summary')
+def build_overall_summary_frame(index):
+    """'전체 요약' 시트에 들어갈 후보자별 요약표를 만듭니다. (전체/합격자 평균은 집계 구조에 미리 계산되어 있음)"""
+    summary_df = pd.DataFrame({'성명': index.names, '최종 결과': index.final_results.to_numpy()})
+
+    # 후보자 점수, 전체 평균, 합격자 평균을 컬럼으로 추가
+    for col in index.score_cols:
+        summary_df[f'{col}_후보자'] = index.scores[col].to_numpy()
+        summary_df[f'{col}_전체평균'] = index.overall_avg[col]
+        summary_df[f'{col}_합격자평균'] = index.passer_avg[col]
+
+    # 심사위원별 코멘트 추가
+    comments = [index.comments[name] for name in index.names]
+    for i in range(3):
+        summary_df[f'심사위원{i+1} 코멘트'] = [c[i] if i < len(c) else 'N/A' for c in comments]
+    return summary_df
+
+def summary_column_width(col_name):
+    """'전체 요약' 시트의 컬럼 너비를 반환합니다."""
+    if '코멘트' in col_name:
+        return 40
+    elif '성명' in col_name:
+        return 15
+    return 18
+
+def generate_overall_report_file_content(index, report_format, engine='openpyxl', progress=None):
+    """
+    전체 후보자에 대한 요약 및 개별 리포트를 포함하는 Excel 파일을 생성합니다.
+    progress(완료 수, 전체 수)가 주어지면 후보자 시트를 하나 만들 때마다 호출합니다. (예외를 발생시키면 생성을 중단합니다.)
+    """
+    if engine == 'streaming':
+        return generate_overall_report_streaming(index, report_format, progress)
+    if engine != 'openpyxl':
+        raise ValueError(f"지원하지 않는 리포트 생성 방식입니다: {engine} (가능한 값: {', '.join(REPORT_ENGINES)})")
+
+    # 1. 후보자별 요약 데이터 생성
+    summary_df = build_overall_summary_frame(index)
+
+    output = io.BytesIO()
+    # 취소(progress의 예외)나 오류가 나도 writer와 워크북이 닫히도록 with 블록을 사용합니다.
+    # 표준 방식은 with 블록을 나갈 때 저장하므로, 스트리밍 방식과 같이 'report.build'에 저장 시간이 포함됩니다.
+    with stage('report.build', report='overall', engine=engine, candidates=len(index)), \
+            pd.ExcelWriter(output, engine='openpyxl') as writer:
+        # 2. '전체 요약' 시트에 데이터 쓰기
+        summary_df.to_excel(writer, sheet_name='전체 요약', index=False)
+        worksheet = writer.sheets['전체 요약']
+
+        # 3. 서식 적용
+        # 컬럼 너비 조정
+        for col_idx, col_name in enumerate(summary_df.columns, 1):
+            worksheet.column_dimensions[get_column_letter(col_idx)].width = summary_column_width(col_name)
+
+        # 테이블 전체 서식
+        register_named_styles(writer.book)
+        n_rows, n_cols = len(summary_df) + 1, len(summary_df.columns)
+        style_block(worksheet, 'table_header', 1, 1, 1, n_cols)
+        if n_rows > 1:
+            style_block(worksheet, 'bordered_cell', 2, 1, n_rows, 1)
+            style_block(worksheet, 'bordered_cell', 2, 3, n_rows, n_cols)
+
+        # 최종 결과 Pass/Fail 서식
+        for row_idx, final_result in enumerate(summary_df['최종 결과'], 2):
+            worksheet.cell(row=row_idx, column=2).style = result_style_name(final_result)
+
+        # 4. 후보자별 개별 리포트 시트 생성 (템플릿에 후보자 값만 채움)
+        stamper = SheetStamper(writer.book, index, report_format)
+        for done, name in enumerate(index.names, 1):
+            stamper.write(name)
+            if progress:
+                progress(done, len(index.names))
+    return output.getvalue()
+
+
+# --- Streaming (write_only) Engine ---
+def styled_cell(ws, value=None, style_name=None):
+    """write_only 시트에 추가할, 이름 있는 스타일이 적용된 셀을 만듭니다."""
+    cell = WriteOnlyCell(ws, value=value)
+    if style_name:
+        cell.style = style_name
+    return cell
+
+def stream_summary_sheet(workbook, index):
+    """'전체 요약' 시트를 행 단위로 출력합니다."""
+    summary_df = build_overall_summary_frame(index)
+    worksheet = workbook.create_sheet('전체 요약')
+
+    # write_only 모드에서는 컬럼 너비를 행을 쓰기 전에 지정해야 합니다.
+    for col_idx, col_name in enumerate(summary_df.columns, 1):
+        worksheet.column_dimensions[get_column_letter(col_idx)].width = summary_column_width(col_name)
+
+    worksheet.append([styled_cell(worksheet, col_name, 'table_header') for col_name in summary_df.columns])
+    for row in summary_df.itertuples(index=False):
+        cells = [styled_cell(worksheet, value, 'bordered_cell') for value in row]
+        cells[1] = styled_cell(worksheet, row[1], result_style_name(row[1]))
+        worksheet.append(cells)
+
+def stream_individual_report_sheet(workbook, candidate_name, index, report_format):
+    """write_only 워크북에 write_individual_report_sheet와 같은 배치와 서식으로 개별 후보자 리포트 시트를 출력합니다."""
+    return SheetStamper(workbook, index, report_format).stream(candidate_name)
+
+def discard_streaming_workbook(workbook):
+    """
+    생성을 중단한 write_only 워크북의 시트별 임시 파일을 정리합니다.
+    저장(save)하지 않은 시트의 임시 파일은 프로세스가 끝날 때까지 남으므로, 취소나 오류 시 바로 지웁니다.
+    """
+    for worksheet in workbook.worksheets:
+        # openpyxl은 시트별 임시 파일 정리 API를 따로 제공하지 않아 내부 writer를 사용합니다. (없는 버전에서는 건너뜀)
+        writer = getattr(worksheet, '_writer', None)
+        if writer is None:
+            continue
+        try:
+            if not worksheet.closed:
+                worksheet.close()
+            writer.cleanup()
+        except (OSError, ValueError):
+            pass
+
+def generate_overall_report_streaming(index, report_format, progress=None):
+    """
+    전체 리포트를 openpyxl write_only 모드로 생성합니다.
+    - 시트를 하나씩 행 단위로 출력하므로, 후보자 수가 많아도 전체 워크북을 메모리에 유지하지 않습니다.
+    - '전체 요약' 시트와 후보자별 시트의 배치, 병합 셀, Pass/Fail 서식은 표준 방식과 같습니다.
+    """
+    workbook = Workbook(write_only=True)
+    register_named_styles(workbook)
+    # write_only 시트는 행을 추가할 때 임시 파일로 바로 기록되므로, 'report.build'에 직렬화 시간 대부분이 포함됩니다.
+    try:
+        with stage('report.build', report='overall', engine='streaming', candidates=len(index)):
+            stream_summary_sheet(workbook, index)
+            stamper = SheetStamper(workbook, index, report_format)
+            for done, name in enumerate(index.names, 1):
+                stamper.stream(name)
+                if progress:
+                    progress(done, len(index.names))
+    except BaseException:
+        discard_streaming_workbook(workbook)
+        raise
+
+    output = io.BytesIO()
+    with stage('report.serialize', report='overall', engine='streaming', candidates=len(index)):
+        workbook.save(output)
+    return output.getvalue()
+
+
+# --- Batch Export ---
+def _build_report_files(index, report_format, engine):
+    """프로세스 풀 작업 함수. 주어진 (부분) 집계 구조의 후보자별 리포트 파일을 (파일명, bytes) 목록으로 반환합니다."""
+    return [
+        (report_file_name(name, report_format), generate_report_file_content(name, index, report_format, engine))
+        for name in index.names
+    ]
+
+def iter_individual_reports(index, report_format, engine='streaming', max_workers=None, progress=None):
+    """
+    모든 후보자의 개별 리포트를 (파일명, bytes)로 후보자 순서대로 생성합니다.
+    - 후보자를 구간으로 나누어 프로세스 풀에서 병렬로 생성하며, 각 작업에는 해당 후보자의 집계 데이터만 전달합니다.
+    - 파일명: {후보자}_면접결과_{양식}.xlsx
+    - progress(완료 수, 전체 수)가 주어지면 리포트가 만들어질 때마다 (병렬 처리 시에는 구간마다) 호출합니다.
+    - 중간에 소비를 멈추면(progress의 예외 등) 아직 시작하지 않은 병렬 작업은 취소합니다.
+    """
+    total = len(index.names)
+    workers = min(max_workers or default_workers(), total) if total else 1
+    done = 0
+
+    if workers <= 1 or total < PARALLEL_MIN_CANDIDATES:
+        for name in index.names:
+            yield report_file_name(name, report_format), generate_report_file_content(name, index, report_format, engine)
+            done += 1
+            if progress:
+                progress(done, total)
+        return
+
+    subsets = [index.subset(names) for names in chunked(index.names, workers * 4)]
+    with process_pool(workers) as executor:
+        futures = [executor.submit(_build_report_files, subset, report_format, engine) for subset in subsets]
+        try:
+            for future in futures:
+                report_files = future.result()
+                yield from report_files
+                done += len(report_files)
+                if progress:
+                    progress(done, total)
+        finally:
+            for future in futures:
+                future.cancel()
+
+def export_individual_reports_zip(index, report_format, output=None, engine='streaming', max_workers=None, progress=None):
+    """
+    모든 후보자의 개별 리포트를 ZIP 파일 하나로 묶습니다. (iter_individual_reports 참고)
+    - 생성된 파일은 완료되는 대로 ZIP에 기록합니다.
+    - output을 주면 해당 파일 객체에 쓰고, 없으면 ZIP 내용을 bytes로 반환합니다.
+    """
+    target = output if output is not None else io.BytesIO()
+
+    # xlsx는 이미 압축된 파일이므로 다시 압축하지 않습니다.
+    with stage('report.zip', engine=engine, candidates=len(index)), \
+            zipfile.ZipFile(target, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for file_name, content in iter_individual_reports(index, report_format, engine, max_workers, progress):
+            archive.writestr(file_name, content)
+
+    if output is None:
+        return target.getvalue()
@@ -0,0 +1,207 @@
+import json
+import os
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+
+import numpy as np
+
+# --- Constants ---
+# 채점 기준 파일 경로 (지정하지 않으면 DEFAULT_SCHEMA_PATH)
+SCHEMA_PATH_ENV = 'INTERVIEW_REPORT_SCORING_SCHEMA'
+DEFAULT_SCHEMA_PATH = Path(__file__).with_name('scoring_schema.json')
+# 후보자 최종 판정 규칙: 규칙 이름 -> 설명
+DECISION_RULES = {
+    'all': '모든 심사위원이 Pass',
+    'majority': '과반수 심사위원이 Pass',
+    'mean': '심사위원 판정 점수의 평균이 합격 기준 이상',
+}
+# 가중치를 지정하지 않은 항목의 가중치
+DEFAULT_ITEM_WEIGHT = 1.0
+# 채점 기준 파일에 'default_score_range'가 없을 때 항목 점수의 허용 범위 (양 끝 포함)
+DEFAULT_SCORE_RANGE = (0, 20)
+# 판정 점수(또는 합계)가 합격 기준과 이 상대 오차 안이면 기준과 같다고 봅니다. (가중 합계의 부동소수점 오차로 불합격이 되지 않도록)
+DECISION_RTOL = 1e-9
+
+
+@dataclass(frozen=True)
+class ScoringSchema:
+    """
+    시험 종류별 채점 기준입니다. (항목 -> 카테고리 매핑, 항목 가중치, 합격 기준 점수, 최종 판정 규칙)
+    - 카테고리 점수는 소속 항목 점수의 가중 합계입니다.
+    - 심사위원 판정 점수는 total_column이 있으면 파일의 해당 컬럼, 없으면(None) 모든 항목 점수의 가중 합계이며,
+      판정 점수가 pass_threshold 이상이면 그 심사위원의 결과는 Pass입니다.
+    - 카테고리 점수와 판정 점수는 점수 블록(행 x input_cols)과 가중치 행렬(matrix)의 행렬 곱 한 번으로 계산합니다.
+    """
+    name: str
+    categories: dict        # 카테고리 -> 항목 컬럼 목록 (항목은 한 카테고리에만 속함)
+    weights: dict           # 항목 컬럼 -> 가중치
+    pass_threshold: float
+    decision: str           # DECISION_RULES의 규칙 이름
+    total_column: str = '총점'
+    score_ranges: dict = None   # 항목 컬럼 -> 허용 점수 범위 (최저, 최고) (양 끝 포함, 모든 항목)
+
+    @cached_property
+    def item_cols(self):
+        return [col for cols in self.categories.values() for col in cols]
+
+    @cached_property
+    def input_cols(self):
+        """점수 블록의 컬럼 (항목 컬럼, 판정 점수 컬럼)"""
+        if self.total_column is None or self.total_column in self.item_cols:
+            return list(self.item_cols)
+        return self.item_cols + [self.total_column]
+
+    @cached_property
+    def matrix(self):
+        """input_cols x (카테고리..., 판정 점수) 가중치 행렬"""
+        matrix = np.zeros((len(self.input_cols), len(self.categories) + 1))
+        row = {col: i for i, col in enumerate(self.input_cols)}
+        for j, cols in enumerate(self.categories.values()):
+            for col in cols:
+                matrix[row[col], j] = self.weights[col]
+        if self.total_column is None:
+            matrix[:, -1] = matrix[:, :-1].sum(axis=1)
+        else:
+            matrix[row[self.total_column], -1] = 1.0
+        return matrix
+
+    def _score_block(self, df, decimals=None):
+        """
+        데이터프레임에 있는 입력 컬럼의 점수 블록과 그 컬럼의 가중치 행렬 (없는 항목은 0점으로 봄)
+        decimals가 주어지면 float64로 바꾼 점수를 반올림합니다. (float32로 저장된 점수의 표현 오차 제거)
+        """
+        present = [i for i, col in enumerate(self.input_cols) if col in df.columns]
+        block = df[[self.input_cols[i] for i in present]].to_numpy(dtype=np.float64)
+        if decimals is not None:
+            block = block.round(decimals)
+        return block, self.matrix[present]
+
+    def _meets_threshold(self, scores, targets):
+        scores = np.asarray(scores)
+        return (scores >= targets) | np.isclose(scores, targets, rtol=DECISION_RTOL, atol=0)
+
+    def has_decision_input(self, columns):
+        return self.total_column is None or self.total_column in columns
+
+    def evaluate(self, df):
+        """
+        (카테고리 점수 행렬(행 x 카테고리), 판정 점수 배열, Pass 여부 배열)을 반환합니다.
+        판정 점수 컬럼이 없으면 판정 점수와 Pass 여부는 None입니다.
+        Pass 여부는 주어진 점수 그대로(float64) 판정하므로, 점수를 float32로 줄이기 전에 호출해야 합니다.
+        """
+        block, matrix = self._score_block(df)
+        scores = block @ matrix
+        if not self.has_decision_input(df.columns):
+            return scores[:, :-1], None, None
+        decision_scores = scores[:, -1]
+        return scores[:, :-1], decision_scores, self._meets_threshold(decision_scores, self.pass_threshold)
+
+    def decision_scores(self, df, decimals=None):
+        """
+        심사위원(행)별 판정 점수 배열. 판정 점수 컬럼이 없으면 ('N/A' 결과) 0점으로 봅니다.
+        float32로 저장된 점수에는 decimals를 주어 float64로 바꾼 점수를 반올림합니다. (_score_block 참고)
+        """
+        if not self.has_decision_input(df.columns):
+            return np.zeros(len(df))
+        block, matrix = self._score_block(df, decimals)
+        return block @ matrix[:, -1]
+
+    def final_decision(self, pass_counts, counts, decision_sums):
+        """후보자별 (Pass 심사위원 수, 평가 횟수, 판정 점수 합계) 배열로 최종 Pass 여부 배열을 반환합니다."""
+        pass_counts, counts = np.asarray(pass_counts), np.asarray(counts)
+        if self.decision == 'all':
+            return pass_counts == counts
+        if self.decision == 'majority':
+            return 2 * pass_counts > counts
+        return self._meets_threshold(decision_sums, self.pass_threshold * counts)
+
+    def describe(self):
+        return f"{self.name} (합격 기준 {self.pass_threshold:g}점, 최종 판정: {DECISION_RULES[self.decision]})"
+
+
+def _invalid(path, message):
+    return ValueError(f"채점 기준 파일 '{path}'이(가) 올바르지 않습니다: {message}")
+
+
+def parse_scoring_schema(config, path='<config>'):
+    """채점 기준 설정(dict)을 검사하여 ScoringSchema로 만듭니다. 형식이 잘못되면 ValueError를 발생시킵니다."""
+    categories = config.get('categories')
+    if not isinstance(categories, dict) or not categories:
+        raise _invalid(path, "'categories'에 카테고리별 항목 컬럼 목록이 필요합니다.")
+    seen = set()
+    for category, cols in categories.items():
+        if not isinstance(cols, list) or not cols or not all(isinstance(col, str) for col in cols):
+            raise _invalid(path, f"'{category}' 카테고리의 항목 컬럼 목록이 비어 있거나 문자열이 아닙니다.")
+        duplicated = seen.intersection(cols)
+        if duplicated or len(set(cols)) != len(cols):
+            raise _invalid(path, f"항목은 한 카테고리에만 속해야 합니다: {', '.join(sorted(duplicated)) or category}")
+        seen.update(cols)
+
+    weights = config.get('weights') or {}
+    unknown = set(weights).difference(seen)
+    if unknown:
+        raise _invalid(path, f"'weights'에 카테고리에 없는 항목이 있습니다: {', '.join(sorted(unknown))}")
+    if not all(isinstance(weight, (int, float)) and not isinstance(weight, bool) for weight in weights.values()):
+        raise _invalid(path, "'weights'의 가중치는 숫자여야 합니다.")
+
+    decision = config.get('decision', 'all')
+    if decision not in DECISION_RULES:
+        raise _invalid(path, f"'decision'은 {', '.join(DECISION_RULES)} 중 하나여야 합니다. (입력값: {decision})")
+    total_column = config.get('total_column', '총점')
+    if total_column is not None and not isinstance(total_column, str):
+        raise _invalid(path, "'total_column'은 컬럼 이름이거나 null(항목 가중 합계로 판정)이어야 합니다.")
+    threshold = config.get('pass_threshold')
+    if not isinstance(threshold, (int, float)) or isinstance(threshold, bool):
+        raise _invalid(path, "'pass_threshold'에 합격 기준 점수(숫자)가 필요합니다.")
+
+    default_range = _parse_score_range(
+        path, "'default_score_range'", config.get('default_score_range', DEFAULT_SCORE_RANGE)
+    )
+    score_ranges = config.get('score_ranges') or {}
+    if not isinstance(score_ranges, dict):
+        raise _invalid(path, "'score_ranges'는 항목 컬럼 -> [최저, 최고] 점수 객체여야 합니다.")
+    unknown = set(score_ranges).difference(seen)
+    if unknown:
+        raise _invalid(path, f"'score_ranges'에 카테고리에 없는 항목이 있습니다: {', '.join(sorted(unknown))}")
+    score_ranges = {
+        col: _parse_score_range(path, f"'score_ranges'의 '{col}'", value) for col, value in score_ranges.items()
+    }
+
+    return ScoringSchema(
+        name=str(config.get('name', Path(str(path)).stem)),
+        categories={category: list(cols) for category, cols in categories.items()},
+        weights={col: float(weights.get(col, DEFAULT_ITEM_WEIGHT)) for cols in categories.values() for col in cols},
+        pass_threshold=threshold,
+        decision=decision,
+        total_column=total_column,
+        score_ranges={col: score_ranges.get(col, default_range) for cols in categories.values() for col in cols},
+    )
+
+
+def _parse_score_range(path, label, value):
+    """[최저, 최고] 점수 범위를 검사하여 (최저, 최고)로 만듭니다."""
+    if (not isinstance(value, (list, tuple)) or len(value) != 2
+            or not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in value) or value[0] > value[1]):
+        raise _invalid(path, f"{label}은(는) [최저, 최고] 점수(숫자, 최저 <= 최고)여야 합니다.")
+    return tuple(value)
+
+
+def load_scoring_schema(path):
+    """JSON 채점 기준 파일을 읽습니다."""
+    try:
+        config = json.loads(Path(path).read_text(encoding='utf-8'))
+    except (OSError, json.JSONDecodeError) as e:
+        raise _invalid(path, str(e)) from e
+    if not isinstance(config, dict):
+        raise _invalid(path, "최상위 값은 객체여야 합니다.")
+    return parse_scoring_schema(config, path)
+
+
+def load_scoring_schema_from_env():
+    """SCHEMA_PATH_ENV 환경 변수의 파일을, 지정하지 않았으면 기본 채점 기준 파일을 읽습니다."""
+    return load_scoring_schema(os.environ.get(SCHEMA_PATH_ENV) or DEFAULT_SCHEMA_PATH)
+
+
+# 프로세스 전체에서 사용하는 채점 기준 (서버/CLI를 시작할 때 한 번 읽음)
+SCORING_SCHEMA = load_scoring_schema_from_env()
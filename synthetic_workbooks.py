@@ -0,0 +1,116 @@
+import argparse
+import io
+import math
+import random
+import sys
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from ingest import EVALUATION_SHEET, HEADER_ROW_INDEX
+from processing import CATEGORY_COLS, PASS_SCORE_THRESHOLD
+from scoring import SCORING_SCHEMA
+
+# --- Constants ---
+# 한 심사위원 조(패널)가 면접하는 후보자 수. 심사위원 한 명당 파일 하나를 만듭니다.
+CANDIDATES_PER_PANEL = 100
+REVIEWERS_PER_PANEL = 3
+# 항목별 점수 범위 (항목 7개의 평균 총점이 합격 기준 근처가 되도록 설정)
+ITEM_SCORE_RANGE = (5, 15)
+# 심사위원이 '합격여부'를 총점과 다르게 적는 비율 (결과 불일치 검증용)
+MISMATCH_RATE = 0.01
+COMMENT_SENTENCES = [
+    "요구사항을 이해관계자별로 구분하여 우선순위를 정하는 과정이 체계적이었습니다.",
+    "아키텍처 결정의 근거를 품질 속성과 연결하여 설명한 점이 인상적이었습니다.",
+    "프로토타입으로 성능 리스크를 조기에 검증한 경험을 구체적으로 제시했습니다.",
+    "문서화 수준은 양호하나 의사결정 기록이 일부 누락되어 보완이 필요합니다.",
+    "팀 내 갈등 상황에서 합의를 이끌어낸 사례를 명확하게 설명했습니다.",
+    "사용한 방법론의 한계와 개선 방안에 대한 고민이 다소 부족해 보였습니다.",
+    "사업 목표 대비 성과를 정량적인 지표로 제시하여 설득력이 높았습니다.",
+    "질문 의도를 정확히 파악하고 간결하게 답변하는 커뮤니케이션 역량을 보였습니다.",
+    "레거시 시스템 전환 경험이 풍부하며 단계별 이행 전략이 현실적이었습니다.",
+    "기술 부채를 관리하기 위한 원칙과 실제 적용 사례를 균형 있게 설명했습니다.",
+]
+# 실제 양식처럼 일부 항목명에는 셀 안 줄바꿈이 들어 있습니다. (파싱 시 공백으로 변환됨)
+SCORE_ITEMS = [col for cols in CATEGORY_COLS.values() for col in cols]
+HEADER = (
+    ['No', '성명', '심사위원 성명']
+    + [item.replace(' (', '\n(') for item in SCORE_ITEMS]
+    + ['총점', '합격여부(Pass/Fail)', '총평']
+)
+
+
+def candidate_names(n_candidates):
+    return [f'후보{i:05d}' for i in range(n_candidates)]
+
+
+def _comment(rng, name):
+    sentences = rng.sample(COMMENT_SENTENCES, rng.randint(2, 6))
+    return f"{name} 후보자는 " + ' '.join(sentences)
+
+
+def build_reviewer_workbook(reviewer, candidates, seed=0, mismatch_rate=MISMATCH_RATE) -> bytes:
+    """심사위원 한 명의 평가표 파일(bytes)을 만듭니다. ('평가표' 시트, 5번째 행 헤더)"""
+    rng = random.Random(f'{seed}:{reviewer}')
+    workbook = Workbook(write_only=True)
+    guide = workbook.create_sheet('안내')
+    guide.append(["각 항목을 채점하고 '평가표' 시트에 입력해주세요."])
+
+    ws = workbook.create_sheet(EVALUATION_SHEET)
+    # 헤더 위의 제목 영역 (HEADER_ROW_INDEX개 행)
+    title_rows = [['면접 심사 평가표'], [], ['심사위원', reviewer]]
+    for row in (title_rows + [[]] * HEADER_ROW_INDEX)[:HEADER_ROW_INDEX]:
+        ws.append(row)
+    ws.append(HEADER)
+
+    for no, name in enumerate(candidates, start=1):
+        scores = [rng.randint(*ITEM_SCORE_RANGE) for _ in SCORE_ITEMS]
+        total = sum(score * SCORING_SCHEMA.weights[item] for score, item in zip(scores, SCORE_ITEMS))
+        passed = total >= PASS_SCORE_THRESHOLD
+        if rng.random() < mismatch_rate:
+            passed = not passed
+        ws.append([no, name, reviewer] + scores + [total, 'Pass' if passed else 'Fail', _comment(rng, name)])
+
+    output = io.BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+def generate_evaluation_files(n_candidates, seed=0, candidates_per_panel=CANDIDATES_PER_PANEL,
+                              reviewers_per_panel=REVIEWERS_PER_PANEL, mismatch_rate=MISMATCH_RATE):
+    """
+    n_candidates명에 대한 평가표 파일 목록을 (파일명, bytes)로 반환합니다.
+    - 후보자를 candidates_per_panel명씩 조로 나누고, 조마다 심사위원 reviewers_per_panel명이 각자 파일 하나를 제출합니다.
+    - 같은 인자와 seed로는 항상 같은 파일을 만듭니다.
+    """
+    names = candidate_names(n_candidates)
+    n_panels = max(1, math.ceil(n_candidates / candidates_per_panel))
+    files = []
+    for panel in range(n_panels):
+        panel_candidates = names[panel * candidates_per_panel:(panel + 1) * candidates_per_panel]
+        for r in range(reviewers_per_panel):
+            reviewer = f'심사위원{panel + 1:03d}-{r + 1}'
+            files.append((f'평가표_{reviewer}.xlsx', build_reviewer_workbook(reviewer, panel_candidates, seed, mismatch_rate)))
+    return files
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="벤치마크와 테스트용 가상 평가표 엑셀 파일을 생성합니다.")
+    parser.add_argument('output_dir', type=Path, help="파일을 저장할 디렉터리")
+    parser.add_argument('-n', '--candidates', type=int, default=100, help="후보자 수 (기본값: 100)")
+    parser.add_argument('--per-panel', type=int, default=CANDIDATES_PER_PANEL, help=f"심사위원 조당 후보자 수 (기본값: {CANDIDATES_PER_PANEL})")
+    parser.add_argument('--reviewers', type=int, default=REVIEWERS_PER_PANEL, help=f"조당 심사위원 수 (기본값: {REVIEWERS_PER_PANEL})")
+    parser.add_argument('--mismatch-rate', type=float, default=MISMATCH_RATE, help="합격여부를 총점과 다르게 적는 비율")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    files = generate_evaluation_files(args.candidates, args.seed, args.per_panel, args.reviewers, args.mismatch_rate)
+    for file_name, content in files:
+        (args.output_dir / file_name).write_bytes(content)
+    print(f"{args.output_dir}: 파일 {len(files)}개 (후보자 {args.candidates}명)", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,47 @@
+import io
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# 테스트가 사용자 디스크 캐시(~/.cache)를 읽거나 채우지 않도록 모듈을 불러오기 전에 끕니다.
+os.environ['INTERVIEW_REPORT_CACHE_DIR'] = ''
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from openpyxl import Workbook  # noqa: E402
+
+from ingest import EVALUATION_SHEET, HEADER_ROW_INDEX, PARSED_FILE_CACHE  # noqa: E402
+from processing import PROCESSED_FILE_CACHE  # noqa: E402
+from synthetic_workbooks import HEADER, generate_evaluation_files  # noqa: E402
+
+
+def build_workbook(rows, header=HEADER) -> bytes:
+    """header와 데이터 행(목록, 빈 목록은 빈 행)으로 '평가표' 시트 하나짜리 엑셀 파일(bytes)을 만듭니다."""
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = EVALUATION_SHEET
+    for _ in range(HEADER_ROW_INDEX):
+        worksheet.append([])
+    worksheet.append(list(header))
+    for row in rows:
+        worksheet.append(list(row))
+    output = io.BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def clear_parse_cache():
+    """테스트마다 파싱/전처리 결과 캐시를 비웁니다. (읽기 방식 비교와 채점 기준 변경이 이전 테스트의 결과를 쓰지 않도록)"""
+    PARSED_FILE_CACHE.clear()
+    PROCESSED_FILE_CACHE.clear()
+    yield
+    PARSED_FILE_CACHE.clear()
+    PROCESSED_FILE_CACHE.clear()
+
+
+@pytest.fixture(scope='session')
+def evaluation_files():
+    """후보자 12명, 심사위원 조 2개(조당 3명)의 가상 평가표 파일 6개"""
+    return generate_evaluation_files(12, seed=1, candidates_per_panel=6, mismatch_rate=0.2)
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from aggregates import RowFilterIndex, build_cohort_stats
+from dataset import build_snapshot
+from processing import load_processed_files
+
+
+def reference_standing(values, edges, score):
+    """정렬/이진 탐색 없이 모든 후보자와 비교하여 구한 순위, 백분위, 히스토그램 구간"""
+    higher = sum(value > score for value in values)
+    lower = sum(value < score for value in values)
+    tied = sum(value == score for value in values)
+    # np.histogram과 같은 구간: 마지막 구간만 오른쪽 경계를 포함합니다.
+    n_bins = len(edges) - 1
+    bin_idx = next(
+        i for i in range(n_bins) if edges[i] <= score < edges[i + 1] or (i == n_bins - 1 and score == edges[-1])
+    )
+    return higher + 1, len(values), (lower + tied / 2) / len(values) * 100, bin_idx
+
+
+@pytest.mark.parametrize('values', [
+    [70, 80, 80, 80, 90, 55.5, 80, 62],                # 동점
+    [75, 75, 75, 75],                                  # 모든 후보자가 같은 점수
+    list(range(11)),                                   # 모든 점수가 구간 경계 (0 ~ 10, 10개 구간)
+    [0, 2, 2, 5, 7.5, 10, 10],                         # 안쪽 경계와 마지막 경계에 놓인 동점
+    [42],                                              # 후보자 한 명
+])
+def test_standing_matches_brute_force(values):
+    cohort = build_cohort_stats(pd.DataFrame({'점수': values}, dtype=np.float64))
+    edges = cohort.bin_edges['점수']
+
+    for score in values:
+        standing = cohort.standing('점수', score)
+        rank, size, percentile, bin_idx = reference_standing(values, edges, score)
+        assert (standing.rank, standing.cohort_size, standing.bin) == (rank, size, bin_idx)
+        assert standing.percentile == pytest.approx(percentile)
+        # 후보자의 구간은 np.histogram이 그 점수를 세는 구간과 같습니다.
+        assert np.histogram([score], bins=edges)[0].argmax() == standing.bin
+
+    bins = [cohort.standing('점수', score).bin for score in values]
+    assert np.bincount(bins, minlength=len(edges) - 1).tolist() == cohort.bin_counts['점수'].tolist()
+
+
+def test_standing_on_interior_and_last_bin_edge():
+    cohort = build_cohort_stats(pd.DataFrame({'점수': [0.0, 3.0, 5.0, 10.0]}))
+    edges = cohort.bin_edges['점수']
+    assert edges.tolist() == [float(i) for i in range(11)]
+
+    # 안쪽 경계의 점수는 그 경계에서 시작하는 구간, 마지막 경계의 점수는 마지막 구간입니다.
+    assert cohort.standing('점수', 5.0).bin == 5
+    assert cohort.standing('점수', 10.0).bin == 9
+    assert cohort.standing('점수', 0.0).bin == 0
+    assert [cohort.standing('점수', score).rank for score in [10.0, 5.0, 3.0, 0.0]] == [1, 2, 3, 4]
+
+
+@pytest.fixture(scope='module')
+def snapshot(evaluation_files):
+    return build_snapshot(load_processed_files(evaluation_files, disk_cache=None))
+
+
+def reference_select(frame, candidates=(), reviewers=(), results=()):
+    """같은 조건을 데이터프레임 전체의 불리언 마스크로 적용한 행 위치"""
+    mask = np.ones(len(frame), dtype=bool)
+    for col, keys in (('성명', candidates), ('심사위원 성명', reviewers), ('Reviewer_Result', results)):
+        if keys:
+            mask &= frame[col].astype(object).isin(list(keys)).to_numpy()
+    return np.flatnonzero(mask)
+
+
+@pytest.mark.parametrize('filters', [
+    {},
+    {'candidates': ['후보00001']},
+    {'candidates': ['후보00001', '후보00004', '후보00002']},        # 한 조건 안의 여러 값 (합집합)
+    {'reviewers': ['심사위원001-1', '심사위원002-3'], 'results': ['Pass', 'Fail']},
+    {'candidates': ['후보00000', '후보00003'], 'results': ['Fail']},
+    {'candidates': ['없는 후보자']},                                 # 모르는 값만 있는 조건 (빈 결과)
+    {'candidates': ['없는 후보자', '후보00005'], 'reviewers': ['없는 심사위원']},
+    {'reviewers': ['없는 심사위원', '심사위원001-2'], 'results': ['N/A', 'Pass']},
+])
+def test_select_matches_boolean_mask(snapshot, filters):
+    selected = snapshot.filters.select(**filters)
+    expected = reference_select(snapshot.frame, **filters)
+    assert selected.tolist() == expected.tolist()
+
+
+def test_select_on_empty_parts():
+    filters = RowFilterIndex(n_rows=0, candidates={}, reviewers={}, results={})
+    assert filters.select().tolist() == []
+    assert filters.select(candidates=['가'], results=['Pass']).tolist() == []
+
+    filters = RowFilterIndex(
+        n_rows=4, candidates={'가': np.array([0, 2]), '나': np.array([1, 3])},
+        reviewers={'R1': np.array([0, 1]), 'R2': np.array([2, 3])}, results={},
+    )
+    assert filters.select(results=['Pass']).tolist() == []
+    assert filters.select(candidates=['가', '나'], reviewers=['R2']).tolist() == [2, 3]
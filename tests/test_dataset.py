@@ -0,0 +1,152 @@
+import numpy as np
+import pandas as pd
+
+import cli
+from conftest import build_workbook
+from dataset import EvaluationDataset, build_snapshot
+from processing import (
+    EXPECTED_EVALUATIONS, REPORT_SCORE_COLS, find_result_mismatches, load_evaluation_files, load_processed_files
+)
+from synthetic_workbooks import HEADER
+from validation import validate_evaluations
+
+
+def assert_same_snapshot(actual, expected):
+    pd.testing.assert_frame_equal(actual.frame, expected.frame)
+    pd.testing.assert_frame_equal(actual.index.scores, expected.index.scores)
+    pd.testing.assert_series_equal(actual.index.final_results, expected.index.final_results)
+    pd.testing.assert_series_equal(actual.invalid_counts, expected.invalid_counts)
+    pd.testing.assert_frame_equal(actual.mismatches, expected.mismatches)
+    pd.testing.assert_frame_equal(actual.violations, expected.violations)
+    assert actual.fingerprint == expected.fingerprint
+
+
+def full_snapshot(files):
+    return build_snapshot(load_processed_files(files, disk_cache=None))
+
+
+def assert_matches_whole_frame(snapshot, files):
+    """파일별로 더한 결과를 통합 데이터프레임 전체를 한 번에 집계/검증한 결과와 비교합니다. (모든 파일의 컬럼이 같은 경우)"""
+    frame = load_evaluation_files(files, disk_cache=None)
+    pd.testing.assert_frame_equal(snapshot.frame, frame)
+    grouped = frame.groupby('성명', observed=True)
+    expected_scores = grouped[REPORT_SCORE_COLS].mean().astype(np.float64)
+    np.testing.assert_allclose(
+        snapshot.index.scores[REPORT_SCORE_COLS].to_numpy(), expected_scores.to_numpy(), rtol=1e-6
+    )
+    assert snapshot.index.names == expected_scores.index.tolist()
+    counts = grouped.size()
+    assert snapshot.invalid_counts.to_dict() == counts[counts != EXPECTED_EVALUATIONS].to_dict()
+    pd.testing.assert_frame_equal(snapshot.mismatches, find_result_mismatches(frame))
+    pd.testing.assert_frame_equal(snapshot.violations, validate_evaluations(frame))
+
+
+def test_late_file_matches_full_reload(evaluation_files):
+    dataset = EvaluationDataset(disk_cache=None)
+    assert dataset.sync(evaluation_files[:-1]) == [name for name, _ in evaluation_files[:-1]]
+    dataset.snapshot()
+
+    assert dataset.sync(evaluation_files) == [evaluation_files[-1][0]]
+    snapshot = dataset.snapshot()
+    assert_same_snapshot(snapshot, full_snapshot(evaluation_files))
+    assert_matches_whole_frame(snapshot, evaluation_files)
+
+
+def test_sync_reports_replaced_and_removed_files(evaluation_files):
+    dataset = EvaluationDataset(disk_cache=None)
+    dataset.sync(evaluation_files)
+    assert dataset.sync(evaluation_files) == []
+
+    (first_name, _), (_, other_data) = evaluation_files[0], evaluation_files[1]
+    replaced = [(first_name, other_data)] + evaluation_files[1:-1]
+    assert dataset.sync(replaced) == [first_name, evaluation_files[-1][0]]
+    assert_same_snapshot(dataset.snapshot(), full_snapshot(replaced))
+    assert_matches_whole_frame(dataset.snapshot(), replaced)
+
+
+def test_removing_an_early_file_and_replacing_with_fewer_rows(evaluation_files):
+    dataset = EvaluationDataset(disk_cache=None)
+    dataset.sync(evaluation_files)
+
+    # 앞쪽 파일을 지우면 뒤쪽 파일의 시작 행이 당겨지므로 뒤쪽 후보자의 행 위치와 검증 결과의 행도 바뀝니다.
+    without_first = evaluation_files[1:]
+    assert dataset.sync(without_first) == [evaluation_files[0][0]]
+    assert_same_snapshot(dataset.snapshot(), full_snapshot(without_first))
+    assert_matches_whole_frame(dataset.snapshot(), without_first)
+
+    # 행 수가 다른 파일로 교체 (후보자 한 명의 한 줄만 남은 파일)
+    name = without_first[0][0]
+    shorter = [(name, build_workbook([[1, '후보00000', '심사위원X'] + [10] * 7 + [70, 'Pass', '좋음']]))]
+    replaced = shorter + without_first[1:]
+    assert dataset.sync(replaced) == [name]
+    assert_same_snapshot(dataset.snapshot(), full_snapshot(replaced))
+    assert_matches_whole_frame(dataset.snapshot(), replaced)
+    assert len(dataset) == len(dataset.snapshot().frame)
+
+
+def test_reordered_files_follow_the_upload_order(evaluation_files):
+    dataset = EvaluationDataset(disk_cache=None)
+    dataset.sync(evaluation_files)
+    reordered = evaluation_files[::-1]
+    assert dataset.sync(reordered) == []
+    assert dataset.file_names == [name for name, _ in reordered]
+    assert_same_snapshot(dataset.snapshot(), full_snapshot(reordered))
+    assert_matches_whole_frame(dataset.snapshot(), reordered)
+
+
+def test_app_and_cli_agree_when_a_file_lacks_total(tmp_path, evaluation_files):
+    header = [col for col in HEADER if col != '총점']
+    without_total = build_workbook([[1, '후보00000', '심사위원X'] + [10] * 7 + ['Pass', '좋음']], header=header)
+    files = evaluation_files[:3] + [('평가표_총점없음.xlsx', without_total)]
+
+    input_dir, output_dir = tmp_path / 'input', tmp_path / 'output'
+    input_dir.mkdir()
+    for name, data in files:
+        (input_dir / name).write_bytes(data)
+    assert cli.main([str(input_dir), '-o', str(output_dir), '--skip-individual', '-q', '-d', 'csv']) == 0
+
+    # CLI는 입력 디렉터리의 파일을 이름순으로 읽으므로 앱에도 같은 순서로 올립니다.
+    dataset = EvaluationDataset(disk_cache=None)
+    dataset.sync(sorted(files))
+    snapshot = dataset.snapshot()
+    combined = pd.read_csv(output_dir / 'interview_results_combined.csv', encoding='utf-8-sig', keep_default_na=False)
+    summary = pd.read_csv(output_dir / 'interview_overall_summary.csv', encoding='utf-8-sig')
+
+    assert combined['Reviewer_Result'].tolist() == snapshot.frame['Reviewer_Result'].astype(str).tolist()
+    assert summary['최종 결과'].tolist() == snapshot.index.final_results.tolist()
+    assert summary['성명'].tolist() == snapshot.index.names
+    # 총점 컬럼이 없는 파일의 행은 합계 검증 대상이 아닙니다.
+    lacking = snapshot.violations[snapshot.violations['file'] == '평가표_총점없음.xlsx']
+    assert 'total_mismatch' not in set(lacking['rule'].astype(str))
+
+
+def test_same_contents_under_different_names_are_different_datasets(evaluation_files):
+    renamed = [(f'다른이름_{name}', data) for name, data in evaluation_files]
+    first, second = EvaluationDataset(disk_cache=None), EvaluationDataset(disk_cache=None)
+    first.sync(evaluation_files)
+    second.sync(renamed)
+
+    assert first.fingerprint != second.fingerprint
+    frame = second.snapshot().frame
+    assert second.fingerprint == frame.attrs['fingerprint']
+    assert frame.attrs['source_files'].names == tuple(name for name, _ in renamed)
+    violations = second.snapshot().violations
+    assert not violations.empty
+    assert set(violations['file'].astype(str)) <= {name for name, _ in renamed}
+
+
+def test_fingerprint_follows_upload_order(evaluation_files):
+    forward, backward = EvaluationDataset(disk_cache=None), EvaluationDataset(disk_cache=None)
+    forward.sync(evaluation_files)
+    backward.sync(evaluation_files[::-1])
+    assert forward.fingerprint != backward.fingerprint
+
+
+def test_sessions_share_processed_files(evaluation_files):
+    first, second = EvaluationDataset(disk_cache=None), EvaluationDataset(disk_cache=None)
+    first.sync(evaluation_files)
+    second.sync(evaluation_files[:2])
+
+    # 같은 파일을 올린 두 번째 세션은 파일을 다시 전처리하지 않고 같은 데이터프레임을 함께 씁니다.
+    assert all(second._files[name].df is first._files[name].df for name in second.file_names)
+    assert_same_snapshot(second.snapshot(), full_snapshot(evaluation_files[:2]))
@@ -0,0 +1,64 @@
+import io
+
+import pandas as pd
+import pytest
+
+from exports import DATA_EXPORT_FORMATS, available_export_formats, data_export_content, write_data_export
+from processing import export_frame, load_evaluation_files
+
+READERS = {
+    'csv': lambda data: pd.read_csv(io.BytesIO(data), encoding='utf-8-sig'),
+    'parquet': lambda data: pd.read_parquet(io.BytesIO(data)),
+    'jsonl': lambda data: pd.read_json(io.BytesIO(data), lines=True),
+}
+
+
+@pytest.fixture(scope='module')
+def export_df(evaluation_files):
+    return export_frame(load_evaluation_files(evaluation_files, disk_cache=None))
+
+
+def comparable(df):
+    """형식마다 다르게 복원되는 dtype(category, 문자열, 정수/실수)을 맞춰 값만 비교합니다."""
+    df = df.reset_index(drop=True)
+    return df.apply(lambda col: col.astype(object).where(col.notna(), None) if not pd.api.types.is_numeric_dtype(col)
+                    else col.astype('float64'))
+
+
+@pytest.mark.parametrize('export_format', available_export_formats())
+def test_chunked_export_round_trips(export_format, export_df):
+    # 구간 경계가 여러 번 생기도록 작은 구간으로 나누어 기록합니다.
+    data = data_export_content(export_df, export_format, chunk_rows=7)
+    restored = READERS[export_format](data)
+
+    assert list(restored.columns) == list(export_df.columns)
+    pd.testing.assert_frame_equal(comparable(restored), comparable(export_df), check_dtype=False)
+
+
+@pytest.mark.parametrize('export_format', available_export_formats())
+def test_chunk_size_does_not_change_output(export_format, export_df):
+    if export_format == 'parquet':
+        # Parquet은 구간마다 행 그룹을 나누므로 바이트가 아니라 복원한 값을 비교합니다.
+        small = READERS[export_format](data_export_content(export_df, export_format, chunk_rows=5))
+        large = READERS[export_format](data_export_content(export_df, export_format))
+        pd.testing.assert_frame_equal(small, large)
+    else:
+        assert data_export_content(export_df, export_format, chunk_rows=5) == data_export_content(export_df, export_format)
+
+
+def test_csv_keeps_header_for_empty_frame_and_writes_bom(export_df):
+    data = data_export_content(export_df.iloc[0:0], 'csv')
+    assert data.startswith(b'\xef\xbb\xbf')
+    assert list(READERS['csv'](data).columns) == list(export_df.columns)
+
+
+def test_write_to_path_matches_bytes(export_df, tmp_path):
+    path = tmp_path / 'combined.csv'
+    write_data_export(export_df, 'csv', path)
+    assert path.read_bytes() == data_export_content(export_df, 'csv')
+
+
+def test_unknown_format_raises(export_df):
+    with pytest.raises(ValueError):
+        data_export_content(export_df, 'xml')
+    assert 'xml' not in DATA_EXPORT_FORMATS
@@ -0,0 +1,83 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+import ingest  # noqa: E402
+from frame_cache import DiskFrameCache  # noqa: E402
+from ingest import READERS, parse_evaluation_files  # noqa: E402
+from processing import load_processed_files  # noqa: E402
+
+
+@pytest.mark.parametrize('reader', READERS)
+def test_disk_cache_round_trip_matches_fresh_parse(reader, evaluation_files, tmp_path, monkeypatch):
+    fresh = parse_evaluation_files(evaluation_files, cache=None, reader=reader, disk_cache=None)
+    disk_cache = DiskFrameCache(tmp_path)
+    parse_evaluation_files(evaluation_files, cache=None, reader=reader, disk_cache=disk_cache)
+    assert len(disk_cache) == len(evaluation_files)
+
+    # 서버 재시작 후처럼 메모리 캐시 없이 디스크 캐시에서만 읽습니다. (같은 프로세스에서 파싱하면 실패)
+    def fail(*args, **kwargs):
+        raise AssertionError('디스크 캐시에 있는 파일을 다시 파싱했습니다.')
+
+    monkeypatch.setattr(ingest, 'parse_evaluation_file', fail)
+    cached = parse_evaluation_files(evaluation_files, max_workers=1, cache=None, reader=reader, disk_cache=disk_cache)
+    for expected, actual in zip(fresh, cached):
+        assert actual.error is None
+        pd.testing.assert_frame_equal(actual.df, expected.df)
+
+    # 전처리 결과도 새로 파싱한 경우와 같습니다.
+    monkeypatch.undo()
+    from_disk = load_processed_files(evaluation_files, reader=reader, disk_cache=disk_cache, cache=None)
+    from_parse = load_processed_files(evaluation_files, reader=reader, disk_cache=None, cache=None)
+    for expected, actual in zip(from_parse, from_disk):
+        pd.testing.assert_frame_equal(actual.df, expected.df)
+
+
+def frame(seed, rows=200):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({'성명': [f'후보{i:05d}' for i in range(rows)], '점수': rng.random(rows)})
+
+
+def cached_keys(cache, keys):
+    return [key for key in keys if cache._path(key).exists()]
+
+
+def test_evicts_least_recently_used_and_tracks_size(tmp_path):
+    cache = DiskFrameCache(tmp_path)
+    cache.put('a', frame(0))
+    entry_size = cache.total_bytes()
+    cache.max_bytes = entry_size * 3 + entry_size // 2
+    for key, seed in (('b', 1), ('c', 2)):
+        cache.put(key, frame(seed))
+    # 수정 시각 해상도와 관계없이 순서가 정해지도록 사용 시각을 a < b < c로 지정합니다.
+    for i, key in enumerate('abc'):
+        os.utime(cache._path(key), (1_000_000 + i, 1_000_000 + i))
+    assert (len(cache), cache.total_bytes()) == (3, entry_size * 3)
+
+    # 'a'를 읽으면 사용 시각이 갱신되므로 다음 제거 대상은 'b'입니다.
+    pd.testing.assert_frame_equal(cache.get('a'), frame(0))
+    cache.put('d', frame(3))
+    assert cached_keys(cache, 'abcd') == ['a', 'c', 'd']
+    assert cache.get('b') is None
+    assert cache.total_bytes() == entry_size * 3 <= cache.max_bytes
+
+    cache.clear()
+    assert (len(cache), cache.total_bytes()) == (0, 0)
+
+
+def test_frame_larger_than_max_bytes_is_not_cached(tmp_path):
+    cache = DiskFrameCache(tmp_path)
+    cache.put('small', frame(0))
+    small_size = cache.total_bytes()
+    cache.max_bytes = small_size * 2
+
+    cache.put('large', frame(1, rows=2000))
+    assert cache.get('large') is None
+    # 큰 파일 때문에 기존 파일이 밀려나지 않고, 임시 파일도 남지 않습니다.
+    assert cached_keys(cache, ['small', 'large']) == ['small']
+    assert cache.total_bytes() == small_size
+    assert sorted(path.suffix for path in tmp_path.iterdir()) == ['.arrow']
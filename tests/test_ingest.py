@@ -0,0 +1,48 @@
+import pandas as pd
+
+from conftest import build_workbook
+from ingest import parse_evaluation_file
+from processing import load_evaluation_files
+from validation import validate_evaluations
+
+ITEMS = [10] * 7
+
+
+def test_fast_reader_keeps_interior_blank_rows_like_pandas():
+    data = build_workbook([
+        [1, '가', '심사위원A'] + ITEMS + [70, 'Pass', '좋음'],
+        [],
+        [2, '나', '심사위원A'] + ITEMS + [70, 'Pass', None],
+        [],
+        [],
+    ])
+    fast = parse_evaluation_file(data, reader='fast')
+    slow = parse_evaluation_file(data, reader='pandas')
+
+    assert len(fast) == len(slow) == 3
+    assert fast['성명'].isna().tolist() == slow['성명'].isna().tolist() == [False, True, False]
+
+
+def test_fast_and_pandas_readers_report_same_violation_rows():
+    files = [('평가표_A.xlsx', build_workbook([
+        [1, '가', '심사위원A'] + ITEMS + [70, 'Pass', '좋음'],
+        [],
+        [2, '나', '심사위원A'] + ITEMS + [70, 'Pass', None],
+    ]))]
+    results = {}
+    for reader in ('pandas', 'fast'):
+        violations = validate_evaluations(load_evaluation_files(files, reader=reader, disk_cache=None))
+        results[reader] = violations[violations['rule'] == 'missing_comment'][['file', 'row']]
+
+    expected = pd.DataFrame({'file': ['평가표_A.xlsx'], 'row': [3]})
+    for reader, rows in results.items():
+        assert rows.astype({'file': str}).reset_index(drop=True).equals(expected), reader
+
+
+def test_fast_reader_matches_pandas_on_synthetic_files(evaluation_files):
+    for name, data in evaluation_files:
+        fast = parse_evaluation_file(data, reader='fast')
+        slow = parse_evaluation_file(data, reader='pandas')
+        assert list(fast.columns) == list(slow.columns), name
+        assert fast['성명'].tolist() == slow['성명'].tolist(), name
+        assert fast['총점'].astype(float).tolist() == slow['총점'].astype(float).tolist(), name
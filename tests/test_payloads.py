@@ -0,0 +1,55 @@
+from payloads import PayloadCache
+
+
+def test_evicts_least_recently_used_and_tracks_size():
+    cache = PayloadCache(max_bytes=10)
+    cache.put('a', b'aaa')
+    cache.put('b', b'bbb')
+    cache.put('c', b'cc')
+    assert (len(cache), cache.total_bytes) == (3, 8)
+
+    # 'a'를 읽으면 가장 최근에 사용한 항목이 되므로 다음 제거 대상은 'b'입니다.
+    assert cache.get('a') == b'aaa'
+    cache.put('d', b'dddd')
+    assert cache.get('b') is None
+    assert [key for key in ('a', 'c', 'd') if cache.get(key) is not None] == ['a', 'c', 'd']
+    assert cache.total_bytes == 9
+
+    # 같은 키를 다시 넣으면 이전 크기를 빼고 새 크기를 더합니다.
+    cache.put('c', b'c')
+    assert (len(cache), cache.total_bytes) == (3, 8)
+
+    # 한 번에 여러 항목을 제거해야 하는 경우에도 오래된 순서대로 제거합니다. ('a', 'd' 다음에 'c'가 가장 최근)
+    cache.put('e', b'eeeeeeee')
+    assert (cache.get('a'), cache.get('d'), cache.get('c')) == (None, None, b'c')
+    assert (len(cache), cache.total_bytes) == (2, 9)
+
+    cache.clear()
+    assert (len(cache), cache.total_bytes) == (0, 0)
+
+
+def test_payload_larger_than_max_bytes_is_not_cached():
+    cache = PayloadCache(max_bytes=10)
+    cache.put('small', b'12345')
+    cache.put('large', b'x' * 11)
+    assert cache.get('large') is None
+    assert cache.get('small') == b'12345'
+    assert (len(cache), cache.total_bytes) == (1, 5)
+
+    # max_bytes와 크기가 같은 파일은 다른 항목을 모두 밀어내고 캐시됩니다.
+    cache.put('exact', b'x' * 10)
+    assert cache.get('small') is None
+    assert (len(cache), cache.total_bytes) == (1, 10)
+
+    # 큰 파일도 get_or_build는 만든 결과를 그대로 반환합니다. (매번 다시 만듦)
+    builds = []
+
+    def build():
+        builds.append(1)
+        return b'y' * 20
+
+    assert cache.get_or_build('large', build) == b'y' * 20
+    assert cache.get_or_build('large', build) == b'y' * 20
+    assert len(builds) == 2
+    assert cache.get_or_build('small', lambda: b'abc') == b'abc'
+    assert cache.get_or_build('small', lambda: b'other') == b'abc'
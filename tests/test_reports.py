@@ -0,0 +1,115 @@
+import io
+import tempfile
+from copy import copy
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+import reports
+from dataset import build_snapshot
+from payloads import BuildCancelled
+from processing import load_processed_files
+from reports import (
+    REPORT_ENGINES, REPORT_FORMATS, SheetStamper, discard_streaming_workbook,
+    generate_overall_report_file_content, generate_report_file_content, result_style_name
+)
+
+
+@pytest.fixture(scope='module')
+def candidate_index(evaluation_files):
+    return build_snapshot(load_processed_files(evaluation_files, disk_cache=None)).index
+
+
+def cancel_after(n_sheets):
+    def progress(done, total):
+        if done >= n_sheets:
+            raise BuildCancelled()
+    return progress
+
+
+@pytest.mark.parametrize('engine', list(REPORT_ENGINES))
+def test_overall_report_cancel_propagates_and_cleans_up(engine, candidate_index, tmp_path, monkeypatch):
+    # write_only 시트의 임시 파일이 tmp_path에 만들어지도록 합니다.
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    with pytest.raises(BuildCancelled):
+        generate_overall_report_file_content(candidate_index, REPORT_FORMATS[0], engine, progress=cancel_after(2))
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize('engine', list(REPORT_ENGINES))
+def test_overall_report_has_summary_and_candidate_sheets(engine, candidate_index):
+    progress_calls = []
+    content = generate_overall_report_file_content(
+        candidate_index, REPORT_FORMATS[0], engine, progress=lambda done, total: progress_calls.append((done, total))
+    )
+    workbook = load_workbook(io.BytesIO(content))
+    assert workbook.sheetnames == ['전체 요약'] + [f'{name} 리포트' for name in candidate_index.names]
+    assert progress_calls[-1] == (len(candidate_index), len(candidate_index))
+
+
+def cell_styles(worksheet):
+    """셀 위치 -> (값, 스타일 이름, 글꼴, 채우기, 테두리, 정렬) (스타일 프록시는 서로 비교되지 않으므로 복사본을 비교)"""
+    return {
+        cell.coordinate: (
+            cell.value, cell.style, copy(cell.font), copy(cell.fill), copy(cell.border), copy(cell.alignment)
+        )
+        for row in worksheet.iter_rows() for cell in row
+        if cell.value is not None or cell.style != 'Normal'
+    }
+
+
+def sheet_layout(content):
+    workbook = load_workbook(io.BytesIO(content))
+    return {
+        worksheet.title: (
+            cell_styles(worksheet),
+            sorted(str(merged) for merged in worksheet.merged_cells.ranges),
+            {key: dim.width for key, dim in worksheet.column_dimensions.items() if dim.width},
+        )
+        for worksheet in workbook.worksheets
+    }
+
+
+@pytest.mark.parametrize('report_format', REPORT_FORMATS)
+@pytest.mark.parametrize('engine', list(REPORT_ENGINES))
+def test_stamper_matches_public_style_api(engine, report_format, candidate_index, monkeypatch):
+    name = candidate_index.names[0]
+    stamped = sheet_layout(generate_report_file_content(name, candidate_index, report_format, engine))
+    # openpyxl 내부 속성을 찾지 못한 경우처럼 공개 API(cell.style = 이름)로 스타일을 지정합니다.
+    monkeypatch.setattr(reports, 'named_style_arrays', lambda workbook: None)
+    expected = sheet_layout(generate_report_file_content(name, candidate_index, report_format, engine))
+    assert stamped == expected
+
+
+@pytest.mark.parametrize('report_format', REPORT_FORMATS)
+def test_standard_and_streaming_sheets_match(report_format, candidate_index):
+    name = candidate_index.names[-1]
+    standard = sheet_layout(generate_report_file_content(name, candidate_index, report_format, 'openpyxl'))
+    streaming = sheet_layout(generate_report_file_content(name, candidate_index, report_format, 'streaming'))
+    assert standard == streaming
+
+
+def test_stamped_sheet_values(candidate_index):
+    name = candidate_index.names[0]
+    workbook = load_workbook(io.BytesIO(generate_report_file_content(name, candidate_index, '상세 리포트')))
+    worksheet = workbook.active
+    assert worksheet['B1'].value == name
+    assert worksheet['B2'].value == candidate_index.final_result(name)
+    assert worksheet['B2'].style == result_style_name(candidate_index.final_result(name))
+    for i, (col, standing) in enumerate(zip(candidate_index.score_cols, candidate_index.standings(name))):
+        assert worksheet.cell(row=6 + i, column=1).value == col
+        assert worksheet.cell(row=6 + i, column=2).value == pytest.approx(candidate_index.scores.loc[name, col])
+        assert worksheet.cell(row=6 + i, column=5).value == standing.rank
+    comments = [cell.value for cell in worksheet['B'] if cell.style == 'wrapped_comment']
+    assert comments == candidate_index.comments[name]
+
+
+def test_discard_streaming_workbook_removes_temporary_files(candidate_index, tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    workbook = Workbook(write_only=True)
+    stamper = SheetStamper(workbook, candidate_index, REPORT_FORMATS[0])
+    for name in candidate_index.names[:3]:
+        stamper.stream(name)
+    assert list(tmp_path.iterdir())
+    discard_streaming_workbook(workbook)
+    assert list(tmp_path.iterdir()) == []
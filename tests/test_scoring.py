@@ -0,0 +1,133 @@
+import json
+import os
+import subprocess
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import aggregates
+import processing
+from conftest import build_workbook
+from processing import load_evaluation_files
+from scoring import SCORING_SCHEMA, parse_scoring_schema
+from synthetic_workbooks import HEADER, SCORE_ITEMS
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def row(no, name, reviewer, total, result='Pass'):
+    return [no, name, reviewer] + [10] * len(SCORE_ITEMS) + [total, result, '좋음']
+
+
+@pytest.mark.parametrize('decision', ['all', 'majority', 'mean'])
+def test_fractional_threshold_passes_score_equal_to_threshold(monkeypatch, decision):
+    schema = replace(SCORING_SCHEMA, pass_threshold=70.7, decision=decision)
+    monkeypatch.setattr(processing, 'SCORING_SCHEMA', schema)
+    monkeypatch.setattr(aggregates, 'SCORING_SCHEMA', schema)
+    files = [('A.xlsx', build_workbook([
+        row(1, '가', 'R1', 70.7), row(2, '가', 'R2', 70.7), row(3, '가', 'R3', 70.7),
+        row(4, '나', 'R1', 70.6, 'Fail'), row(5, '나', 'R2', 70.6, 'Fail'), row(6, '나', 'R3', 70.6, 'Fail'),
+    ]))]
+    all_df = load_evaluation_files(files, disk_cache=None)
+
+    assert all_df['Reviewer_Result'].astype(str).tolist() == ['Pass'] * 3 + ['Fail'] * 3
+    assert not all_df['Result_Mismatch'].any()
+    index = aggregates.build_candidate_index(all_df, processing.REPORT_SCORE_COLS)
+    assert index.final_results.to_dict() == {'가': 'Pass', '나': 'Fail'}
+
+
+def test_weighted_sum_equal_to_threshold_passes():
+    # 10.1점 3개의 float64 합계(30.299999999999997)는 기준 30.3과 같다고 봅니다.
+    schema = parse_scoring_schema({
+        'categories': {'A': ['a1', 'a2', 'a3']}, 'total_column': None, 'pass_threshold': 30.3,
+    })
+    df = pd.DataFrame({'a1': [10.1, 10.1], 'a2': [10.1, 10.1], 'a3': [10.1, 10.0999]})
+    _, decision_scores, passed = schema.evaluate(df)
+
+    assert decision_scores[0] < 30.3
+    assert passed.tolist() == [True, False]
+
+
+def reference_scores(df, schema):
+    """열마다 따로 더하는 (행렬 곱 이전의) 카테고리 점수와 판정 점수 계산"""
+    categories = {
+        category: sum(schema.weights[col] * df[col].astype('float64') for col in cols)
+        for category, cols in schema.categories.items()
+    }
+    if schema.total_column is None:
+        decision = sum(categories.values())
+    else:
+        decision = df[schema.total_column].astype('float64')
+    return pd.DataFrame(categories), decision
+
+
+@pytest.mark.parametrize('weights, total_column', [({}, '총점'), ({SCORE_ITEMS[0]: 2, SCORE_ITEMS[-1]: 0.5}, None)])
+def test_matrix_scoring_matches_per_column_sums(evaluation_files, weights, total_column):
+    schema = parse_scoring_schema({
+        'categories': SCORING_SCHEMA.categories, 'weights': weights, 'total_column': total_column,
+        'pass_threshold': 70,
+    })
+    all_df = load_evaluation_files(evaluation_files, disk_cache=None)
+    category_scores, decision_scores, passed = schema.evaluate(all_df)
+    expected_categories, expected_decision = reference_scores(all_df, schema)
+
+    np.testing.assert_allclose(category_scores, expected_categories.to_numpy())
+    np.testing.assert_allclose(decision_scores, expected_decision.to_numpy())
+    assert passed.tolist() == (expected_decision >= 70).tolist()
+    if not weights:
+        # 기본 채점 기준에서는 통합 데이터프레임의 카테고리 점수와도 같습니다.
+        np.testing.assert_allclose(all_df[list(schema.categories)].to_numpy(), expected_categories.to_numpy())
+
+
+def test_total_column_comes_from_scoring_schema(tmp_path):
+    # 판정 점수 컬럼 이름은 모듈을 불러올 때 정해지므로 다른 채점 기준은 새 프로세스에서 확인합니다.
+    schema_path = tmp_path / 'schema.json'
+    schema_path.write_text(json.dumps({
+        'categories': SCORING_SCHEMA.categories, 'total_column': '합계', 'pass_threshold': 70,
+    }, ensure_ascii=False), encoding='utf-8')
+    header = [('합계' if col == '총점' else col) for col in HEADER]
+    workbook_path = tmp_path / 'A.xlsx'
+    workbook_path.write_bytes(build_workbook([row(1, '가', 'R1', 70), row(2, '가', 'R2', 71), row(3, '가', 'R3', 60)], header))
+    script = f"""
+import json
+from processing import MISMATCH_DISPLAY_COLS, REPORT_SCORE_COLS, load_evaluation_files
+from validation import validate_evaluations
+all_df = load_evaluation_files([('A.xlsx', open({str(workbook_path)!r}, 'rb').read())], disk_cache=None)
+violations = validate_evaluations(all_df)
+print(json.dumps({{
+    'report_cols': REPORT_SCORE_COLS, 'mismatch_cols': MISMATCH_DISPLAY_COLS,
+    'results': all_df['Reviewer_Result'].astype(str).tolist(),
+    'violations': violations[['row', 'column', 'rule']].astype(str).values.tolist(),
+}}, ensure_ascii=False))
+"""
+    env = {'INTERVIEW_REPORT_SCORING_SCHEMA': str(schema_path), 'INTERVIEW_REPORT_CACHE_DIR': ''}
+    completed = subprocess.run(
+        [sys.executable, '-c', script], cwd=REPO_ROOT, env={**os.environ, **env},
+        capture_output=True, text=True, check=True,
+    )
+    output = json.loads(completed.stdout)
+
+    assert output['report_cols'] == list(SCORING_SCHEMA.categories) + ['합계']
+    assert output['mismatch_cols'] == ['성명', '심사위원 성명', '합계', '합격여부(Pass/Fail)', 'Reviewer_Result']
+    assert output['results'] == ['Pass', 'Pass', 'Fail']
+    # 항목 점수 합계(70)와 다른 '합계' 값과, 'Pass'로 적었지만 60점인 행
+    assert output['violations'] == [
+        ['2', '합계', 'total_mismatch'], ['3', '합격여부(Pass/Fail)', 'result_mismatch'], ['3', '합계', 'total_mismatch'],
+    ]
+
+
+def test_score_ranges_default_and_per_item():
+    config = {'categories': {'A': ['a1', 'a2'], 'B': ['b1']}, 'pass_threshold': 10}
+    assert parse_scoring_schema(config).score_ranges == {'a1': (0, 20), 'a2': (0, 20), 'b1': (0, 20)}
+
+    schema = parse_scoring_schema({**config, 'default_score_range': [1, 5], 'score_ranges': {'b1': [0, 10]}})
+    assert schema.score_ranges == {'a1': (1, 5), 'a2': (1, 5), 'b1': (0, 10)}
+
+    for invalid in [{'score_ranges': {'c1': [0, 10]}}, {'score_ranges': {'a1': [10, 0]}},
+                    {'default_score_range': [0]}, {'default_score_range': ['0', 10]}]:
+        with pytest.raises(ValueError):
+            parse_scoring_schema({**config, **invalid})
@@ -0,0 +1,102 @@
+import pandas as pd
+
+from conftest import build_workbook
+from processing import load_evaluation_files
+from scoring import SCORING_SCHEMA, parse_scoring_schema
+from synthetic_workbooks import SCORE_ITEMS, generate_evaluation_files
+from validation import SCORE_RANGES, VALIDATION_RULES, count_violations, has_errors, validate_evaluations
+
+
+def row(no, name, reviewer, items=None, total=None, result='Pass', comment='좋음'):
+    items = list(items) if items is not None else [10] * len(SCORE_ITEMS)
+    return [no, name, reviewer] + items + [sum(items) if total is None else total, result, comment]
+
+
+def violation_list(violations):
+    return [
+        (str(file), int(row_no), str(column), str(rule))
+        for file, row_no, column, rule in violations[['file', 'row', 'column', 'rule']].itertuples(index=False)
+    ]
+
+
+def test_each_rule_reports_file_row_and_column():
+    files = [
+        ('A.xlsx', build_workbook([
+            row(1, '가', 'R1'), row(2, '가', 'R2'), row(3, '가', 'R3'),
+            row(4, '나', 'R1', items=[25] + [10] * (len(SCORE_ITEMS) - 1)),
+            row(5, '나', 'R1'),
+            row(6, '나', 'R2', total=71),
+            row(7, '다', 'R1', result='Fail', comment=None),
+        ])),
+        ('B.xlsx', build_workbook([row(1, '라', 'R1'), row(2, '라', 'R2', comment='  '), row(3, '라', 'R3')])),
+    ]
+    violations = validate_evaluations(load_evaluation_files(files, disk_cache=None))
+
+    assert violation_list(violations) == [
+        ('A.xlsx', 4, SCORE_ITEMS[0], 'score_range'),
+        ('A.xlsx', 4, '심사위원 성명', 'duplicate_reviewer'),
+        ('A.xlsx', 5, '심사위원 성명', 'duplicate_reviewer'),
+        ('A.xlsx', 6, '총점', 'total_mismatch'),
+        ('A.xlsx', 7, '성명', 'evaluation_count'),
+        ('A.xlsx', 7, '합격여부(Pass/Fail)', 'result_mismatch'),
+        ('A.xlsx', 7, '총평', 'missing_comment'),
+        ('B.xlsx', 2, '총평', 'missing_comment'),
+    ]
+    counts = count_violations(violations)
+    assert counts.index.tolist() == [rule.name for rule in VALIDATION_RULES]
+    assert counts.to_dict() == {
+        'evaluation_count': 1, 'result_mismatch': 1, 'score_range': 1, 'total_mismatch': 1,
+        'duplicate_reviewer': 2, 'missing_comment': 2,
+    }
+    assert has_errors(violations)
+
+
+def test_clean_synthetic_files_have_no_violations():
+    files = generate_evaluation_files(12, seed=3, candidates_per_panel=6, mismatch_rate=0)
+    violations = validate_evaluations(load_evaluation_files(files, disk_cache=None))
+    assert violations.empty
+    assert not has_errors(violations)
+    assert count_violations(violations).eq(0).all()
+
+
+def test_result_mismatch_rule_matches_preprocessing_flag(evaluation_files):
+    all_df = load_evaluation_files(evaluation_files, disk_cache=None)
+    violations = validate_evaluations(all_df)
+    flagged = violations.index[violations['rule'] == 'result_mismatch']
+    assert len(flagged) > 0
+    assert flagged.tolist() == all_df.index[all_df['Result_Mismatch']].tolist()
+
+
+def test_warnings_alone_are_not_errors():
+    files = [('A.xlsx', build_workbook([row(1, '가', 'R1', comment=None), row(2, '가', 'R2'), row(3, '가', 'R3')]))]
+    violations = validate_evaluations(load_evaluation_files(files, disk_cache=None))
+    assert violation_list(violations) == [('A.xlsx', 1, '총평', 'missing_comment')]
+    assert not has_errors(violations)
+
+
+def test_frame_without_source_files_uses_index_positions():
+    all_df = load_evaluation_files(
+        [('A.xlsx', build_workbook([row(1, '가', 'R1'), row(2, '가', 'R2'), row(3, '가', 'R3', total=1)]))],
+        disk_cache=None,
+    )
+    all_df.attrs.pop('source_files')
+    violations = validate_evaluations(all_df)
+    mismatch = violations[violations['rule'] == 'total_mismatch']
+    assert mismatch['row'].tolist() == [3]
+    assert mismatch['file'].isna().all()
+    assert isinstance(violations['rule'].dtype, pd.CategoricalDtype)
+
+
+def test_score_ranges_come_from_the_scoring_schema():
+    assert SCORE_RANGES == {col: SCORING_SCHEMA.score_ranges[col] for col in SCORE_ITEMS}
+
+    # 배점이 10점인 항목(첫 항목)과 기본 범위 0~15를 지정한 채점 기준
+    schema = parse_scoring_schema({
+        'categories': SCORING_SCHEMA.categories, 'pass_threshold': 70,
+        'default_score_range': [0, 15], 'score_ranges': {SCORE_ITEMS[0]: [0, 10]},
+    })
+    items = [12, 15] + [10] * (len(SCORE_ITEMS) - 2)
+    files = [('A.xlsx', build_workbook([row(1, '가', 'R1', items=items), row(2, '가', 'R2'), row(3, '가', 'R3')]))]
+    violations = validate_evaluations(load_evaluation_files(files, disk_cache=None), score_ranges=schema.score_ranges)
+
+    assert violation_list(violations) == [('A.xlsx', 1, SCORE_ITEMS[0], 'score_range')]
@@ -0,0 +1,208 @@
+from collections import namedtuple
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from diagnostics import timed
+from processing import CATEGORY_COLS, EXPECTED_EVALUATIONS
+from scoring import SCORING_SCHEMA
+
+# --- Constants ---
+# 점수 범위를 검사하는 항목 컬럼 (판정 점수 컬럼 제외)
+ITEM_COLS = [col for cols in CATEGORY_COLS.values() for col in cols]
+# 판정 점수 컬럼(채점 기준의 total_column)과 비교하는 항목 점수 가중 합계의 가중치 (ITEM_COLS 순서)
+ITEM_WEIGHTS = np.array([SCORING_SCHEMA.weights[col] for col in ITEM_COLS])
+# 항목별 허용 점수 범위 (양 끝 포함, 채점 기준의 score_ranges/default_score_range)
+SCORE_RANGES = {col: SCORING_SCHEMA.score_ranges[col] for col in ITEM_COLS}
+# 판정 점수와 항목 점수 가중 합계를 비교할 때 허용하는 오차 (float32 점수의 반올림 오차)
+TOTAL_TOLERANCE = 1e-3
+# 검증 결과 표의 컬럼 (파일명, 파일 안 데이터 행 번호, 문제가 있는 컬럼, 규칙 이름)과 화면 표시 이름
+VIOLATION_COLUMN_LABELS = {'file': '파일', 'row': '행', 'column': '컬럼', 'rule': '검증 규칙'}
+
+# 검증 규칙
+# - name: 검증 결과 표에 기록하는 규칙 이름
+# - label: 화면과 로그에 표시하는 설명
+# - severity: 'error'(데이터 오류) 또는 'warning'(확인 권장)
+# - scope: 'row'(행 하나의 값만 보는 규칙, 파일별로 검사) 또는 'candidate'(후보자의 모든 행을 보는 규칙, 후보자별로 검사)
+# - check: _ValidationBatch를 받아 (컬럼 목록, 행 x 컬럼 bool 배열)을 반환하는 함수. 검사할 수 없으면 None
+ValidationRule = namedtuple('ValidationRule', ['name', 'label', 'severity', 'scope', 'check'])
+
+
+class _ValidationBatch:
+    """
+    한 번의 검증에서 모든 규칙이 함께 쓰는 입력입니다.
+    점수 행렬, 후보자 코드처럼 여러 규칙이 쓰는 배열은 처음 사용할 때 한 번만 만듭니다.
+    """
+
+    def __init__(self, all_df, score_ranges, expected_evaluations):
+        self.frame = all_df
+        self.score_ranges = score_ranges
+        self.expected_evaluations = expected_evaluations
+
+    def has(self, *cols):
+        return all(col in self.frame.columns for col in cols)
+
+    @cached_property
+    def item_cols(self):
+        return [col for col in ITEM_COLS if col in self.frame.columns]
+
+    @cached_property
+    def item_scores(self):
+        """항목 점수 행렬 (행 x item_cols)"""
+        return self.frame[self.item_cols].to_numpy(dtype=np.float64)
+
+    @cached_property
+    def candidate_codes(self):
+        """후보자별 정수 코드 (category 코드를 그대로 사용)"""
+        names = self.frame['성명']
+        if isinstance(names.dtype, pd.CategoricalDtype):
+            return names.cat.codes.to_numpy()
+        return pd.factorize(names)[0]
+
+
+def _check_evaluation_count(batch):
+    """평가 횟수가 기대 횟수와 다른 후보자의 모든 행"""
+    if not batch.has('성명'):
+        return None
+    codes = batch.candidate_codes
+    counts = np.bincount(codes[codes >= 0])
+    return ['성명'], (codes >= 0) & (counts[codes] != batch.expected_evaluations)
+
+
+def _check_result_mismatch(batch):
+    """원본 합격 여부가 계산 결과와 다른 행 (전처리에서 표시한 'Result_Mismatch')"""
+    if not batch.has('합격여부(Pass/Fail)', 'Result_Mismatch'):
+        return None
+    return ['합격여부(Pass/Fail)'], batch.frame['Result_Mismatch'].to_numpy(dtype=bool)
+
+
+def _check_score_range(batch):
+    """허용 범위를 벗어난 항목 점수"""
+    cols = [col for col in batch.item_cols if col in batch.score_ranges]
+    if not cols:
+        return None
+    positions = [batch.item_cols.index(col) for col in cols]
+    low = np.array([batch.score_ranges[col][0] for col in cols])
+    high = np.array([batch.score_ranges[col][1] for col in cols])
+    scores = batch.item_scores[:, positions]
+    return cols, (scores < low) | (scores > high)
+
+
+def _check_total(batch):
+    """
+    판정 점수 컬럼(채점 기준의 total_column)이 항목 점수 가중 합계와 다른 행 (모든 항목 컬럼이 있을 때만 검사)
+    채점 기준에 판정 점수 컬럼이 없거나 항목 컬럼 중 하나이면 검사하지 않습니다.
+    """
+    total_col = SCORING_SCHEMA.total_column
+    if total_col is None or total_col in ITEM_COLS:
+        return None
+    if not batch.has(total_col) or len(batch.item_cols) != len(ITEM_COLS):
+        return None
+    totals = batch.frame[total_col].to_numpy(dtype=np.float64)
+    return [total_col], np.abs(batch.item_scores @ ITEM_WEIGHTS - totals) > TOTAL_TOLERANCE
+
+
+def _check_duplicate_reviewer(batch):
+    """같은 후보자를 같은 심사위원이 두 번 이상 평가한 행 (중복된 모든 행)"""
+    if not batch.has('성명', '심사위원 성명'):
+        return None
+    reviewers = batch.frame['심사위원 성명']
+    duplicated = batch.frame.duplicated(['성명', '심사위원 성명'], keep=False).to_numpy()
+    return ['심사위원 성명'], duplicated & reviewers.notna().to_numpy()
+
+
+def _check_missing_comment(batch):
+    """'총평'이 비어 있는 행"""
+    if not batch.has('총평'):
+        return None
+    comments = batch.frame['총평']
+    text = comments if pd.api.types.is_string_dtype(comments.dtype) else comments.astype(str)
+    blank = comments.isna() | text.eq('') | text.str.isspace()
+    return ['총평'], blank.to_numpy(dtype=bool)
+
+
+VALIDATION_RULES = [
+    ValidationRule(
+        'evaluation_count', f'평가 횟수 오류 ({EXPECTED_EVALUATIONS}회가 아님)', 'error', 'candidate', _check_evaluation_count
+    ),
+    ValidationRule('result_mismatch', '합격 여부 불일치', 'error', 'row', _check_result_mismatch),
+    ValidationRule('score_range', '항목 점수 범위 초과', 'error', 'row', _check_score_range),
+    ValidationRule('total_mismatch', '판정 점수(총점)와 항목 점수 가중 합계 불일치', 'error', 'row', _check_total),
+    ValidationRule('duplicate_reviewer', '같은 심사위원의 중복 평가', 'error', 'candidate', _check_duplicate_reviewer),
+    ValidationRule('missing_comment', '총평 누락', 'warning', 'row', _check_missing_comment),
+]
+RULE_LABELS = {rule.name: rule.label for rule in VALIDATION_RULES}
+
+
+def find_violations(all_df: pd.DataFrame, rules=VALIDATION_RULES, score_ranges=SCORE_RANGES,
+                    expected_evaluations=EXPECTED_EVALUATIONS):
+    """
+    데이터프레임에 검증 규칙을 한 번에 적용하고, 위반 항목을 (행 위치 배열, 컬럼 이름 배열, 규칙 번호 배열)로 반환합니다.
+    - 규칙마다 행 반복 없이 배열 연산으로 검사하며, 여러 규칙이 쓰는 배열은 한 번만 만듭니다.
+    - 행 위치(iloc)와 규칙 번호(rules 순서) 순서로 정렬됩니다.
+    """
+    batch = _ValidationBatch(all_df, score_ranges, expected_evaluations)
+    positions, columns, rule_codes = [], [], []
+    for rule_code, rule in enumerate(rules):
+        result = rule.check(batch)
+        if result is None:
+            continue
+        cols, mask = result
+        rows, col_idx = np.nonzero(np.asarray(mask).reshape(len(all_df), len(cols)))
+        if not len(rows):
+            continue
+        positions.append(rows)
+        columns.append(np.asarray(cols, dtype=object)[col_idx])
+        rule_codes.append(np.full(len(rows), rule_code))
+
+    positions = np.concatenate(positions) if positions else np.empty(0, dtype=np.intp)
+    columns = np.concatenate(columns) if columns else np.empty(0, dtype=object)
+    rule_codes = np.concatenate(rule_codes) if rule_codes else np.empty(0, dtype=np.intp)
+    order = np.lexsort((rule_codes, positions))
+    return positions[order], columns[order], rule_codes[order]
+
+
+def violation_frame(index, files, rows, columns, rule_codes, rules=VALIDATION_RULES) -> pd.DataFrame:
+    """
+    위반 항목 배열로 검증 결과 표를 만듭니다.
+    - 'file', 'column', 'rule'은 category입니다. ('rule'의 카테고리는 적용한 전체 규칙, 'column'은 규칙 순서로 처음 나온 순서)
+    """
+    columns = np.asarray(columns, dtype=object)
+    rule_codes = np.asarray(rule_codes, dtype=np.intp)
+    return pd.DataFrame({
+        'file': pd.Categorical(files),
+        'row': np.asarray(rows, dtype=np.int64),
+        'column': pd.Categorical(columns, categories=pd.unique(columns[np.argsort(rule_codes, kind='stable')])),
+        'rule': pd.Categorical.from_codes(rule_codes, categories=[rule.name for rule in rules]),
+    }, index=index)
+
+
+@timed('validate.rules')
+def validate_evaluations(all_df: pd.DataFrame, rules=VALIDATION_RULES, score_ranges=SCORE_RANGES,
+                         expected_evaluations=EXPECTED_EVALUATIONS) -> pd.DataFrame:
+    """
+    통합 데이터프레임 전체에 검증 규칙을 적용하고, 위반 항목을 (파일, 행, 컬럼, 규칙) 표로 반환합니다. (find_violations 참고)
+    - 결과 표의 index는 통합 데이터프레임의 index이며, 통합 순서와 규칙 순서로 정렬됩니다.
+    - 파일 정보(attrs['source_files'])가 없으면 'file'은 비어 있고 'row'는 index 값 + 1입니다.
+    - 데이터셋(dataset.EvaluationDataset)은 'row' 규칙을 파일별로, 'candidate' 규칙을 후보자별로 적용하여 같은 표를 만듭니다.
+    """
+    positions, columns, rule_codes = find_violations(all_df, rules, score_ranges, expected_evaluations)
+    labels = all_df.index.to_numpy()[positions]
+    sources = all_df.attrs.get('source_files')
+    if sources is not None:
+        files, rows = sources.locate(labels)
+    else:
+        files, rows = np.full(len(labels), None, dtype=object), labels + 1
+    return violation_frame(all_df.index[positions], files, rows, columns, rule_codes, rules)
+
+
+def count_violations(violations: pd.DataFrame, rules=VALIDATION_RULES) -> pd.Series:
+    """규칙별 위반 건수를 규칙 순서대로 반환합니다. (index: 규칙 이름, 위반이 없는 규칙은 0)"""
+    return violations['rule'].value_counts(sort=False).reindex([rule.name for rule in rules], fill_value=0)
+
+
+def has_errors(violations: pd.DataFrame, rules=VALIDATION_RULES) -> bool:
+    """severity가 'error'인 규칙의 위반이 하나라도 있는지 반환합니다."""
+    error_rules = [rule.name for rule in rules if rule.severity == 'error']
+    return bool(violations['rule'].isin(error_rules).any())
@@ -0,0 +1,22 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+def default_workers():
+    """기본 작업 프로세스 수 (CPU 코어 수)를 반환합니다."""
+    return max(1, os.cpu_count() or 1)
+
+
+def process_pool(max_workers):
+    """
+    병렬 작업용 프로세스 풀을 만듭니다.
+    Streamlit 서버는 멀티스레드이므로 fork 대신 spawn으로 작업 프로세스를 띄웁니다.
+    """
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+
+
+def chunked(items, n_chunks):
+    """items를 순서를 유지한 채 최대 n_chunks개의 연속 구간으로 나눕니다."""
+    size = max(1, -(-len(items) // max(1, n_chunks)))
+    return [items[i:i + size] for i in range(0, len(items), size)]